@@ -0,0 +1,101 @@
+import threading
+import time
+
+# ---------------------------------------------------------
+# 백그라운드 작업 스레드 공용 (데이터 갱신, 저장 대기열 반영)
+# ---------------------------------------------------------
+class BackgroundWorker:
+    """데몬 스레드에서 _wait()로 기다렸다가 _step()을 반복 실행
+
+    - start()는 스레드가 없을 때만 하나 만들고, stop()은 대기 중이어도 바로 깨워 종료
+    - 실패하면 interval, 2배, 4배... 최대 max_backoff까지 간격을 늘리고 성공하면 되돌림
+    - 하위 클래스는 _step()(한 번의 작업)과 필요하면 _wait()(다음 실행까지 대기)를 구현
+    """
+
+    thread_name = "promo-worker"
+
+    def __init__(self, interval, max_backoff):
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.last_error = None
+        self.last_success = None
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def start(self):
+        """작업 스레드 시작 (이미 실행 중이면 아무것도 하지 않음)"""
+        if self.interval <= 0 or self.running:
+            return
+        with self._thread_lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def wake(self):
+        self._wake.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_once(self):
+        """_step()을 한 번 실행하고 성공/실패를 기록 (실패하면 예외를 다시 던짐)"""
+        try:
+            result = self._step()
+        except Exception as e:
+            self.failures += 1
+            self.last_error = e
+            raise
+        self.failures = 0
+        self.last_error = None
+        self.last_success = time.time()
+        return result
+
+    def next_delay(self):
+        return self.backoff(self.failures)
+
+    def backoff(self, failures):
+        """연속 실패 수에 따른 다음 시도까지의 간격"""
+        if not failures:
+            return self.interval
+        return min(self.interval * 2 ** failures, self.max_backoff)
+
+    def stats(self):
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "next_delay": self.next_delay(),
+            "failures": self.failures,
+            "last_success": self.last_success,
+            "last_error": repr(self.last_error) if self.last_error is not None else None,
+        }
+
+    def _step(self):
+        raise NotImplementedError
+
+    def _wait(self):
+        """다음 실행까지 대기 (기본: next_delay()초 또는 wake()), 멈춰야 하면 False"""
+        self._wake.wait(self.next_delay())
+        self._wake.clear()
+        return not self._stop.is_set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if not self._wait():
+                return
+            try:
+                self.run_once()
+            except Exception:
+                pass  # 실패 정보는 stats()에 남기고 간격을 늘려 재시도
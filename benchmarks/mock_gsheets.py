@@ -0,0 +1,170 @@
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from gspread.exceptions import WorksheetNotFound
+from gspread.utils import a1_to_rowcol
+
+# ---------------------------------------------------------
+# GSheetsConnection 대역 (프로세스 안의 격자 + 설정 가능한 지연)
+# ---------------------------------------------------------
+class MockStats:
+    """API 호출 수와 주고받은 칸 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = Counter()
+        self.cells_read = 0
+        self.cells_written = 0
+
+    def record(self, method, read=0, written=0):
+        with self._lock:
+            self.calls[method] += 1
+            self.cells_read += read
+            self.cells_written += written
+
+    def snapshot(self):
+        with self._lock:
+            return {"calls": dict(self.calls), "cells_read": self.cells_read, "cells_written": self.cells_written}
+
+
+class MockWorksheet:
+    """upsert_rows/apply_promotions_diff가 쓰는 gspread Worksheet 메서드만 구현"""
+
+    def __init__(self, conn, df=None):
+        self.conn = conn
+        self.spreadsheet = conn
+        self.grid = [] if df is None else _to_grid(df)
+
+    @property
+    def col_count(self):
+        return max([len(r) for r in self.grid] + [26])
+
+    def _range(self, a1):
+        first, last = (a1.split(":") + [a1])[:2]
+        (r1, c1), (r2, c2) = a1_to_rowcol(first), a1_to_rowcol(last)
+        return r1, c1, r2, c2
+
+    def _get(self, a1):
+        r1, c1, r2, c2 = self._range(a1)
+        out = []
+        for i in range(r1 - 1, min(r2, len(self.grid))):
+            row = self.grid[i][c1 - 1:c2]
+            while row and row[-1] == "":
+                row = row[:-1]
+            out.append(row)
+        while out and not out[-1]:
+            out.pop()
+        return out
+
+    def _set(self, r1, c1, values):
+        for i, row in enumerate(values):
+            while len(self.grid) < r1 + i:
+                self.grid.append([])
+            cells = self.grid[r1 - 1 + i]
+            while len(cells) < c1 - 1 + len(row):
+                cells.append("")
+            for j, v in enumerate(row):
+                cells[c1 - 1 + j] = str(v)
+
+    def batch_get(self, ranges, **kwargs):
+        result = [self._get(r) for r in ranges]
+        self.conn._call("batch_get", read=sum(len(row) for block in result for row in block))
+        return result
+
+    def batch_update(self, data, **kwargs):
+        for d in data:
+            r1, c1, _, _ = self._range(d["range"])
+            self._set(r1, c1, d["values"])
+        self.conn._call("batch_update", written=sum(len(row) for d in data for row in d["values"]))
+
+    def update(self, range_name=None, values=None, **kwargs):
+        r1, c1 = a1_to_rowcol(range_name.split(":")[0])
+        self._set(r1, c1, values)
+        self.conn._call("update", written=sum(len(row) for row in values))
+
+    def append_rows(self, values, **kwargs):
+        end = len(self.grid)
+        while end and not any(self.grid[end - 1]):
+            end -= 1
+        self.grid[end:end] = [[str(v) for v in row] for row in values]
+        self.conn._call("append_rows", written=sum(len(row) for row in values))
+
+    def delete_rows(self, start, end=None):
+        del self.grid[start - 1:(end or start)]
+        self.conn._call("delete_rows")
+
+    def add_cols(self, cols):
+        self.conn._call("add_cols")
+
+    def delete_columns(self, start, end=None):
+        for row in self.grid:
+            del row[start - 1:(end or start)]
+        self.conn._call("delete_columns")
+
+    def to_frame(self):
+        if not self.grid:
+            return pd.DataFrame()
+        header = self.grid[0]
+        rows = [r + [""] * (len(header) - len(r)) for r in self.grid[1:]]
+        return pd.DataFrame(rows, columns=header).replace("", np.nan)
+
+
+class _MockClient:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def _select_worksheet(self, worksheet=None, **kwargs):
+        if worksheet not in self.conn.worksheets:
+            raise WorksheetNotFound(worksheet)
+        return self.conn.worksheets[worksheet]
+
+
+class MockGSheetsConnection:
+    """st.connection("gsheets") 대신 GSheetsBackend(conn=...)에 넘기는 대역
+
+    latency: API 호출 한 번의 왕복 시간(초), per_cell: 주고받은 칸당 추가 시간(초)
+    """
+
+    def __init__(self, sheets=None, latency=0.0, per_cell=0.0):
+        self.latency = latency
+        self.per_cell = per_cell
+        self.stats = MockStats()
+        self.worksheets = {name: MockWorksheet(self, df) for name, df in (sheets or {}).items()}
+        self.client = _MockClient(self)
+
+    def read(self, worksheet=None, ttl=None, **kwargs):
+        if worksheet not in self.worksheets:
+            raise WorksheetNotFound(worksheet)
+        df = self.worksheets[worksheet].to_frame()
+        self._call("read", read=df.size + len(df.columns))
+        return df
+
+    def update(self, worksheet=None, data=None, **kwargs):
+        self.worksheets.setdefault(worksheet, MockWorksheet(self)).grid = _to_grid(data)
+        self._call("update", written=data.size + len(data.columns))
+
+    def create(self, worksheet=None, data=None, **kwargs):
+        self.worksheets[worksheet] = MockWorksheet(self, data)
+        self._call("create", written=data.size + len(data.columns))
+
+    def del_worksheet(self, ws):
+        # 워크시트의 spreadsheet 속성이 이 연결을 가리키므로 Spreadsheet.del_worksheet 역할도 함
+        self.worksheets = {name: w for name, w in self.worksheets.items() if w is not ws}
+        self._call("del_worksheet")
+
+    def _call(self, method, read=0, written=0):
+        self.stats.record(method, read, written)
+        delay = self.latency + (read + written) * self.per_cell
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _to_grid(df):
+    values = df.astype(object).where(df.notna(), "").to_numpy().tolist()
+    return [[str(c) for c in df.columns]] + [[str(v) for v in row] for row in values]
@@ -0,0 +1,247 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 앱 설정은 import 시점에 읽으므로 먼저 지정 (백그라운드 갱신 끔, 내보내기 파일은 임시 폴더)
+os.environ["PROMO_STORAGE"] = "gsheets"
+os.environ["PROMO_REFRESH_SECONDS"] = "0"
+os.environ.setdefault("PROMO_CACHE_TTL", "3600")
+os.environ.setdefault("PROMO_EXPORT_DIR", os.path.join(tempfile.gettempdir(), "promo-bench-exports"))
+# 저장은 시트 반영 비용을 재도록 바로 반영 (PROMO_WRITE_BEHIND=1이면 대기열 기록 시간만 측정)
+os.environ.setdefault("PROMO_WRITE_BEHIND", "0")
+os.environ.setdefault("PROMO_WRITE_QUEUE_PATH", os.path.join(tempfile.gettempdir(), "promo-bench-queue.sqlite3"))
+os.environ.setdefault("PROMO_ROLLUP_PATH", os.path.join(tempfile.gettempdir(), "promo-bench-rollups.sqlite3"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import streamlit  # noqa: E402
+import streamlit.config  # noqa: E402
+import streamlit.logger  # noqa: E402
+
+from benchmarks.mock_gsheets import MockGSheetsConnection  # noqa: E402
+from benchmarks.synthetic import make_promotions, make_reports, report_entry  # noqa: E402
+from data import load_promotions, load_weekly_reports, save_promotions, save_weekly_report_entry  # noqa: E402
+from data_cache import sheet_cache  # noqa: E402
+from draft import PromotionDraft  # noqa: E402
+from filter_index import FilterIndex, get_filter_index  # noqa: E402
+from storage import GSheetsBackend, set_storage  # noqa: E402
+
+# ---------------------------------------------------------
+# 벤치마크 실행기
+#   python -m benchmarks.run --repeat 5 --latency-ms 150
+#   python -m benchmarks.run --compare benchmarks/results/이전결과.json
+# ---------------------------------------------------------
+PAGES = {"dashboard": "views/dashboard.py", "timeline": "views/timeline.py", "weekly": "views/weekly.py", "admin": "views/admin.py"}
+LOGIN_PASSWORD = "dk2026"
+ADMIN_PASSWORD = "diageorcg"
+
+
+class Bench:
+    """이름별 실행 시간(ms)과 마지막 실행의 API 호출/전송량을 모음"""
+
+    def __init__(self, conn, repeat):
+        self.conn = conn
+        self.repeat = repeat
+        self.results = {}
+
+    def run(self, name, fn, setup=None, repeat=None):
+        runs = []
+        for i in range(repeat or self.repeat):
+            if setup is not None:
+                setup()
+            self.conn.stats.reset()
+            started = time.perf_counter()
+            fn(i)
+            runs.append((time.perf_counter() - started) * 1000)
+        self.results[name] = {
+            "runs_ms": [round(r, 3) for r in runs],
+            "min_ms": round(min(runs), 3),
+            "median_ms": round(statistics.median(runs), 3),
+            "mean_ms": round(statistics.fmean(runs), 3),
+            "api": self.conn.stats.snapshot(),
+        }
+        print(f"{name:<40} median {statistics.median(runs):10.2f} ms   min {min(runs):10.2f} ms   api {self.results[name]['api']['calls']}")
+
+
+def cold():
+    sheet_cache.clear()
+
+
+def bench_loads(bench, week, person):
+    bench.run("load_promotions.cold", lambda i: load_promotions(), setup=cold)
+    bench.run("load_promotions.warm", lambda i: load_promotions())
+    bench.run("load_weekly_reports.cold", lambda i: load_weekly_reports(week_start=week), setup=cold)
+    bench.run("load_weekly_reports.warm", lambda i: load_weekly_reports(week_start=week))
+    bench.run("load_weekly_reports.warm_assignee", lambda i: load_weekly_reports(week_start=week, assignee=person))
+
+
+def bench_saves(bench, weeks, people):
+    rng = np.random.default_rng(1)
+
+    def save_report(i):
+        entry = report_entry(rng.choice(weeks), rng.choice(people), rows=int(rng.integers(2, 8)), seed=i)
+        assert save_weekly_report_entry(entry)
+
+    bench.run("save_weekly_report_entry", save_report)
+
+    state = {}
+
+    def edit_draft():
+        draft = PromotionDraft(load_promotions())
+        labels = rng.choice(draft.base.index.to_numpy(), 10, replace=False)
+        for label in labels:
+            draft.set_cell(label, "진척율", int(rng.integers(0, 101)))
+        state["draft"] = draft
+
+    def save_diff(i):
+        draft = state["draft"]
+        assert save_promotions(draft.frame(), base=draft.base, diff=draft.diff())
+
+    bench.run("save_promotions.diff_10_cells", save_diff, setup=edit_draft)
+    bench.run("save_promotions.full", lambda i: save_promotions(load_promotions()))
+
+
+def bench_dashboard(bench):
+    df = load_promotions()
+    bench.run("dashboard.filter_index_build", lambda i: FilterIndex(df))
+    index = get_filter_index(df)
+    people = index.options("담당자", index.all_rows())[:3]
+
+    def filter_loop(i):
+        # 대시보드와 같은 순서: 컬럼마다 선택지 계산 → 선택값 AND → 탭별 건수/행
+        selections = {"상태": ["진행중", "대기"], "담당자": people}
+        mask = index.all_rows()
+        for col in index.columns:
+            index.options(col, mask)
+            if col in selections:
+                mask = mask & index.match(col, selections[col])
+        done = index.match("상태", ["완료"])
+        for bits in (index.exclude(mask, done), mask & done, mask):
+            index.count(bits)
+            index.take(bits)
+
+    bench.run("dashboard.filter_loop", filter_loop)
+
+
+def bench_pages(bench, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+    bench.run("page.login.open", lambda i: at.run(), repeat=1)
+    at.text_input[0].input(LOGIN_PASSWORD)
+    at.button[0].click()
+    at.run()
+    for slug, path in PAGES.items():
+        def first(i, path=path):
+            at.switch_page(path)
+            at.run()
+            if path == PAGES["admin"] and at.title and at.title[0].value == "⚙️ 관리자 인증":
+                at.text_input[0].input(ADMIN_PASSWORD)
+                at.button[0].click()
+                at.run()
+            if at.exception:
+                raise RuntimeError(at.exception[0].message)
+
+        bench.run(f"page.{slug}.open", first, setup=cold, repeat=1)
+        bench.run(f"page.{slug}.rerun", lambda i: at.run())
+
+
+def git_revision():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def compare(results, path):
+    with open(path, encoding="utf-8") as f:
+        previous = json.load(f)["results"]
+    print(f"\n비교 기준: {path}")
+    for name, r in results.items():
+        if name in previous:
+            ratio = r["median_ms"] / max(previous[name]["median_ms"], 1e-9)
+            flag = "  ▲ 느려짐" if ratio > 1.2 else "  ▼ 빨라짐" if ratio < 0.8 else ""
+            print(f"{name:<40} {previous[name]['median_ms']:10.2f} → {r['median_ms']:10.2f} ms  (x{ratio:.2f}){flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로모션 대시보드 벤치마크 (가짜 데이터 + GSheetsConnection 대역)")
+    parser.add_argument("--promotions", type=int, default=10000, help="프로모션 행 수")
+    parser.add_argument("--extra-cols", type=int, default=4, help="프로모션 동적 컬럼 수")
+    parser.add_argument("--people", type=int, default=200, help="주간 보고 작성자 수")
+    parser.add_argument("--weeks", type=int, default=156, help="주간 보고 주 수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="시트 API 호출당 지연")
+    parser.add_argument("--per-cell-us", type=float, default=0.0, help="주고받은 칸당 추가 지연")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--partitioned", action="store_true", help="주간 보고를 분기별 워크시트로 나눈 상태로 측정")
+    parser.add_argument("--skip-pages", action="store_true", help="AppTest 페이지 실행 생략")
+    parser.add_argument("--page-timeout", type=float, default=300)
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--compare", help="이전 결과 JSON과 중앙값 비교")
+    args = parser.parse_args(argv)
+
+
+    # 스크립트 실행 모드/지원 중단 경고 생략 (AppTest가 설정을 다시 읽으므로 설정값도 함께 변경)
+    streamlit.config.set_option("logger.level", "error")
+    streamlit.logger.set_log_level("error")
+
+    print("데이터 생성 중...")
+    promotions = make_promotions(args.promotions, people=min(args.people, 60), extra_cols=args.extra_cols)
+    reports = make_reports(people=args.people, weeks=args.weeks)
+    conn = MockGSheetsConnection(
+        {"promotions": promotions, "weekly_reports": reports},
+        latency=args.latency_ms / 1000, per_cell=args.per_cell_us / 1e6,
+    )
+    storage = GSheetsBackend(conn=conn)
+    set_storage(storage)
+    if args.partitioned:
+        storage.partition_reports()
+    print(f"promotions {promotions.shape}, weekly_reports {reports.shape}\n")
+
+    weeks = sorted(reports["Week_Start"].unique())
+    people = sorted(reports["Assignee"].unique())
+    bench = Bench(conn, args.repeat)
+    bench_loads(bench, weeks[-1], people[0])
+    bench_saves(bench, weeks, people)
+    bench_dashboard(bench)
+    if not args.skip_pages:
+        bench_pages(bench, args.page_timeout)
+
+    commit, dirty = git_revision()
+    output = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "streamlit": streamlit.__version__,
+            "rows": {"promotions": len(promotions), "weekly_reports": len(reports)},
+            "args": vars(args),
+        },
+        "results": bench.results,
+    }
+    out = args.out or os.path.join(
+        ROOT, "benchmarks", "results", f"{datetime.datetime.now():%Y%m%d-%H%M%S}-{commit or 'nogit'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {out}")
+    if args.compare:
+        compare(bench.results, args.compare)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,68 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from schema import PROMOTION_CHANNELS, PROMOTION_STATUSES, REPORT_STATUSES, REPORT_TYPES
+
+# ---------------------------------------------------------
+# 벤치마크용 가짜 데이터 (시트에서 읽은 것과 같은 문자열 형태)
+# ---------------------------------------------------------
+WORDS = ["신제품", "매장", "행사", "시음회", "리뉴얼", "캠페인", "입점", "프로모션", "재고", "진열", "협의", "정산", "리포트", "점검"]
+
+
+def _phrases(rng, n, min_words=3, max_words=8):
+    counts = rng.integers(min_words, max_words + 1, n)
+    words = rng.choice(WORDS, counts.sum())
+    bounds = np.cumsum(counts)[:-1]
+    return [" ".join(ws) for ws in np.split(words, bounds)]
+
+
+def make_promotions(rows=10000, people=60, extra_cols=4, seed=0):
+    """프로모션 시트 (진척율은 '50%' 문자열, 날짜는 'YYYY-MM-DD', 동적 컬럼 extra_cols개)"""
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 3 * 365, rows), unit="D")
+    end = start + pd.to_timedelta(rng.integers(7, 120, rows), unit="D")
+    df = pd.DataFrame({
+        "프로모션명": [f"PR-{i:06d} {p}" for i, p in enumerate(_phrases(rng, rows, 1, 3))],
+        "채널": rng.choice(PROMOTION_CHANNELS, rows),
+        "담당자": rng.choice([f"담당자{i:03d}" for i in range(people)], rows),
+        "상태": rng.choice(PROMOTION_STATUSES, rows, p=[0.1, 0.15, 0.35, 0.35, 0.05]),
+        "진척율": [f"{v}%" for v in rng.integers(0, 101, rows)],
+        "시작일": start.strftime("%Y-%m-%d"),
+        "종료일": end.strftime("%Y-%m-%d"),
+    })
+    for i in range(extra_cols):
+        df[f"비고{i + 1}"] = rng.choice(["-", "확인 필요", "예산 승인", "본사 요청", "지역 행사"], rows)
+    return df
+
+
+def make_reports(people=200, weeks=156, per_report=(2, 10), seed=0, first_week=datetime.date(2023, 1, 2)):
+    """주간 보고 시트 (people명 × weeks주, 보고서마다 per_report 범위의 행 수)"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"담당자{i:03d}" for i in range(people)])
+    week_starts = np.array([str(first_week + datetime.timedelta(weeks=w)) for w in range(weeks)])
+    counts = rng.integers(per_report[0], per_report[1] + 1, people * weeks)
+    rows = int(counts.sum())
+    report = np.repeat(np.arange(people * weeks), counts)
+    return pd.DataFrame({
+        "Week_Start": week_starts[report // people],
+        "Assignee": names[report % people],
+        "Type": rng.choice(REPORT_TYPES, rows, p=[0.5, 0.4, 0.1]),
+        "Project": np.where(rng.random(rows) < 0.3, "-", rng.choice([f"PR-{i:06d}" for i in range(500)], rows)),
+        "Content": _phrases(rng, rows),
+        "Status": rng.choice(REPORT_STATUSES, rows, p=[0.85, 0.12, 0.03]),
+    })
+
+
+def report_entry(week_start, assignee, rows=5, seed=0):
+    """save_weekly_report_entry에 넘길 한 사람의 한 주 보고서"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Week_Start": str(week_start),
+        "Assignee": assignee,
+        "Type": rng.choice(REPORT_TYPES, rows),
+        "Project": "-",
+        "Content": _phrases(rng, rows),
+        "Status": "정상",
+    })
@@ -0,0 +1,223 @@
+import datetime
+
+import pandas as pd
+import streamlit as st
+
+from data_cache import sheet_cache
+from data_service import get_data_service
+from frame_diff import diff_frames
+from report_search import get_report_search
+from rollups import get_rollups
+from schema import conform_promotions
+from settings import REPORT_KEEP_QUARTERS, WRITE_BEHIND
+from storage import REPORT_COLUMNS, ConcurrentModificationError, MissingArchiveError, get_storage
+from write_queue import PROMOTIONS_KEY, get_write_queue
+
+# ---------------------------------------------------------
+# [핵심] 데이터 로드/저장 함수 (저장소 종류와 무관)
+#   저장은 대기열(로컬 저널)에 기록하고 바로 반환, 반영 전까지는 조회 결과에 저장한 내용을 덧씌움
+#   대시보드 집계도 덧씌운 내용 기준으로 바로 반영, 반영에 실패한 저장은 대기열이 저장소 기준으로 되돌림
+# ---------------------------------------------------------
+def load_promotions():
+    """프로모션 데이터 로드 (공유 스냅샷)"""
+    try:
+        df = get_data_service().promotions()
+        if WRITE_BEHIND:
+            # 대기 항목의 view는 revision마다 같은 객체라 캐시에 등록해 두면 인덱스/집계 확인도 한 번만
+            df = sheet_cache.adopt(get_write_queue().overlay_promotions(df))
+        if df.empty: return create_default_promotions()
+        return df
+    except Exception:
+        return create_default_promotions()
+
+def save_promotions(df, base=None, diff=None):
+    """프로모션 데이터 저장 (base 스냅샷을 주면 바뀐 행/칸/컬럼만 반영)"""
+    storage = get_storage()
+    try:
+        before = load_promotions() if base is None else base
+        if WRITE_BEHIND:
+            get_write_queue().enqueue_promotions(before, df)
+        elif base is None:
+            storage.write_promotions(df)
+        else:
+            diff = diff if diff is not None else diff_frames(base, df)
+            storage.apply_promotions_diff(base, diff, df)
+        _update_rollups(lambda rollups: rollups.apply_promotions(before, df, diff))
+        st.session_state.promotions = load_promotions()
+        _warn_sync_error(storage)
+        return True
+    except ConcurrentModificationError:
+        st.error("편집을 시작한 뒤 다른 곳에서 데이터가 변경되었습니다. '최신 데이터 불러오기' 후 다시 수정해주세요.")
+        return False
+    except Exception as e:
+        st.error(f"데이터 저장 실패: {e}")
+        return False
+
+def load_weekly_reports(week_start=None, assignee=None):
+    """주간 보고 로드 (주차/작성자 조건은 저장소 인덱스로 조회)"""
+    try:
+        df = get_data_service().reports(week_start=week_start, assignee=assignee)
+        df = _with_pending_reports(df, lambda key: (week_start is None or key[0] == str(week_start))
+                                   and (assignee is None or key[1] == str(assignee)))
+        if df.empty: return create_empty_report_df()
+        return df
+    except MissingArchiveError as e:
+        _error_missing_archive(e)
+        return create_empty_report_df()
+    except:
+        return create_empty_report_df()
+
+def load_weekly_reports_range(week_from, week_to):
+    """기간(주 시작일 기준) 내 주간 보고 로드"""
+    try:
+        df = get_storage().read_reports_range(week_from, week_to)
+        return _with_pending_reports(df, lambda key: str(week_from) <= key[0] <= str(week_to))
+    except MissingArchiveError as e:
+        _error_missing_archive(e)
+        return create_empty_report_df()
+    except Exception:
+        return create_empty_report_df()
+
+def _with_pending_reports(df, match):
+    return get_write_queue().overlay_reports(df, match) if WRITE_BEHIND else df
+
+def save_weekly_report_entry(new_data_df):
+    """주간 업무 저장 ((Week_Start, Assignee) 단위로 해당 행만 upsert)"""
+    if new_data_df.empty:
+        return True
+    key = (str(new_data_df['Week_Start'].iloc[0]), new_data_df['Assignee'].iloc[0])
+    storage = get_storage()
+    try:
+        if WRITE_BEHIND:
+            get_write_queue().enqueue_report(key, new_data_df)
+        else:
+            storage.upsert_reports(key, new_data_df)
+            _warn_sync_error(storage)
+        get_report_search().update(key, new_data_df)
+        _update_rollups(lambda rollups: rollups.apply_report(key, new_data_df))
+        return True
+    except ConcurrentModificationError:
+        st.error("다른 사용자가 동시에 보고서를 수정했습니다. 잠시 후 다시 저장해주세요.")
+        return False
+    except Exception as e:
+        st.error(f"리포트 저장 실패: {e}")
+        return False
+
+def search_weekly_reports(query, **filters):
+    """주간 보고 전문 검색 (filters: assignees, week_from, week_to, types, statuses), 실패 시 빈 결과"""
+    try:
+        return get_report_search().search(query, **filters)
+    except Exception as e:
+        st.error(f"검색 실패: {e}")
+        return pd.DataFrame()
+
+def write_status(kind="promotions", key=PROMOTIONS_KEY):
+    """저장 요청의 반영 상태 (kind: "promotions" 또는 "report"와 (Week_Start, Assignee)), 기록이 없으면 None"""
+    if not WRITE_BEHIND:
+        return None
+    return get_write_queue().status(kind, key)
+
+def write_entry_status(entry_id):
+    """저장 대기열 항목 하나의 상태 (write_status()의 id), 기록이 없으면 None"""
+    if not WRITE_BEHIND:
+        return None
+    return get_write_queue().entry_status(entry_id)
+
+def load_report_partitions():
+    """주간 보고 분기 파티션 목록 ((분기별로 나눴는지, 목록 DataFrame 또는 None)), 실패 시 None"""
+    try:
+        index = get_storage().partition_index()
+        return (False, None) if index is None else (True, index.to_frame())
+    except Exception as e:
+        st.error(f"분기 목록 로드 실패: {e}")
+        return None
+
+def partition_weekly_reports():
+    """단일 주간 보고 시트를 분기별로 나눔 (나눈 분기 목록, 실패 시 None)"""
+    try:
+        return get_storage().partition_reports()
+    except Exception as e:
+        st.error(f"분기 분할 실패: {e}")
+        return None
+
+def archive_weekly_reports(keep_quarters=REPORT_KEEP_QUARTERS):
+    """최근 keep_quarters개 분기보다 오래된 주간 보고를 압축 보관 (보관한 분기 목록, 실패 시 None)"""
+    try:
+        return get_storage().archive_reports(keep_quarters)
+    except Exception as e:
+        st.error(f"보관 실패: {e}")
+        return None
+
+def load_promotion_metrics(df, index):
+    """대시보드 핵심 지표 (집계표 기준, 원본과 다르면 이번 주 스냅샷을 다시 만듦), 실패 시 None
+
+    원본과의 비교는 데이터 버전당 한 번 (index는 같은 df의 FilterIndex)
+    """
+    try:
+        rollups = get_rollups()
+        sheet_cache.derive(df, "rollups_checked", lambda d: rollups.reconcile(d, index))
+        return rollups.metrics()
+    except Exception:
+        return None
+
+def load_trends(week_from, week_to):
+    """대시보드 추이 차트용 주별 집계 (상태별/채널별 건수, 평균 진척율, 담당자별 지연·중단 보고), 실패 시 None"""
+    try:
+        rollups = get_rollups()
+        if not rollups.reports_built():
+            rollups.rebuild_reports(_all_reports())  # 처음 한 번만 전체 보고서로 만듦
+        return {
+            "status": rollups.promotion_trend(week_from, week_to, by="status"),
+            "channel": rollups.promotion_trend(week_from, week_to, by="channel"),
+            "progress": rollups.progress_trend(week_from, week_to),
+            "issues": rollups.report_counts(week_from, week_to, statuses=["지연", "중단"]),
+        }
+    except Exception as e:
+        st.error(f"추이 집계 로드 실패: {e}")
+        return None
+
+def load_progress_history(name, week_from, week_to):
+    """프로모션 하나의 주별 진척율, 실패 시 None"""
+    try:
+        return get_rollups().progress_history(name, week_from, week_to)
+    except Exception as e:
+        st.error(f"진척율 추이 로드 실패: {e}")
+        return None
+
+def rebuild_rollups():
+    """집계표를 현재 원본으로 다시 만듦 (시트를 직접 수정한 뒤 사용), 성공 여부 반환"""
+    try:
+        rollups = get_rollups()
+        rollups.snapshot_promotions(load_promotions())
+        rollups.rebuild_reports(_all_reports())
+        return True
+    except Exception as e:
+        st.error(f"집계 다시 만들기 실패: {e}")
+        return False
+
+def _all_reports():
+    return _with_pending_reports(get_data_service().reports(), lambda key: True)
+
+def _update_rollups(apply):
+    """저장 후 집계 반영 (실패해도 저장은 성공, 다음 대시보드 조회 때 원본과 비교해 다시 만듦)"""
+    try:
+        apply(get_rollups())
+    except Exception as e:
+        st.warning(f"저장되었지만 대시보드 집계 갱신에 실패했습니다: {e}")
+
+def _error_missing_archive(e):
+    st.error(f"보관된 주간 보고를 읽지 못해 결과가 비어 있습니다: {e}")
+
+def _warn_sync_error(storage):
+    err = getattr(storage, "last_sync_error", None)
+    if err is not None:
+        st.warning(f"로컬에는 저장되었지만 구글 시트 동기화에 실패했습니다: {err}")
+
+# 기본 데이터 생성 함수들
+def create_default_promotions():
+    return conform_promotions(pd.DataFrame([
+        {"프로모션명": "샘플 프로모션", "채널": "On Trade", "담당자": "관리자", "상태": "진행중", "진척율": 50, "시작일": datetime.date.today(), "종료일": datetime.date.today()}
+    ]))
+
+def create_empty_report_df():
+    return pd.DataFrame(columns=REPORT_COLUMNS)
@@ -0,0 +1,198 @@
+import threading
+import time
+from collections import OrderedDict
+
+import settings
+
+# ---------------------------------------------------------
+# 워크시트 읽기 캐시 (프로세스 전체 공유)
+# ---------------------------------------------------------
+class _Entry:
+    __slots__ = ("df", "nbytes", "loaded_at", "derived")
+
+    def __init__(self, df, nbytes, loaded_at, derived=None):
+        self.df = df
+        self.nbytes = nbytes
+        self.loaded_at = loaded_at
+        self.derived = dict(derived or {})
+
+
+class SheetCache:
+    """(워크시트, 데이터 버전) 단위로 파싱된 DataFrame을 공유하는 LRU 캐시
+
+    - 저장 함수가 invalidate()로 버전을 올리면 이전 버전은 더 이상 조회되지 않음
+    - 항목 수/메모리 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - TTL이 지난 항목은 다시 읽되, 읽기에 실패하면 지난 데이터를 계속 사용
+    - 반환된 DataFrame은 모든 세션이 공유하므로 제자리(in-place) 수정 금지
+    - 캐시 밖에서 만든 공유 DataFrame(반영 대기 중인 저장을 덧씌운 결과 등)은 adopt()로 등록해 파생 객체만 공유
+    """
+
+    def __init__(self, max_entries=8, max_bytes=256 * 1024 * 1024, ttl=60, max_adopted=4):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_adopted = max_adopted
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self._entries = OrderedDict()
+        self._adopted = OrderedDict()  # id(df) → 항목 (df를 함께 잡아 두므로 id가 재사용되지 않음)
+        self._versions = {}
+        self._bytes = 0
+
+    def version(self, worksheet):
+        with self._lock:
+            return self._versions.get(worksheet, 0)
+
+    def get(self, worksheet, loader):
+        """캐시된 DataFrame 반환, 없거나 만료되었으면 loader()로 한 번만 읽어옴"""
+        df = self._lookup(worksheet)
+        if df is not None:
+            return df
+
+        # 같은 워크시트를 동시에 요청한 세션들은 하나의 읽기 결과를 공유
+        with self._load_lock(worksheet):
+            df = self._lookup(worksheet)
+            if df is not None:
+                return df
+            version = self.version(worksheet)
+            try:
+                df = loader()
+            except Exception:
+                stale = self._lookup(worksheet, allow_stale=True)
+                if stale is None:
+                    raise
+                return stale
+            self._store(worksheet, version, df)
+            return df
+
+    def refresh(self, worksheet, loader):
+        """백그라운드 갱신: 새로 읽어서 바뀌었으면 다음 버전으로 교체, 같으면 시각만 갱신
+
+        읽는 동안 들어온 get() 요청은 같은 읽기를 기다렸다가 결과를 공유
+        """
+        with self._load_lock(worksheet):
+            version = self.version(worksheet)
+            df = loader()
+            with self._lock:
+                entry = self._entries.get((worksheet, version))
+                if entry is not None and self._versions.get(worksheet, 0) == version and entry.df.equals(df):
+                    entry.loaded_at = time.monotonic()  # 그대로면 파생 인덱스도 유지
+                    return False
+            self._store_next(worksheet, version, df)
+            return True
+
+    def invalidate(self, worksheet):
+        """워크시트의 데이터 버전을 올리고 기존 항목 제거 (저장 직후 호출)"""
+        with self._lock:
+            self._versions[worksheet] = self._versions.get(worksheet, 0) + 1
+            for key in [k for k in self._entries if k[0] == worksheet]:
+                self._bytes -= self._entries.pop(key).nbytes
+
+    def put(self, worksheet, df, derived=None):
+        """저장 직후 새 DataFrame을 다음 버전으로 바로 등록 (write-through)"""
+        self._store_next(worksheet, None, df, derived)
+
+    def adopt(self, df):
+        """캐시에 없는 df도 derive()로 파생 객체를 한 번만 만들도록 등록하고 df 반환 (최근 max_adopted개만 유지)
+
+        df는 등록한 쪽이 같은 내용인 동안 같은 객체로 계속 돌려주는 것이어야 함 (예: 대기열 항목의 view())
+        """
+        if self._entry_of(df) is not None:
+            return df
+        with self._lock:
+            self._adopted[id(df)] = _Entry(df, 0, time.monotonic())
+            while len(self._adopted) > self.max_adopted:
+                self._adopted.popitem(last=False)
+        return df
+
+    def derive(self, df, name, builder):
+        """캐시된 DataFrame에서 파생된 객체(인덱스 등)를 버전당 한 번만 생성"""
+        entry = self._entry_of(df)
+        if entry is not None and name in entry.derived:
+            return entry.derived[name]
+        value = builder(df)
+        if entry is not None:
+            with self._lock:
+                value = entry.derived.setdefault(name, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._adopted.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "versions": dict(self._versions),
+                "adopted": len(self._adopted),
+            }
+
+    # 내부 함수
+    def _load_lock(self, worksheet):
+        with self._lock:
+            return self._load_locks.setdefault(worksheet, threading.Lock())
+
+    def _lookup(self, worksheet, allow_stale=False):
+        with self._lock:
+            key = (worksheet, self._versions.get(worksheet, 0))
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not allow_stale and self.ttl is not None and time.monotonic() - entry.loaded_at > self.ttl:
+                return None  # 지난 항목은 새로 읽을 때까지 남겨 둠 (읽기 실패 시 사용)
+            self._entries.move_to_end(key)
+            return entry.df
+
+    def _entry_of(self, df):
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.df is df:
+                    return entry
+            entry = self._adopted.get(id(df))
+            if entry is not None and entry.df is df:
+                self._adopted.move_to_end(id(df))
+                return entry
+        return None
+
+    def _store_next(self, worksheet, expected, df, derived=None):
+        """버전을 올리고 이전 항목을 지운 뒤 df 등록 (expected 버전에서 바뀌었으면 포기)"""
+        with self._lock:
+            current = self._versions.get(worksheet, 0)
+            if expected is not None and current != expected:
+                return
+            self._versions[worksheet] = current + 1
+            for key in [k for k in self._entries if k[0] == worksheet]:
+                self._bytes -= self._entries.pop(key).nbytes
+            version = self._versions[worksheet]
+        self._store(worksheet, version, df, derived)
+
+    def _store(self, worksheet, version, df, derived=None):
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            # 읽는 도중 저장이 일어났다면 이미 낡은 데이터이므로 보관하지 않음
+            if self._versions.get(worksheet, 0) != version:
+                return
+            key = (worksheet, version)
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = _Entry(df, nbytes, time.monotonic(), derived)
+            self._bytes += nbytes
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                if len(self._entries) == 1:
+                    break  # 한도보다 큰 단일 항목도 현재 버전은 유지
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+
+sheet_cache = SheetCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    ttl=settings.CACHE_TTL_SECONDS,
+)
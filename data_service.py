@@ -0,0 +1,57 @@
+import threading
+
+from background import BackgroundWorker
+from settings import REFRESH_MAX_BACKOFF_SECONDS, REFRESH_SECONDS
+from storage import get_storage
+
+# ---------------------------------------------------------
+# 프로세스 공용 데이터 서비스 (백그라운드 갱신)
+# ---------------------------------------------------------
+class DataService(BackgroundWorker):
+    """현재 저장소의 프로모션/주간 보고 스냅샷을 보관하고 백그라운드 스레드에서 주기적으로 새로 읽음
+
+    - 세션은 공유 스냅샷(읽기 전용)을 받아가므로 접속자가 많아도 시트 읽기는 갱신 주기당 한 번
+    - 갱신 중에 들어온 요청은 진행 중인 읽기를 기다렸다가 같은 결과를 사용
+    - 실패하면 interval, 2배, 4배... 최대 max_backoff까지 간격을 늘리고 지난 데이터를 계속 제공
+    """
+
+    thread_name = "promo-data-refresher"
+
+    def __init__(self, storage=get_storage, interval=REFRESH_SECONDS, max_backoff=REFRESH_MAX_BACKOFF_SECONDS):
+        super().__init__(interval, max_backoff)
+        self._storage = storage
+
+    @property
+    def storage(self):
+        return self._storage()
+
+    # 조회 (공유 스냅샷)
+    def promotions(self):
+        self.start()
+        return self.storage.read_promotions()
+
+    def reports(self, week_start=None, assignee=None):
+        self.start()
+        return self.storage.read_reports(week_start=week_start, assignee=assignee)
+
+    # 갱신 (첫 읽기는 처음 요청한 세션이 함께 기다리며 수행, 스레드는 interval 뒤부터)
+    def refresh_now(self):
+        """지금 바로 다시 읽기 (다른 요청과 겹치면 같은 읽기 결과를 공유)"""
+        self.run_once()
+
+    def _step(self):
+        self.storage.refresh()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_data_service():
+    """프로세스 전체에서 하나인 데이터 서비스"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = DataService()
+    return _service
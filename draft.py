@@ -0,0 +1,287 @@
+from contextlib import contextmanager
+
+import pandas as pd
+
+from frame_diff import FrameDiff, canon, diff_frames
+from importer import merge_on_key
+
+UNDO_LIMIT = 50  # 되돌리기 기록 최대 개수
+_MISSING = object()
+
+# ---------------------------------------------------------
+# 관리자 편집용 draft (공유 base + 세션별 변경분)
+# ---------------------------------------------------------
+class PromotionDraft:
+    """모든 세션이 공유하는 base 프레임 위에 이 세션의 변경분만 보관
+
+    - edits: {source 라벨: {컬럼: 값}}, inserted: {새 라벨: {컬럼: 값}}, deleted: source 라벨
+    - 컬럼 추가/삭제는 columns 목록과 기본값으로만 기록
+    - source는 평소 base, CSV 업로드처럼 통째로 바뀐 경우만 새 프레임 (그 위에 다시 변경분을 쌓음)
+    - frame()은 필요할 때 source에 변경분을 덧씌운 프레임을 만들고(리비전당 한 번), diff()는 저장용 변경분
+    - 모든 변경은 되돌리기 기록(history)에 역연산으로 남음 (변경량에 비례하는 비용)
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.source = base
+        self.columns = list(base.columns)
+        self.defaults = {}
+        self.edits = {}
+        self.inserted = {}
+        self.deleted = set()
+        self.revision = 0
+        self.history = []
+        self._txn = None
+        self._next_label = _next_label(base)
+        self._frame = None
+
+    @property
+    def dirty(self):
+        return bool(self.source is not self.base or self.edits or self.inserted or self.deleted
+                    or self.columns != list(self.base.columns))
+
+    # 되돌리기
+    @contextmanager
+    def transaction(self, label):
+        """안의 변경을 하나의 되돌리기 단위로 묶음"""
+        if self._txn is not None:
+            yield
+            return
+        self._txn = []
+        try:
+            yield
+        finally:
+            ops, self._txn = self._txn, None
+            if ops:
+                self.history.append((label, ops))
+                del self.history[:-UNDO_LIMIT]
+
+    def undo(self):
+        """마지막 변경 단위를 되돌리고 그 이름을 반환 (없으면 None)"""
+        if not self.history:
+            return None
+        label, ops = self.history.pop()
+        for op in reversed(ops):
+            op()
+        self._changed()
+        return label
+
+    def _log(self, op):
+        if self._txn is not None:
+            self._txn.append(op)
+        else:
+            self.history.append(("변경", [op]))
+            del self.history[:-UNDO_LIMIT]
+
+    def _changed(self):
+        self.revision += 1
+        self._frame = None
+
+    # 변경 기록
+    def add_column(self, name, default="-"):
+        with self.transaction(f"컬럼 추가: {name}"):
+            self.columns.append(name)
+            self.defaults[name] = default
+            self._log(lambda: (self.columns.remove(name), self.defaults.pop(name, None)))
+        self._changed()
+
+    def drop_column(self, name):
+        with self.transaction(f"컬럼 삭제: {name}"):
+            position, default = self.columns.index(name), self.defaults.pop(name, _MISSING)
+            self.columns.remove(name)
+            removed = []
+            for cells in list(self.edits.values()) + list(self.inserted.values()):
+                if name in cells:
+                    removed.append((cells, cells.pop(name)))
+
+            def restore():
+                self.columns.insert(position, name)
+                if default is not _MISSING:
+                    self.defaults[name] = default
+                for cells, value in removed:
+                    cells[name] = value
+            self._log(restore)
+        self._changed()
+
+    def append_row(self, row):
+        label = self._next_label
+        self._next_label += 1
+        self._insert(label, dict(row))
+        self._changed()
+        return label
+
+    def replace(self, df):
+        """CSV 업로드 등으로 전체 교체 (저장 시 base와 비교해 반영)"""
+        with self.transaction("전체 교체"):
+            state = (self.source, self.columns, self.defaults, self.edits, self.inserted, self.deleted, self._next_label)
+            self.source = df.reset_index(drop=True)
+            self.columns = list(self.source.columns)
+            self.defaults, self.edits, self.inserted, self.deleted = {}, {}, {}, set()
+            self._next_label = _next_label(self.source)
+
+            def restore():
+                (self.source, self.columns, self.defaults, self.edits, self.inserted,
+                 self.deleted, self._next_label) = state
+            self._log(restore)
+        self._changed()
+
+    def merge(self, imported, key="프로모션명", blank=None):
+        """CSV 병합: key가 같은 행은 갱신, 새 key는 추가 (변경분으로 기록, blank는 merge_on_key 참고)"""
+        with self.transaction("CSV 병합"):
+            for col in imported.columns:
+                if col not in self.columns:
+                    self.add_column(col, "-")
+            self.update_from(merge_on_key(self.frame(), imported, key, blank))
+
+    def reapply(self, other, key="프로모션명"):
+        """다른 스냅샷 기준 draft(other)의 변경분을 이 draft에 다시 적용하고 대상 행을 찾지 못한 변경 수 반환
+
+        반영하지 못한 저장을 최신 데이터 위에 되살릴 때 사용. 행은 key 값으로 찾고 바뀐 칸만 덮어쓰므로
+        그 사이 다른 곳에서 바꾼 다른 칸/행은 유지됨 (컬럼 순서 변경 등으로 변경분을 만들 수 없으면 그 결과로 교체)
+        """
+        diff = other.diff(size_check=False)
+        if diff.rewrite or key not in self.columns or key not in other.base.columns:
+            self.replace(other.frame())
+            return 0
+        current = self.frame()
+        label_of = dict(zip(canon(current[key]), current.index))
+        key_of = canon(other.base[key])
+        missing = 0
+        with self.transaction("저장하지 못한 변경 되살리기"):
+            for col in diff.dropped_cols:
+                if col in self.columns:
+                    self.drop_column(col)
+            for col in diff.added_cols:
+                if col not in self.columns:
+                    self.add_column(col, other.defaults.get(col, "-"))
+            frame = other.frame()
+            updated = {label: dict(cells) for label, cells in diff.updated.items()}
+            for col in diff.added_cols:
+                # 추가한 컬럼의 기존 행 값은 updated에 없으므로 기본값과 다른 칸만 옮김
+                values = frame.loc[frame.index.isin(other.base.index), col]
+                default = canon(pd.Series([other.defaults.get(col, "-")])).iat[0]
+                for label, value in values[(canon(values) != default).to_numpy()].items():
+                    updated.setdefault(label, {})[col] = value
+            for label, cells in updated.items():
+                row = label_of.get(key_of.at[label])
+                if row is None:
+                    missing += 1
+                    continue
+                for col, value in cells.items():
+                    self.set_cell(row, col, value)
+            for label in diff.deleted:
+                row = label_of.get(key_of.at[label])
+                if row is not None:
+                    self.delete_row(row)
+            for _, row in diff.inserted.iterrows():
+                self.append_row({c: row[c] for c in row.index if c in self.columns})
+        return missing
+
+    def set_cell(self, label, col, value):
+        if label in self.inserted:
+            cells = self.inserted[label]
+            old = cells.get(col, _MISSING)
+            cells[col] = value
+            self._log(lambda: cells.__setitem__(col, old) if old is not _MISSING else cells.pop(col, None))
+        else:
+            old = self.edits.get(label)
+            old = dict(old) if old is not None else None
+            if col in self.source.columns and canon(pd.Series([value])).iat[0] == canon(self.source.loc[[label], col]).iat[0]:
+                cells = self.edits.get(label, {})
+                cells.pop(col, None)  # source 값으로 되돌린 경우
+                if not cells:
+                    self.edits.pop(label, None)
+            else:
+                self.edits.setdefault(label, {})[col] = value
+            self._log(lambda: self.edits.__setitem__(label, old) if old is not None else self.edits.pop(label, None))
+        self._changed()
+
+    def delete_row(self, label):
+        if label in self.inserted:
+            row = self.inserted.pop(label)
+            self._log(lambda: self._restore_inserted(label, row))
+        else:
+            cells = self.edits.pop(label, None)
+            self.deleted.add(label)
+
+            def restore():
+                self.deleted.discard(label)
+                if cells is not None:
+                    self.edits[label] = cells
+            self._log(restore)
+        self._changed()
+
+    def update_from(self, edited):
+        """편집기가 돌려준 전체 프레임과 현재 draft를 비교해 변경분만 반영"""
+        diff = diff_frames(self.frame(), edited)
+        with self.transaction("편집"):
+            for label in diff.deleted:
+                self.delete_row(label)
+            for label, cells in diff.updated.items():
+                for col, value in cells.items():
+                    self.set_cell(label, col, value)
+            for label, row in diff.inserted.iterrows():
+                self._insert(label, {c: row[c] for c in self.columns if c in row.index})
+                self._next_label = max(self._next_label, int(label) + 1)
+        self._changed()
+
+    def _insert(self, label, row):
+        self.inserted[label] = row
+        self._log(lambda: self.inserted.pop(label, None))
+
+    def _restore_inserted(self, label, row):
+        self.inserted[label] = row
+        self.inserted = dict(sorted(self.inserted.items()))  # 라벨(추가 순서) 순서 유지
+
+    # 조회
+    def frame(self):
+        """source에 변경분을 덧씌운 프레임 (리비전당 한 번 생성, 바뀐 컬럼만 실제로 복사됨)"""
+        if self._frame is None:
+            self._frame = self._build_frame()
+        return self._frame
+
+    def _build_frame(self):
+        df = self.source.copy(deep=False)
+        for col in self.columns:
+            if col not in df.columns:
+                df[col] = self.defaults.get(col, "-")
+        by_col = {}
+        for label, cells in self.edits.items():
+            for col, value in cells.items():
+                by_col.setdefault(col, {})[label] = value
+        for col, values in by_col.items():
+            if col not in self.columns:
+                continue
+            labels, new = list(values), list(values.values())
+            try:
+                df.loc[labels, col] = new
+            except (TypeError, ValueError):
+                df[col] = df[col].astype(object)
+                df.loc[labels, col] = new
+        if self.deleted:
+            df = df.drop(index=list(self.deleted))
+        df = df[self.columns]
+        if self.inserted:
+            df = pd.concat([df, pd.DataFrame.from_dict(self.inserted, orient="index").reindex(columns=self.columns)])
+        return df
+
+    def diff(self, size_check=True):
+        """저장용 FrameDiff (base 스냅샷 기준, size_check면 변경량이 많을 때 rewrite 표시)"""
+        if self.source is not self.base:
+            return diff_frames(self.base, self.frame(), size_check)
+        base_cols = list(self.base.columns)
+        added = [c for c in self.columns if c not in base_cols]
+        dropped = [c for c in base_cols if c not in self.columns]
+        updated = {}
+        for label, cells in self.edits.items():
+            live = {c: v for c, v in cells.items() if c in base_cols and c in self.columns}
+            if live:
+                updated[label] = live
+        inserted = pd.DataFrame.from_dict(self.inserted, orient="index").reindex(columns=self.columns)
+        deleted = pd.Index(sorted(self.deleted))
+        diff = FrameDiff(self.columns, inserted, deleted, updated, added, dropped)
+        return diff.check_size(self.base) if size_check else diff
+
+
+def _next_label(df):
+    return int(df.index.max()) + 1 if len(df) else 0
@@ -0,0 +1,98 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from schema import PROMOTION_DATES, to_plain
+
+_view_ids = itertools.count()
+
+# ---------------------------------------------------------
+# 관리자 편집기 한 화면 (페이지/검색 결과) ↔ draft 변경분 연결
+# ---------------------------------------------------------
+class EditorView:
+    """st.data_editor에 넘길 고정된 한 페이지와, 편집기 상태(누적 변경) 중 이미 반영한 부분
+
+    - 편집기 입력을 재실행 사이에 그대로 유지해야 편집기 상태가 초기화되지 않으므로 페이지를 고정해 둠
+    - 편집기 상태는 생성 이후 누적값이라, 새로 생긴 변경만 골라 draft에 반영 (변경량에 비례)
+    - draft가 다른 경로로 바뀌면(revision 불일치) 새 화면을 만들어야 함
+    """
+
+    def __init__(self, draft, params, labels):
+        self.params = params
+        self.labels = np.asarray(labels)
+        self.df = to_plain(draft.frame().loc[self.labels]).reset_index(drop=True)
+        for col in PROMOTION_DATES:
+            # 행 추가 폼으로 넣은 행은 datetime.date라 기존 Timestamp와 섞이면 편집기로 보낼 수 없음
+            if col in self.df.columns and self.df[col].dtype == object:
+                self.df[col] = pd.to_datetime(self.df[col], errors="coerce")
+        self.key = f"draft_editor_{next(_view_ids)}"
+        self.draft_id = id(draft)
+        self.revision = draft.revision
+        self.edited = {}
+        self.added = []
+        self.added_labels = []
+        self.deleted = set()
+
+    def is_current(self, draft, params):
+        return self.draft_id == id(draft) and self.revision == draft.revision and self.params == params
+
+    def apply(self, draft, state):
+        """편집기 상태에서 지난번 이후 새로 생긴 변경만 draft에 반영하고 요약 반환"""
+        edited = state.get("edited_rows", {}) or {}
+        # self.added와 같은 기준(변환한 값)으로 비교해야 지운 행의 위치를 제대로 찾음
+        added = [{c: _parse(c, v) for c, v in row.items()} for row in state.get("added_rows", []) or []]
+        deleted = set(state.get("deleted_rows", []) or [])
+        counts = {"수정": 0, "추가": 0, "삭제": 0}
+
+        with draft.transaction("편집기 변경"):
+            edited = {int(p): c for p, c in edited.items()}
+            for pos in set(edited) | set(self.edited):
+                cells, before = edited.get(pos, {}), self.edited.get(pos, {})
+                for col, value in cells.items():
+                    if col in before and before[col] == value:
+                        continue
+                    draft.set_cell(self.labels[pos], col, _parse(col, value))
+                    counts["수정"] += 1
+                for col in set(before) - set(cells):
+                    draft.set_cell(self.labels[pos], col, self.df.at[pos, col])  # 원래 값으로 되돌림
+
+            # 추가했던 행을 다시 지우면 added_rows에서 빠지므로 처음 달라지는 위치의 행을 제거
+            while len(self.added) > len(added):
+                gone = next((i for i, (old, new) in enumerate(zip(self.added, added)) if old != new), len(added))
+                draft.delete_row(self.added_labels.pop(gone))
+                self.added.pop(gone)
+                counts["삭제"] += 1
+            for i, row in enumerate(added):
+                if i >= len(self.added):
+                    self.added_labels.append(draft.append_row(row))
+                    counts["추가"] += 1
+                    continue
+                for col, value in row.items():
+                    if self.added[i].get(col, None) != value:
+                        draft.set_cell(self.added_labels[i], col, value)
+
+            for pos in sorted(deleted - self.deleted):
+                draft.delete_row(self.labels[int(pos)])
+                counts["삭제"] += 1
+
+        self.edited = {p: dict(c) for p, c in edited.items()}
+        self.added = added
+        self.deleted = deleted
+        self.revision = draft.revision
+        return counts
+
+
+def _parse(col, value):
+    """편집기 값(JSON) → draft 값 (날짜 컬럼은 ISO 문자열로 오므로 변환)"""
+    if col in PROMOTION_DATES and isinstance(value, str):
+        return pd.to_datetime(value, errors="coerce")
+    return value
+
+
+def search_labels(df, column, text):
+    """column 값에 text가 들어 있는 행의 라벨 (대소문자 무시, text가 없으면 전체)"""
+    if not text or column not in df.columns:
+        return df.index
+    hit = df[column].astype(object).fillna("").astype(str).str.contains(text, case=False, regex=False)
+    return df.index[hit.to_numpy()]
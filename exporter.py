@@ -0,0 +1,151 @@
+import hashlib
+import os
+import threading
+
+import pandas as pd
+
+from settings import EXPORT_CHUNK_ROWS, EXPORT_DIR, EXPORT_MAX_FILES
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# 형식: (확장자, MIME)
+EXPORT_FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "Excel (XLSX)": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+# ---------------------------------------------------------
+# 형식별 쓰기 (청크 단위로 파일에 바로 기록)
+# ---------------------------------------------------------
+def _chunks(df, rows=EXPORT_CHUNK_ROWS):
+    if df.empty:
+        yield df
+        return
+    for start in range(0, len(df), rows):
+        yield df.iloc[start:start + rows]
+
+
+def write_csv(df, out):
+    out.write(b"\xef\xbb\xbf")  # 엑셀에서 한글이 깨지지 않도록 (utf-8-sig)
+    for i, chunk in enumerate(_chunks(df)):
+        out.write(chunk.to_csv(index=False, header=i == 0, date_format="%Y-%m-%d").encode("utf-8"))
+
+
+def _xlsx_rows(chunk):
+    columns = []
+    for col in chunk.columns:
+        series = chunk[col]
+        values = series.dt.date if pd.api.types.is_datetime64_any_dtype(series) else series
+        columns.append(values.astype(object).where(series.notna(), None).tolist())
+    return zip(*columns)
+
+
+def write_xlsx(df, out):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)  # 행을 바로 임시 파일로 흘려 쓰는 모드
+    ws = wb.create_sheet()
+    ws.append([str(c) for c in df.columns])
+    for chunk in _chunks(df):
+        for row in _xlsx_rows(chunk):
+            ws.append(row)
+    wb.save(out)
+
+
+def _arrow_safe(df):
+    """여러 타입이 섞인 object 컬럼은 문자열로 (Arrow는 컬럼당 한 타입)"""
+    mixed = [c for c in df.columns if df[c].dtype == object and pd.api.types.infer_dtype(df[c], skipna=True) not in ("string", "empty")]
+    if not mixed:
+        return df
+    return df.assign(**{c: df[c].astype(object).where(df[c].isna(), df[c].astype(str)).where(df[c].notna(), None) for c in mixed})
+
+
+def write_parquet(df, out):
+    if pa is None:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow가 필요합니다.")
+    df = _arrow_safe(df)
+    writer = None
+    for chunk in _chunks(df):
+        table = pa.Table.from_pandas(chunk, preserve_index=False, schema=writer.schema if writer else None)
+        if writer is None:
+            writer = pq.ParquetWriter(out, table.schema)
+        writer.write_table(table)
+    writer.close()
+
+
+WRITERS = {"CSV": write_csv, "Excel (XLSX)": write_xlsx, "Parquet": write_parquet}
+
+
+def available_formats():
+    return [f for f in EXPORT_FORMATS if f != "Parquet" or pa is not None]
+
+
+# ---------------------------------------------------------
+# 내보내기 파일 캐시 (데이터 해시 + 형식 → 디스크 파일)
+# ---------------------------------------------------------
+def frame_token(df):
+    """내용 기반 해시 (같은 데이터면 세션이 달라도 같은 값)"""
+    h = hashlib.sha1()
+    h.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()[:24]
+
+
+class ExportCache:
+    """만든 파일을 해시 이름으로 보관하고 최근 max_files개만 유지"""
+
+    def __init__(self, directory=EXPORT_DIR, max_files=EXPORT_MAX_FILES):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def path(self, df, fmt, prefix):
+        return os.path.join(self.directory, f"{prefix}-{frame_token(df)}{EXPORT_FORMATS[fmt][0]}")
+
+    def open(self, df, fmt, prefix="export"):
+        """해시가 같은 파일이 있으면 그대로, 없으면 만들어서 읽기용으로 열기"""
+        path = self.path(df, fmt, prefix)
+        with self._lock:
+            if os.path.exists(path):
+                os.utime(path)
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                try:
+                    with open(tmp, "wb") as out:
+                        WRITERS[fmt](df, out)
+                    os.replace(tmp, path)
+                finally:
+                    if os.path.exists(tmp):
+                        os.remove(tmp)
+                self._prune()
+        return open(path, "rb")
+
+    def _prune(self):
+        files = [os.path.join(self.directory, f) for f in os.listdir(self.directory) if not f.endswith(".tmp")]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for stale in files[self.max_files:]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+
+export_cache = ExportCache()
+
+
+def deferred_export(df, fmt, prefix="export"):
+    """st.download_button(data=...)용: 다운로드를 누를 때만 파일을 만들거나 캐시에서 꺼냄
+
+    df 대신 DataFrame을 돌려주는 함수를 주면 데이터 조회도 누를 때 함
+    """
+    return lambda: export_cache.open(df() if callable(df) else df, fmt, prefix)
+
+
+def export_file_name(base_name, fmt):
+    return base_name + EXPORT_FORMATS[fmt][0]
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from data_cache import sheet_cache
+
+EXCLUDED_COLS = ('진척율', '시작일', '종료일')
+DONE_STATUS = '완료'
+
+# ---------------------------------------------------------
+# 대시보드 필터 인덱스 (데이터 버전당 한 번 생성)
+# ---------------------------------------------------------
+def _popcount(bits):
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(bits).sum())
+    return int(np.unpackbits(bits).sum())
+
+
+class FilterIndex:
+    """필터 컬럼을 범주 코드로 바꾸고 값별 비트맵(np.packbits)으로 조건 계산
+
+    - 여러 컬럼 조건은 비트맵 OR(컬럼 내) / AND(컬럼 간) 몇 번으로 끝남
+    - 값별 비트맵은 처음 쓰일 때 만들어 보관 (고유값이 많은 컬럼도 메모리 일정)
+    - 지표(전체/상태별 건수, 완료 제외 평균 진척율)는 생성 시 미리 계산
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.n = len(df)
+        self.columns = [c for c in df.columns if c not in EXCLUDED_COLS]
+        self._codes = {}
+        self._values = {}
+        self._bitmaps = {}
+        for col in self.columns:
+            codes, uniques = pd.factorize(df[col].astype(object).map(str), sort=True)
+            self._codes[col] = codes
+            self._values[col] = list(uniques)
+        self._all = np.packbits(np.ones(self.n, dtype=bool))
+
+        self.status_counts = {}
+        if '상태' in self.columns:
+            counts = np.bincount(self._codes['상태'], minlength=len(self._values['상태']))
+            self.status_counts = dict(zip(self._values['상태'], counts.tolist()))
+        self.active_progress_mean = 0.0
+        if '진척율' in df.columns and '상태' in df.columns:
+            progress = pd.to_numeric(df['진척율'], errors='coerce').to_numpy(dtype=float)
+            active = progress[df['상태'].to_numpy() != DONE_STATUS]
+            if len(active):
+                self.active_progress_mean = float(np.nanmean(active)) if not np.isnan(active).all() else 0.0
+
+    # 비트맵 연산
+    def all_rows(self):
+        return self._all
+
+    def value_bitmap(self, col, value):
+        key = (col, value)
+        bits = self._bitmaps.get(key)
+        if bits is None:
+            values = self._values.get(col, [])
+            if value in values:
+                bits = np.packbits(self._codes[col] == values.index(value))
+            else:
+                bits = np.zeros_like(self._all)
+            self._bitmaps[key] = bits
+        return bits
+
+    def match(self, col, selected):
+        """col 값이 selected 중 하나인 행"""
+        bits = np.zeros_like(self._all)
+        for value in selected:
+            bits = bits | self.value_bitmap(col, str(value))
+        return bits
+
+    def exclude(self, bits, other):
+        return bits & ~other
+
+    def count(self, bits):
+        return _popcount(bits)
+
+    def options(self, col, bits):
+        """bits에 해당하는 행에 실제로 있는 col 값 (정렬됨)"""
+        if col not in self._codes:
+            return []
+        present = np.bincount(self._codes[col][self._rows(bits)], minlength=len(self._values[col])) > 0
+        return [v for v, ok in zip(self._values[col], present) if ok]
+
+    def take(self, bits):
+        if self.count(bits) == self.n:
+            return self.df
+        return self.df.iloc[self._rows(bits)]
+
+    def _rows(self, bits):
+        return np.flatnonzero(np.unpackbits(bits, count=self.n))
+
+
+def get_filter_index(df):
+    """캐시된 데이터라면 버전당 한 번만 만들고 모든 세션이 공유"""
+    return sheet_cache.derive(df, "filter_index", FilterIndex)
@@ -0,0 +1,109 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+# 바뀐 칸이 전체의 이 비율을 넘으면 변경분 대신 전체를 다시 씀
+REWRITE_RATIO = 0.5
+
+# ---------------------------------------------------------
+# 스냅샷 대비 변경분 (행/칸/컬럼)
+# ---------------------------------------------------------
+class FrameDiff:
+    """base 스냅샷 대비 draft 변경분
+
+    - 행은 index 라벨로 식별 (base 라벨 = 스냅샷 당시 행 위치)
+    - inserted: 새 행 (draft 컬럼 순서), deleted: 삭제된 base 라벨
+    - updated: {base 라벨: {컬럼: 새 값}}
+    - added_cols/dropped_cols: 컬럼 추가/삭제 (스키마 변경)
+    """
+
+    def __init__(self, columns, inserted, deleted, updated, added_cols, dropped_cols, rewrite=False):
+        self.columns = columns
+        self.inserted = inserted
+        self.deleted = deleted
+        self.updated = updated
+        self.added_cols = added_cols
+        self.dropped_cols = dropped_cols
+        self.rewrite = rewrite
+
+    @property
+    def empty(self):
+        return not (len(self.inserted) or len(self.deleted) or self.updated or self.added_cols or self.dropped_cols)
+
+    def cell_count(self):
+        return sum(len(v) for v in self.updated.values())
+
+    def check_size(self, base):
+        """변경량이 많으면 전체 다시 쓰기가 더 싸므로 rewrite 표시"""
+        n_cols = len(base.columns)
+        changed = (self.cell_count() + (len(self.inserted) + len(self.deleted)) * len(self.columns)
+                   + len(self.added_cols) * (len(base) - len(self.deleted)))
+        if changed > REWRITE_RATIO * max(len(base) * n_cols, 1):
+            self.rewrite = True
+        return self
+
+    def summary(self):
+        return (f"추가 {len(self.inserted)}행, 삭제 {len(self.deleted)}행, 수정 {self.cell_count()}칸, "
+                f"컬럼 +{len(self.added_cols)}/-{len(self.dropped_cols)}")
+
+
+def diff_frames(base, draft, size_check=True):
+    """base와 draft를 비교해 FrameDiff 생성
+
+    컬럼 순서가 바뀌었거나, 라벨이 중복되었거나, 변경량이 많으면(size_check) rewrite=True
+    """
+    base_cols, cols = list(base.columns), list(draft.columns)
+    added = [c for c in cols if c not in base_cols]
+    dropped = [c for c in base_cols if c not in cols]
+    kept_cols = [c for c in cols if c in base_cols]
+
+    rewrite = (
+        [c for c in base_cols if c in cols] != kept_cols
+        or cols[:len(kept_cols)] != kept_cols
+        or not draft.index.is_unique
+        or not base.index.is_unique
+    )
+    if rewrite:
+        return FrameDiff(cols, draft, base.index, {}, added, dropped, rewrite=True)
+
+    in_base = draft.index.isin(base.index)
+    inserted = draft.loc[~in_base]
+    deleted = base.index[~base.index.isin(draft.index)]
+    common = draft.index[in_base]
+
+    updated = {}
+    for col in kept_cols:
+        before = canon(base.loc[common, col]).to_numpy()
+        after = canon(draft.loc[common, col]).to_numpy()
+        for label in common[before != after]:
+            updated.setdefault(label, {})[col] = draft.at[label, col]
+
+    diff = FrameDiff(cols, inserted, deleted, updated, added, dropped)
+    return diff.check_size(base) if size_check else diff
+
+
+def canon(series):
+    """값 비교용 문자열 (date/Timestamp, 50/50.0, NaN/None 차이를 없앰)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime("%Y-%m-%d").fillna("")
+    return series.map(_canon_value)
+
+
+def _canon_value(v):
+    if v is None or (not isinstance(v, str) and pd.isna(v)):
+        return ""
+    if isinstance(v, (datetime.datetime, pd.Timestamp)):
+        return v.date().isoformat() if v.time() == datetime.time() else v.isoformat(sep=" ")
+    if isinstance(v, datetime.date):
+        return v.isoformat()
+    if isinstance(v, (float, np.floating)) and float(v).is_integer():
+        return str(int(v))
+    return str(v).strip()
+
+
+def append_rows(draft, rows):
+    """draft 끝에 행 추가 (기존 라벨을 유지하고 새 라벨은 최대값 다음부터)"""
+    start = int(draft.index.max()) + 1 if len(draft) else 0
+    new = pd.DataFrame(rows, index=range(start, start + len(rows)))
+    return pd.concat([draft, new])
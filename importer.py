@@ -0,0 +1,163 @@
+import csv
+
+import pandas as pd
+
+from frame_diff import append_rows
+from schema import ISSUE_COLUMNS, conform_promotions, validate_promotions
+from settings import IMPORT_CHUNK_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+MAX_REPORTED_ISSUES = 1000  # 화면에 보여줄 문제 행 수 상한 (건수는 전부 셈)
+
+# ---------------------------------------------------------
+# CSV 가져오기 (청크 단위 읽기 + 검사)
+# ---------------------------------------------------------
+class ImportResult:
+    """가져온 데이터와 검사 결과"""
+
+    def __init__(self, df, issues, issue_count, skipped, blank=None):
+        self.df = df
+        self.issues = issues
+        self.issue_count = issue_count
+        self.skipped = skipped  # 병합할 때 프로모션명이 없어 제외한 행 수
+        self.blank = blank      # df와 같은 모양의 bool 표: 원본 CSV에서 비어 있던 칸 (병합 시 기존 값 유지)
+
+    def summary(self):
+        text = f"{len(self.df)}행 가져옴"
+        if self.skipped:
+            text += f", {self.skipped}행 제외"
+        if self.issue_count:
+            text += f", 확인 필요 {self.issue_count}건"
+        return text
+
+
+def _count_rows(source):
+    """진행률 계산용 데이터 행 수 (줄바꿈 수 - 헤더, 파일 위치는 처음으로 되돌림)"""
+    source.seek(0)
+    lines, last = 0, b"\n"
+    for block in iter(lambda: source.read(1 << 20), b""):
+        lines += block.count(b"\n")
+        last = block[-1:]
+    source.seek(0)
+    return max(lines + (last != b"\n") - 1, 1)
+
+
+def _header(source):
+    """헤더 행만 읽어서 컬럼명 목록 (파일 위치는 처음으로 되돌림)"""
+    source.seek(0)
+    line = source.readline().decode("utf-8-sig")
+    source.seek(0)
+    return next(csv.reader([line]), [])
+
+
+def _arrow_chunks(source, chunk_rows):
+    # 모든 컬럼을 문자열로 읽고 변환은 검사 단계에서 (블록마다 타입 추론이 달라지는 문제 방지)
+    names = _header(source)
+    reader = pa_csv.open_csv(
+        source,
+        read_options=pa_csv.ReadOptions(block_size=1 << 20),
+        convert_options=pa_csv.ConvertOptions(column_types={n: pa.string() for n in names}, strings_can_be_null=True),
+    )
+    pending, buffered = [], 0
+    for batch in reader:
+        pending.append(batch)
+        buffered += batch.num_rows
+        if buffered >= chunk_rows:
+            yield pa.Table.from_batches(pending).to_pandas()
+            pending, buffered = [], 0
+    if pending:
+        yield pa.Table.from_batches(pending).to_pandas()
+
+
+def _blank_cells(chunk):
+    """형 변환 전 원본에서 비어 있거나 공백뿐인 칸 (진척율처럼 변환 후 빈 칸이 0이 되는 컬럼도 구분)"""
+    return pd.DataFrame({c: (chunk[c].isna() | (chunk[c].astype(str).str.strip() == "")).to_numpy() for c in chunk.columns},
+                        index=chunk.index, columns=chunk.columns)
+
+
+def _pandas_chunks(source, chunk_rows):
+    source.seek(0)
+    yield from pd.read_csv(source, dtype=str, chunksize=chunk_rows, encoding="utf-8-sig")
+
+
+def read_promotions_csv(source, chunk_rows=IMPORT_CHUNK_ROWS, progress=None, merge_key=None):
+    """프로모션 CSV를 청크 단위로 읽어 검사/변환 (pyarrow가 있으면 스트리밍 리더 사용)
+
+    source: 바이너리 파일 객체 (업로드 파일 등)
+    progress: progress(읽은 비율 0~1, 읽은 행 수) 콜백
+    merge_key: 병합용으로 읽을 때의 key 컬럼 (key가 빈 행은 병합할 수 없어 제외하고 문제 목록에 표시)
+    행 번호는 헤더를 1행으로 센 CSV 행 번호 (셀 안 줄바꿈이 없다고 가정)
+    """
+    total = _count_rows(source) if progress is not None else 1
+    chunks = _arrow_chunks(source, chunk_rows) if pa is not None else _pandas_chunks(source, chunk_rows)
+
+    frames, blanks, issues = [], [], []
+    line, issue_count, skipped = 2, 0, 0
+    for chunk in chunks:
+        blank = _blank_cells(chunk)
+        chunk, found = validate_promotions(chunk, first_line=line)
+        line += len(chunk)
+        if merge_key in chunk.columns:
+            keep = ~blank[merge_key].to_numpy()
+            found.loc[found["컬럼"] == merge_key, "사유"] = f"{merge_key} 없음 (병합에서 제외)"
+            skipped += int((~keep).sum())
+            chunk, blank = chunk[keep], blank[keep]
+        issue_count += len(found)
+        if sum(len(f) for f in issues) < MAX_REPORTED_ISSUES:
+            issues.append(found)
+        frames.append(chunk)
+        blanks.append(blank)
+        if progress is not None:
+            progress(min((line - 2) / total, 1.0), line - 2)
+
+    if not frames:
+        return ImportResult(pd.DataFrame(), pd.DataFrame(columns=ISSUE_COLUMNS), 0, 0)
+    # 청크마다 범주 목록이 다르므로 합친 뒤 한 번 더 정리
+    df = conform_promotions(pd.concat(frames, ignore_index=True))
+    blank = pd.concat(blanks, ignore_index=True).reindex(columns=df.columns, fill_value=False)
+    issues = pd.concat(issues, ignore_index=True).head(MAX_REPORTED_ISSUES)
+    return ImportResult(df, issues, issue_count, skipped, blank)
+
+
+def merge_on_key(current, imported, key="프로모션명", blank=None):
+    """key가 같은 행은 CSV의 값으로 갱신하고 새 key는 끝에 추가 (current 라벨 유지)
+
+    CSV에서 비어 있는 칸은 기존 값을 유지, 같은 key가 여러 번 나오면 마지막 행 사용
+    blank: imported와 같은 라벨의 bool 표 (ImportResult.blank), 없으면 결측인 칸을 빈 칸으로 봄
+    """
+    imported = imported.drop_duplicates(subset=[key], keep="last")
+    names = imported[key].astype(object).to_numpy()
+    existing = current[key].astype(object)
+    first_label = pd.Series(existing.index, index=existing.to_numpy())
+    first_label = first_label[~first_label.index.duplicated()]
+    pos = first_label.index.get_indexer(names)
+    matched = pos >= 0
+
+    merged = current.copy()
+    labels = first_label.to_numpy()[pos[matched]]
+    updates = imported[matched]
+    for col in imported.columns:
+        if col == key or col not in merged.columns:
+            continue
+        values = updates[col]
+        has_value = values.notna().to_numpy()
+        if blank is not None and col in blank.columns:
+            has_value = has_value & ~blank.loc[updates.index, col].to_numpy(dtype=bool)
+        if not has_value.any():
+            continue
+        target, new = labels[has_value], values.to_numpy(dtype=object)[has_value]
+        try:
+            merged.loc[target, col] = new
+        except (TypeError, ValueError):
+            merged[col] = merged[col].astype(object)
+            merged.loc[target, col] = new
+
+    new_rows = imported[~matched].reindex(columns=merged.columns)
+    if len(new_rows):
+        merged = append_rows(merged, new_rows.to_dict("records"))
+    return merged
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+from data_cache import sheet_cache
+
+START_COL, END_COL = "시작일", "종료일"
+_LEAF_SIZE = 32  # 이 개수 이하면 더 나누지 않고 한 노드에 보관
+
+# ---------------------------------------------------------
+# 프로모션 기간 인터벌 인덱스 (데이터 버전당 한 번 생성)
+# ---------------------------------------------------------
+def _days(series):
+    """날짜 컬럼 → 1970-01-01 기준 일수와 값이 있는지 여부"""
+    values = pd.to_datetime(series, errors="coerce").to_numpy(dtype="datetime64[D]")
+    return values.astype(np.int64), ~np.isnat(values)
+
+
+def _day(value):
+    return int(np.datetime64(pd.Timestamp(value).date(), "D").astype(np.int64))
+
+
+class _Node:
+    __slots__ = ("center", "left", "right", "by_start", "starts", "by_end", "ends")
+
+
+class PromotionIntervals:
+    """시작일~종료일(포함) 구간의 중심 인터벌 트리
+
+    - 노드마다 중심점을 지나는 구간을 시작일 오름차순/종료일 내림차순으로 보관
+      → 기간 [a, b]와 겹치는 행은 O(log n + 결과 수)로 찾음
+    - 주별 진행 건수는 정렬된 시작일/종료일 배열에서 이진 탐색 두 번 (주 수 × log n)
+    - 시작일이 없는 행은 제외하고, 종료일이 없거나 시작일보다 빠르면 시작일 하루짜리로 봄
+    """
+
+    def __init__(self, df):
+        self.df = df
+        starts, has_start = _days(df[START_COL]) if START_COL in df.columns else (np.zeros(len(df), np.int64), np.zeros(len(df), bool))
+        ends, has_end = _days(df[END_COL]) if END_COL in df.columns else (starts, np.zeros(len(df), bool))
+        self.rows = np.flatnonzero(has_start)
+        self.undated = len(df) - len(self.rows)
+        self.starts = starts[self.rows]
+        self.ends = np.where(has_end[self.rows], np.maximum(ends[self.rows], self.starts), self.starts)
+        self._sorted_starts = np.sort(self.starts)
+        self._sorted_ends = np.sort(self.ends)
+        self.root = self._build(np.arange(len(self.rows)))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _build(self, items):
+        if not len(items):
+            return None
+        node = _Node()
+        if len(items) <= _LEAF_SIZE:
+            # 잎 노드: 중심점 없이 모든 구간을 보관하고 조회 때 양쪽 조건을 직접 확인
+            node.center, node.left, node.right, mine = None, None, None, items
+        else:
+            starts, ends = self.starts[items], self.ends[items]
+            node.center = int(np.median(np.concatenate([starts, ends])))
+            mine = items[(starts <= node.center) & (ends >= node.center)]
+            node.left = self._build(items[ends < node.center])
+            node.right = self._build(items[starts > node.center])
+        order = np.argsort(self.starts[mine], kind="stable")
+        node.by_start, node.starts = mine[order], self.starts[mine][order]
+        order = np.argsort(-self.ends[mine], kind="stable")
+        node.by_end, node.ends = mine[order], -self.ends[mine][order]  # 종료일 내림차순 (부호를 바꿔 오름차순으로 탐색)
+        return node
+
+    # 조회
+    def overlapping(self, start, end=None):
+        """[start, end](포함)과 기간이 겹치는 행 위치 (원래 행 순서, df.iloc용)"""
+        a = _day(start)
+        b = a if end is None else _day(end)
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if node.center is None:
+                hit = (self.starts[node.by_start] <= b) & (self.ends[node.by_start] >= a)
+                found.append(node.by_start[hit])
+            elif b < node.center:
+                # 이 노드의 구간은 모두 center 이후에 끝나므로 시작일만 확인
+                found.append(node.by_start[:np.searchsorted(node.starts, b, side="right")])
+                stack.append(node.left)
+            elif a > node.center:
+                found.append(node.by_end[:np.searchsorted(node.ends, -a, side="right")])
+                stack.append(node.right)
+            else:
+                found.append(node.by_start)
+                stack.extend((node.left, node.right))
+        items = np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+        return np.sort(self.rows[items])
+
+    def active(self, start, end=None):
+        """기간과 겹치는 프로모션 (DataFrame)"""
+        return self.df.iloc[self.overlapping(start, end)]
+
+    def count(self, start, end=None):
+        """겹치는 건수만 (시작일 ≤ b 인 수 - 종료일 < a 인 수)"""
+        a = _day(start)
+        b = a if end is None else _day(end)
+        return int(np.searchsorted(self._sorted_starts, b, side="right") - np.searchsorted(self._sorted_ends, a, side="left"))
+
+    def weekly_counts(self, week_from, week_to):
+        """week_from~week_to 사이 각 주(월요일 시작)에 진행 중이던 프로모션 수 (Series, index=주 시작일)"""
+        weeks = pd.date_range(pd.Timestamp(week_from), pd.Timestamp(week_to), freq="7D")
+        a = weeks.to_numpy(dtype="datetime64[D]").astype(np.int64)
+        counts = np.searchsorted(self._sorted_starts, a + 6, side="right") - np.searchsorted(self._sorted_ends, a, side="left")
+        return pd.Series(counts, index=pd.Index(weeks.date, name="주"), name="진행 중")
+
+
+def get_promotion_intervals(df):
+    """캐시된 데이터라면 버전당 한 번만 만들고 모든 세션이 공유"""
+    return sheet_cache.derive(df, "promotion_intervals", PromotionIntervals)
@@ -0,0 +1,19 @@
+import os
+import sqlite3
+
+# ---------------------------------------------------------
+# 로컬 SQLite 파일 공용 연결 (로컬 저장소, 저장 대기열, 주간 집계)
+# ---------------------------------------------------------
+def ensure_dir(path):
+    """DB 파일이 들어갈 디렉터리 생성"""
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+
+def connect(path, synchronous=None):
+    """WAL 모드 연결 (읽는 쪽이 쓰기를 막지 않음), synchronous는 "FULL" 같은 PRAGMA 값"""
+    con = sqlite3.connect(path, timeout=30)
+    con.execute("PRAGMA journal_mode=WAL")
+    if synchronous:
+        con.execute(f"PRAGMA synchronous={synchronous}")
+    return con
@@ -0,0 +1,78 @@
+import datetime
+import time
+
+import streamlit as st
+
+from perf import perf
+
+# ---------------------------------------------------------
+# 페이지 공용 유틸리티 함수
+# ---------------------------------------------------------
+def safe_rerun():
+    if hasattr(st, "rerun"):
+        st.rerun()
+    else:
+        st.experimental_rerun()
+
+def get_week_range(date_obj):
+    start = date_obj - datetime.timedelta(days=date_obj.weekday())
+    end = start + datetime.timedelta(days=6)
+    return start, end
+
+def reset_draft():
+    """관리자 편집용 draft를 현재 데이터 스냅샷으로 초기화 (세션에는 변경분만 보관)"""
+    from draft import PromotionDraft
+
+    st.session_state.draft = PromotionDraft(st.session_state.promotions)
+
+def keep_until_flushed(draft):
+    """저장 대기열에 들어간 draft를 반영될 때까지 보관 (반영에 실패하면 restore_failed_save()가 되살림)"""
+    from data import write_status
+
+    status = write_status()
+    if status is None or status["status"] != "pending":
+        return
+    kept = st.session_state.get("unflushed_save")
+    drafts = kept["drafts"] if kept and kept["id"] == status["id"] else []
+    st.session_state.unflushed_save = {"id": status["id"], "drafts": drafts + [draft]}
+
+def restore_failed_save():
+    """보관 중인 저장이 반영되면 버리고, 반영에 실패했으면 최신 데이터 위에 그 변경(과 지금 draft)을 다시 올림"""
+    kept = st.session_state.get("unflushed_save")
+    if not kept:
+        return
+    from data import write_entry_status
+    from draft import PromotionDraft
+
+    status = write_entry_status(kept["id"])
+    if status is not None and status["status"] == "pending":
+        return
+    del st.session_state.unflushed_save
+    if status is None or status["status"] != "failed":
+        return
+    current = st.session_state.get("draft")
+    draft = PromotionDraft(st.session_state.promotions)
+    missing = sum(draft.reapply(d) for d in kept["drafts"] + ([current] if current is not None and current.dirty else []))
+    st.session_state.draft = draft
+    st.error(f"⚠️ 저장한 내용이 시트에 반영되지 못했습니다: {status['last_error']}\n\n"
+             "저장하지 못한 수정 내용을 최신 데이터 위에 다시 불러왔습니다. 확인 후 다시 저장해주세요."
+             + (f" (대상 행을 찾지 못한 수정 {missing}건은 제외)" if missing else ""))
+
+def show_write_status(status):
+    """저장 대기열 항목의 반영 상태 표시 (대기/완료/실패)"""
+    if status is None:
+        return
+    when = time.strftime("%H:%M:%S", time.localtime(status["flushed_at"] or status["updated_at"]))
+    if status["status"] == "flushed":
+        st.caption(f"✅ 시트 반영 완료 ({when})")
+    elif status["status"] == "failed":
+        st.warning(f"⚠️ 시트 반영 실패 ({when}): {status['last_error']}")
+    else:
+        retry = f", 재시도 {status['attempts']}회 - {status['last_error']}" if status["attempts"] else ""
+        st.caption(f"⏳ 시트 반영 대기 중 (저장 {when}{retry}). 저장한 내용은 그대로 보관됩니다.")
+
+def apply_editor_changes():
+    """편집기 on_change: 편집기 상태 중 새로 생긴 변경만 draft에 반영"""
+    view = st.session_state.editor_view
+    with perf.span("admin.draft_update"):
+        view.apply(st.session_state.draft, st.session_state[view.key])
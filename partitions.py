@@ -0,0 +1,155 @@
+import base64
+import datetime
+import gzip
+import io
+
+import pandas as pd
+
+REPORT_PARTITION_PREFIX = "weekly_reports_"
+REPORT_ARCHIVE_PREFIX = "weekly_reports_archive_"
+PARTITION_INDEX_NAME = "weekly_reports_index"
+PARTITION_COLUMNS = ["Partition", "First_Week", "Last_Week", "Rows", "Archived"]
+UNDATED = "undated"  # Week_Start가 날짜가 아닌 행
+ARCHIVE_COLUMN = "Data"
+ARCHIVE_CHUNK_CHARS = 40000  # 구글 시트 셀 하나에 5만 자까지
+ARCHIVE_CHUNK_PREFIX = "gz:"  # 셀 값이 수식/숫자로 해석되지 않도록
+
+
+class MissingArchiveError(Exception):
+    """보관된 분기의 압축 데이터를 저장소에서 찾을 수 없는 경우"""
+
+
+class ArchivedPartitionError(Exception):
+    """보관된(읽기 전용) 분기의 보고서를 저장하려는 경우"""
+
+
+# ---------------------------------------------------------
+# 주간 보고 분기 파티션
+# ---------------------------------------------------------
+def partition_of(week_start):
+    """'2026-10-12' → '2026Q4' (주 시작일이 속한 분기, 같은 주의 보고는 항상 한 파티션)"""
+    try:
+        day = datetime.date.fromisoformat(str(week_start)[:10])
+    except ValueError:
+        return UNDATED
+    return f"{day.year}Q{(day.month - 1) // 3 + 1}"
+
+
+def partition_worksheet(partition):
+    return REPORT_PARTITION_PREFIX + partition
+
+
+def partitions_before(keep_quarters, today=None):
+    """오늘이 속한 분기를 포함해 최근 keep_quarters개 분기보다 오래된 파티션의 상한 (이 값보다 작으면 보관 대상)"""
+    today = today or datetime.date.today()
+    n = today.year * 4 + (today.month - 1) // 3 - (keep_quarters - 1)
+    return f"{n // 4}Q{n % 4 + 1}"
+
+
+def split_by_partition(df):
+    """Week_Start 기준으로 {파티션: DataFrame} (파티션 안의 행 순서는 원래 순서 유지)"""
+    if df.empty:
+        return {}
+    weeks = df['Week_Start'].astype(str)
+    parts = weeks.map({w: partition_of(w) for w in weeks.unique()})
+    return {p: df[(parts == p).to_numpy()].reset_index(drop=True) for p in sorted(parts.unique())}
+
+
+class PartitionIndex:
+    """파티션 → (첫 주, 마지막 주, 행 수, 보관 여부)
+
+    시트/DB에 작은 표로 저장하고 캐시를 통해 모든 세션이 공유하므로 변경 시 새 객체를 만든다.
+    """
+
+    def __init__(self, entries=None):
+        self.entries = dict(sorted((entries or {}).items()))
+
+    @classmethod
+    def from_frame(cls, df):
+        entries = {}
+        for row in df.reindex(columns=PARTITION_COLUMNS).astype(object).itertuples(index=False):
+            if pd.isna(row.Partition):
+                continue
+            rows = pd.to_numeric(row.Rows, errors='coerce')
+            entries[str(row.Partition)] = (
+                _week(row.First_Week), _week(row.Last_Week),
+                0 if pd.isna(rows) else int(rows), str(row.Archived).strip() in ("1", "True", "TRUE"),
+            )
+        return cls(entries)
+
+    def to_frame(self):
+        return pd.DataFrame(
+            [(p, first, last, rows, int(archived)) for p, (first, last, rows, archived) in self.entries.items()],
+            columns=PARTITION_COLUMNS,
+        )
+
+    def partitions(self, archived=None):
+        return [p for p, e in self.entries.items() if archived is None or e[3] == archived]
+
+    def is_archived(self, partition):
+        entry = self.entries.get(partition)
+        return entry is not None and entry[3]
+
+    def covering(self, week_from=None, week_to=None):
+        """Week_Start 범위(포함)와 겹치는 파티션"""
+        return [
+            p for p, (first, last, rows, archived) in self.entries.items()
+            if (week_to is None or first <= str(week_to)) and (week_from is None or last >= str(week_from))
+        ]
+
+    def archivable(self, keep_quarters, today=None):
+        """보관되지 않은 파티션 중 최근 keep_quarters개 분기보다 오래된 것"""
+        cutoff = partitions_before(keep_quarters, today)
+        return [p for p in self.partitions(archived=False) if p != UNDATED and p < cutoff]
+
+    def with_partition(self, partition, df, archived=False):
+        """한 파티션의 데이터가 바뀐 뒤의 인덱스 (비었으면 항목 제거)"""
+        entries = dict(self.entries)
+        if df.empty:
+            entries.pop(partition, None)
+        else:
+            weeks = df['Week_Start'].astype(str)
+            entries[partition] = (weeks.min(), weeks.max(), len(df), archived)
+        return PartitionIndex(entries)
+
+    def with_archived(self, partition):
+        first, last, rows, _ = self.entries[partition]
+        return PartitionIndex({**self.entries, partition: (first, last, rows, True)})
+
+
+def _week(value):
+    return "" if pd.isna(value) else str(value)[:10]
+
+
+# ---------------------------------------------------------
+# 보관 데이터 (gzip 압축 CSV, 모든 인스턴스가 보도록 저장소 안에 둠)
+# ---------------------------------------------------------
+def archive_worksheet(partition):
+    return REPORT_ARCHIVE_PREFIX + partition
+
+
+def compress_reports(df):
+    """파티션 → gzip 압축 CSV (다시 풀어 행 수를 확인, 원본 삭제 전 확인용)"""
+    data = gzip.compress(df.to_csv(index=False).encode("utf-8"))
+    if len(decompress_reports(data)) != len(df):
+        raise IOError("보관 데이터 확인 실패")
+    return data
+
+
+def decompress_reports(data):
+    return pd.read_csv(io.BytesIO(data), dtype=str, compression="gzip")
+
+
+def archive_frame(data):
+    """압축 데이터 → 시트에 쓸 한 컬럼 표 (셀 크기 제한에 맞춰 나눔)"""
+    text = base64.b64encode(data).decode("ascii")
+    chunks = [text[i:i + ARCHIVE_CHUNK_CHARS] for i in range(0, len(text), ARCHIVE_CHUNK_CHARS)]
+    return pd.DataFrame({ARCHIVE_COLUMN: [ARCHIVE_CHUNK_PREFIX + c for c in chunks]})
+
+
+def archive_data(frame):
+    """archive_frame()으로 쓴 표 → 압축 데이터"""
+    if ARCHIVE_COLUMN not in frame.columns:
+        raise MissingArchiveError("보관 워크시트 형식이 올바르지 않습니다.")
+    chunks = frame[ARCHIVE_COLUMN].dropna().astype(str)
+    return base64.b64decode("".join(c.removeprefix(ARCHIVE_CHUNK_PREFIX) for c in chunks))
@@ -0,0 +1,204 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from settings import PERF_DUMP_DIR, PERF_ENABLED
+
+# 히스토그램 구간 상한 (ms)
+BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf")]
+
+# ---------------------------------------------------------
+# 구간별 시간 측정 (페이지 × 구간 히스토그램, 호출 수, 전송량)
+# ---------------------------------------------------------
+class _Stat:
+    __slots__ = ("count", "total_ms", "max_ms", "bytes", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.bytes = 0
+        self.buckets = [0] * len(BUCKETS_MS)
+
+    def add(self, ms, nbytes):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.bytes += nbytes
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+    def quantile(self, q):
+        """히스토그램 기준 근사값 (해당 구간의 상한, 마지막 구간은 최대값)"""
+        target, seen = q * self.count, 0
+        for upper, n in zip(BUCKETS_MS, self.buckets):
+            seen += n
+            if n and seen >= target:
+                return min(upper, self.max_ms)
+        return self.max_ms
+
+
+class PerfRecorder:
+    """프로세스 전체 측정값 (세션 스크립트 스레드마다 현재 페이지를 따로 기억)"""
+
+    def __init__(self, enabled=PERF_ENABLED):
+        self.enabled = enabled
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._local = threading.local()
+        self._cold = True
+
+    # 페이지
+    def start_rerun(self, page, started=None):
+        """스크립트 실행 시작 (이후 기록은 page로 분류, started는 import 전에 잰 perf_counter 값)"""
+        self._local.page = page
+        self._local.rerun_started = time.perf_counter() if started is None else started
+        self._local.painted = False
+
+    def set_page(self, page):
+        self._local.page = page
+
+    @property
+    def page(self):
+        return getattr(self._local, "page", "background")
+
+    def first_paint(self):
+        """처음 보여 줄 내용을 다 그린 시점까지를 page.first_paint로 기록 (실행당 한 번)
+
+        프로세스의 첫 기록은 모듈 import 시간이 포함되므로 app.cold_start로도 남김.
+        """
+        started = getattr(self._local, "rerun_started", None)
+        if started is None or getattr(self._local, "painted", True):
+            return
+        self._local.painted = True
+        ms = (time.perf_counter() - started) * 1000
+        self.record("page.first_paint", ms)
+        if self._cold:
+            self._cold = False
+            self.record("app.cold_start", ms)
+
+    def end_rerun(self):
+        """start_rerun 이후 스크립트 끝까지 걸린 시간을 page.rerun으로 기록"""
+        started = getattr(self._local, "rerun_started", None)
+        if started is not None:
+            self.record("page.rerun", (time.perf_counter() - started) * 1000)
+            self._local.rerun_started = None
+
+    # 기록
+    @contextmanager
+    def span(self, name, nbytes=0):
+        """with perf.span("sheets.read") as s: ... s.bytes = n 으로 전송량 추가 가능"""
+        if not self.enabled:
+            yield _Span(nbytes)
+            return
+        s = _Span(nbytes)
+        started = time.perf_counter()
+        try:
+            yield s
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000, s.bytes)
+
+    def record(self, name, ms, nbytes=0):
+        if not self.enabled:
+            return
+        key = (self.page, name)
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                stat = self._stats[key] = _Stat()
+            stat.add(ms, nbytes)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+        self.started_at = time.time()
+
+    # 조회/내보내기
+    def rows(self):
+        """패널 표시용 목록 (페이지, 구간, 호출 수, 평균/p50/p95/최대 ms, 바이트)"""
+        with self._lock:
+            items = sorted(self._stats.items())
+            return [
+                {
+                    "페이지": page, "구간": name, "호출 수": s.count,
+                    "평균 ms": round(s.total_ms / s.count, 2), "p50 ms": round(s.quantile(0.5), 2),
+                    "p95 ms": round(s.quantile(0.95), 2), "최대 ms": round(s.max_ms, 2), "바이트": s.bytes,
+                }
+                for (page, name), s in items
+            ]
+
+    def histogram(self, page, name):
+        with self._lock:
+            stat = self._stats.get((page, name))
+            return list(stat.buckets) if stat else [0] * len(BUCKETS_MS)
+
+    def to_json(self):
+        with self._lock:
+            spans = [
+                {"page": page, "span": name, "count": s.count, "total_ms": s.total_ms, "max_ms": s.max_ms,
+                 "bytes": s.bytes, "buckets": dict(zip(map(str, BUCKETS_MS), s.buckets))}
+                for (page, name), s in sorted(self._stats.items())
+            ]
+        return {"started_at": self.started_at, "dumped_at": time.time(), "spans": spans}
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 (히스토그램은 초 단위, 누적 구간)"""
+        lines = [
+            "# HELP promo_span_seconds Time spent in instrumented spans.",
+            "# TYPE promo_span_seconds histogram",
+        ]
+        totals = []
+        with self._lock:
+            items = sorted(self._stats.items())
+        for (page, name), s in items:
+            labels = f'page="{_escape(page)}",span="{_escape(name)}"'
+            cumulative = 0
+            for upper, n in zip(BUCKETS_MS, s.buckets):
+                cumulative += n
+                le = "+Inf" if upper == float("inf") else repr(upper / 1000)
+                lines.append(f'promo_span_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"promo_span_seconds_sum{{{labels}}} {s.total_ms / 1000}")
+            lines.append(f"promo_span_seconds_count{{{labels}}} {s.count}")
+            totals.append(f"promo_span_bytes_total{{{labels}}} {s.bytes}")
+        lines += ["# HELP promo_span_bytes_total Approximate bytes transferred in spans.",
+                  "# TYPE promo_span_bytes_total counter"] + totals
+        return "\n".join(lines) + "\n"
+
+    def dump(self, fmt="json", directory=PERF_DUMP_DIR):
+        """측정값을 파일로 저장하고 경로 반환 (fmt: "json" 또는 "prometheus")"""
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        if fmt == "prometheus":
+            path, text = os.path.join(directory, f"perf-{stamp}.prom"), self.to_prometheus()
+        else:
+            path, text = os.path.join(directory, f"perf-{stamp}.json"), json.dumps(self.to_json(), ensure_ascii=False, indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+
+class _Span:
+    __slots__ = ("bytes",)
+
+    def __init__(self, nbytes=0):
+        self.bytes = nbytes
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def frame_bytes(df):
+    """전송량 근사값: DataFrame 메모리 크기"""
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def values_bytes(rows):
+    """전송량 근사값: 시트에 보내거나 받은 값(2차원 리스트)의 문자 수"""
+    return sum(len(str(v)) for row in rows for v in row)
+
+
+perf = PerfRecorder()
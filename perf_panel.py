@@ -0,0 +1,45 @@
+import pandas as pd
+import streamlit as st
+
+from data_cache import sheet_cache
+from data_service import get_data_service
+from page_utils import safe_rerun
+from perf import BUCKETS_MS, perf
+from report_search import get_report_search
+from rollups import get_rollups
+from settings import WRITE_BEHIND
+from write_queue import get_write_queue
+
+# ---------------------------------------------------------
+# 관리자 페이지 숨김 성능 패널
+# ---------------------------------------------------------
+def render_perf_panel():
+    st.subheader("⏱️ 성능 지표")
+    rows = perf.rows()
+    if not rows:
+        st.caption("아직 기록된 구간이 없습니다.")
+    else:
+        table = pd.DataFrame(rows)
+        st.dataframe(table, hide_index=True, use_container_width=True)
+
+        c_page, c_span = st.columns(2)
+        page = c_page.selectbox("페이지", sorted(table["페이지"].unique()), key="perf_page")
+        span = c_span.selectbox("구간", sorted(table.loc[table["페이지"] == page, "구간"]), key="perf_span")
+        labels = [f"≤{b:g}ms" if b != float("inf") else ">10s" for b in BUCKETS_MS]
+        st.bar_chart(pd.Series(perf.histogram(page, span), index=pd.Index(labels, name="구간(ms)"), name="호출 수"))
+
+    with st.expander("캐시 / 백그라운드 갱신 / 저장 대기열 / 검색 색인 / 집계 상태", expanded=False):
+        st.json({"cache": sheet_cache.stats(), "refresher": get_data_service().stats(),
+                 "writer": get_write_queue().stats() if WRITE_BEHIND else None,
+                 "search": get_report_search().stats(), "rollups": get_rollups().stats()})
+        if WRITE_BEHIND:
+            st.dataframe(get_write_queue().entries(), hide_index=True, use_container_width=True)
+
+    c_json, c_prom, c_reset = st.columns(3)
+    if c_json.button("JSON 파일로 저장", use_container_width=True):
+        st.success(f"저장됨: {perf.dump('json')}")
+    if c_prom.button("Prometheus 텍스트로 저장", use_container_width=True):
+        st.success(f"저장됨: {perf.dump('prometheus')}")
+    if c_reset.button("측정값 초기화", use_container_width=True):
+        perf.reset()
+        safe_rerun()
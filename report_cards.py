@@ -0,0 +1,54 @@
+import pandas as pd
+
+# (Type, 제목, 내용이 없어도 표시할지)
+CARD_SECTIONS = [
+    ("금주 실적", "**✅ 금주 실적**", True),
+    ("차주 계획", "**🗓️ 차주 계획**", True),
+    ("이슈사항", "**⚠️ 이슈 사항**", False),
+]
+STATUS_ICONS = {"정상": "🟢", "지연": "🟡"}  # 그 외는 🔴
+
+# ---------------------------------------------------------
+# 주간 업무 카드 (담당자별 markdown을 한 번에 생성)
+# ---------------------------------------------------------
+def report_lines(reports):
+    """보고서 각 행을 카드에 표시할 한 줄 markdown으로 (행 순서 유지)"""
+    status = reports['Status'].astype(object)
+    icon = status.map(STATUS_ICONS).where(status.isin(list(STATUS_ICONS)), "🔴")
+    project = reports['Project'].astype(object).fillna("-").map(str)
+    tag = ("**[" + project + "]**").where(project != "-", "")
+    content = reports['Content'].astype(object).fillna("").map(str)
+    return icon + " " + tag + " " + content
+
+
+def build_cards(reports):
+    """주차 보고서를 한 번 groupby해서 {담당자: 카드 markdown} 생성 (담당자 이름순)"""
+    if reports.empty:
+        return {}
+    lines = pd.DataFrame({
+        'Assignee': reports['Assignee'].astype(object).map(str).to_numpy(),
+        'Type': reports['Type'].astype(object).to_numpy(),
+        'line': report_lines(reports).to_numpy(),
+    })
+    sections = lines.groupby(['Assignee', 'Type'], sort=False)['line'].agg("  \n".join).to_dict()
+
+    cards = {}
+    for person in sorted(lines['Assignee'].unique()):
+        parts = [f"#### 👤 {person}"]
+        for type_, title, always in CARD_SECTIONS:
+            body = sections.get((person, type_))
+            if body is None and not always:
+                continue
+            if len(parts) > 1:
+                parts.append("---")
+            parts.append(title)
+            parts.append(body if body is not None else ":gray[내용 없음]")
+        cards[person] = "\n\n".join(parts)
+    return cards
+
+
+def page_of(items, page, page_size):
+    """page(1부터)에 해당하는 항목과 전체 페이지 수"""
+    pages = max(1, -(-len(items) // page_size))
+    page = min(max(page, 1), pages)
+    return items[(page - 1) * page_size:page * page_size], pages
@@ -0,0 +1,306 @@
+import math
+import re
+import threading
+import time
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from data_service import get_data_service
+from settings import SEARCH_COMPACT_POSTINGS, SEARCH_MAX_RESULTS, SEARCH_REBUILD_SECONDS, WRITE_BEHIND
+from storage import REPORT_COLUMNS
+from write_queue import get_write_queue
+
+SEARCH_FIELDS = ("Content", "Project", "Type", "Status")
+RESULT_COLUMNS = ["Week_Start", "Assignee", "Type", "Project", "Status", "Content"]
+BM25_K1, BM25_B = 1.2, 0.75
+_WORD = re.compile(r"\w+")
+
+# ---------------------------------------------------------
+# 주간 보고 전문 검색 (글자 2-gram 역색인)
+# ---------------------------------------------------------
+def normalize(text):
+    return unicodedata.normalize("NFKC", str(text)).lower()
+
+
+def terms(text):
+    """검색어/문서를 단어로 나눔 (한글은 형태소 분석 없이 글자 n-gram으로 처리)"""
+    return _WORD.findall(normalize(text))
+
+
+def grams(term):
+    """단어의 글자 2-gram (한 글자 단어는 색인하지 않고 검색 시 직접 비교)"""
+    return {term[i:i + 2] for i in range(len(term) - 1)}
+
+
+def _doc_grams(text):
+    found = set()
+    for term in terms(text):
+        found |= grams(term)
+    return found
+
+
+def _build_postings(texts):
+    """전체 문서의 2-gram → 행 번호 배열 (단어 단위로 n-gram을 한 번만 만들고 나머지는 numpy로)"""
+    words = pd.Series(texts, dtype=object).str.findall(_WORD.pattern).explode().dropna()
+    if words.empty:
+        return {}
+    docs = words.index.to_numpy(dtype=np.int64)
+    codes, uniques = pd.factorize(words.to_numpy())
+    gram_ids = {}
+    word_grams = [[gram_ids.setdefault(g, len(gram_ids)) for g in grams(w)] for w in uniques]
+    lens = np.array([len(g) for g in word_grams], dtype=np.int64)
+    flat = np.fromiter((g for gs in word_grams for g in gs), dtype=np.int64, count=int(lens.sum()))
+    offsets = np.concatenate([[0], np.cumsum(lens)[:-1]])
+
+    # (행, 단어) → 단어의 2-gram마다 (gram, 행)으로 펼친 뒤 중복 제거 (gram, 행 순으로 정렬됨)
+    counts = lens[codes]
+    total = int(counts.sum())
+    if not total:
+        return {}
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    rows = np.repeat(docs, counts)
+    pairs = np.sort(flat[np.repeat(offsets[codes], counts) + np.arange(total) - first] * len(texts) + rows)
+    pairs = pairs[np.concatenate([[True], pairs[1:] != pairs[:-1]])]
+    gram_of, doc_of = pairs // len(texts), (pairs % len(texts)).astype(np.int32)
+    bounds = np.flatnonzero(np.diff(gram_of)) + 1
+    names = list(gram_ids)
+    return {names[gram_of[start]]: block for start, block in zip(np.concatenate([[0], bounds]), np.split(doc_of, bounds))}
+
+
+class ReportSearchIndex:
+    """보고서 행 단위 역색인
+
+    - postings: 2-gram → 행 번호(정렬된 numpy 배열), 이후 저장분은 delta(리스트)에 추가
+    - 저장으로 바뀐 (Week_Start, Assignee)의 이전 행은 alive=False로만 표시
+    - 후보는 2-gram 교집합으로 좁힌 뒤 원문 포함 여부로 확인하고 BM25로 점수 계산
+    """
+
+    def __init__(self, df):
+        df = df.reindex(columns=REPORT_COLUMNS)
+        self.values = {c: df[c].astype(object).where(df[c].notna(), "").astype(str).tolist() for c in RESULT_COLUMNS}
+        self.texts = []
+        self.lengths = []
+        self.alive = np.zeros(0, dtype=bool)
+        self.by_key = {}
+        self.delta = {}
+        self.delta_size = 0
+        self.built_at = time.time()
+        self._arrays = None
+        self.postings = _build_postings(self._add_texts(0, len(df)))
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    def _add_texts(self, start, end):
+        """start~end 행의 검색용 텍스트/길이/key 등록"""
+        fields = [self.values[c][start:end] for c in SEARCH_FIELDS]
+        texts = [normalize(" ".join(v)) for v in zip(*fields)]
+        self.texts += texts
+        self.lengths += [len(t) for t in texts]
+        self.alive = np.concatenate([self.alive, np.ones(len(texts), dtype=bool)])
+        for doc, key in enumerate(zip(self.values["Week_Start"][start:end], self.values["Assignee"][start:end]), start):
+            self.by_key.setdefault(key, []).append(doc)
+        self._arrays = None
+        return texts
+
+    # 갱신
+    def update(self, key, df):
+        """(Week_Start, Assignee) 보고서를 새 행으로 교체 (이전 행은 삭제 표시, 새 행은 delta에 추가)"""
+        key = (str(key[0]), str(key[1]))
+        for doc in self.by_key.pop(key, []):
+            self.alive[doc] = False
+        df = df.reindex(columns=REPORT_COLUMNS)
+        start = len(self.texts)
+        for c in RESULT_COLUMNS:
+            self.values[c] += df[c].astype(object).where(df[c].notna(), "").astype(str).tolist()
+        for doc, text in enumerate(self._add_texts(start, start + len(df)), start):
+            for g in _doc_grams(text):
+                self.delta.setdefault(g, []).append(doc)
+                self.delta_size += 1
+        if self.delta_size > SEARCH_COMPACT_POSTINGS:
+            self.compact()
+
+    def compact(self):
+        """delta를 기본 postings에 합침 (delta 행 번호가 항상 더 크므로 이어 붙이면 정렬 유지)"""
+        for g, docs in self.delta.items():
+            base = self.postings.get(g)
+            new = np.asarray(docs, dtype=np.int32)
+            self.postings[g] = new if base is None else np.concatenate([base, new])
+        self.delta = {}
+        self.delta_size = 0
+
+    # 검색
+    def search(self, query, assignees=None, week_from=None, week_to=None, types=None, statuses=None,
+               limit=SEARCH_MAX_RESULTS):
+        """검색어의 모든 단어를 포함하는 행을 점수순으로 (검색어가 없으면 조건에 맞는 최근 주부터)"""
+        query_terms = list(dict.fromkeys(terms(query)))
+        matches = [self._docs_with(term) for term in query_terms]
+        if matches:
+            docs = matches[0]
+            for found in matches[1:]:
+                docs = np.intersect1d(docs, found, assume_unique=True)
+        else:
+            docs = np.arange(len(self.texts))
+        docs = docs[self.alive[docs]]
+
+        arrays = self._filter_arrays()
+        keep = np.ones(len(docs), dtype=bool)
+        if week_from is not None:
+            keep &= arrays["Week_Start"][docs] >= str(week_from)
+        if week_to is not None:
+            keep &= arrays["Week_Start"][docs] <= str(week_to)
+        for col, selected in (("Assignee", assignees), ("Type", types), ("Status", statuses)):
+            if selected:
+                keep &= np.isin(arrays[col][docs], [str(v) for v in selected])
+        docs = docs[keep]
+
+        weeks = arrays["Week_Start"][docs]
+        if query_terms:
+            scores = self._bm25(docs, query_terms, [len(m) for m in matches])
+            order = np.lexsort((weeks, scores))[::-1]  # 점수, 같으면 최근 주
+        else:
+            scores = np.zeros(len(docs))
+            order = np.argsort(weeks, kind="stable")[::-1]
+        order = order[:limit]
+        result = pd.DataFrame({c: [self.values[c][d] for d in docs[order]] for c in RESULT_COLUMNS})
+        result["점수"] = np.round(scores[order], 2)
+        result.attrs["total"] = len(docs)
+        return result
+
+    def _docs_with(self, term):
+        """term을 포함하는 행 번호 (정렬됨)"""
+        if len(term) < 2:
+            return np.flatnonzero([term in t for t in self.texts])
+        postings = sorted((self._posting(g) for g in grams(term)), key=len)  # 짧은 목록부터 교집합
+        docs = postings[0]
+        for posting in postings[1:]:
+            if not len(docs):
+                break
+            docs = np.intersect1d(docs, posting, assume_unique=True)
+        if len(postings) > 1 and len(docs):
+            # 2-gram이 모두 있어도 붙어 있지 않을 수 있으므로 원문으로 확인
+            docs = docs[np.fromiter((term in self.texts[d] for d in docs), dtype=bool, count=len(docs))]
+        return docs
+
+    def _posting(self, gram):
+        base = self.postings.get(gram)
+        extra = self.delta.get(gram)
+        if extra is None:
+            return base if base is not None else np.zeros(0, dtype=np.int32)
+        extra = np.asarray(extra, dtype=np.int32)
+        return extra if base is None else np.concatenate([base, extra])
+
+    def _bm25(self, docs, query_terms, doc_freqs):
+        n = max(len(self.texts), 1)
+        avg = (sum(self.lengths) / n) or 1.0
+        lengths = np.asarray([self.lengths[d] for d in docs], dtype=float)
+        scores = np.zeros(len(docs))
+        for term, df in zip(query_terms, doc_freqs):
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            tf = np.asarray([self.texts[d].count(term) for d in docs], dtype=float)
+            scores += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg))
+        return scores
+
+    def _filter_arrays(self):
+        if self._arrays is None:
+            self._arrays = {c: np.asarray(self.values[c], dtype=object) for c in ("Week_Start", "Assignee", "Type", "Status")}
+        return self._arrays
+
+
+# ---------------------------------------------------------
+# 프로세스 공용 색인
+# ---------------------------------------------------------
+def _load_all_reports():
+    df = get_data_service().reports()
+    if WRITE_BEHIND:
+        df = get_write_queue().overlay_reports(df, lambda key: True)
+    return df
+
+
+class ReportSearch:
+    """처음 검색할 때 색인을 만들고 모든 세션이 공유
+
+    - 저장된 보고서는 update()로 바로 반영 (색인 전체를 다시 만들지 않음)
+    - max_age가 지나면 다른 곳(시트 직접 수정 등)의 변경을 위해 백그라운드에서 새로 만들고,
+      그동안은 기존 색인으로 검색하며 사이에 들어온 update()는 새 색인에 다시 적용
+    """
+
+    def __init__(self, loader=_load_all_reports, max_age=SEARCH_REBUILD_SECONDS):
+        self.loader = loader
+        self.max_age = max_age
+        self._index = None
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._replay = None
+        self.last_build_ms = None
+
+    def index(self):
+        if self._index is None:
+            with self._build_lock:
+                if self._index is None:
+                    self._build()
+        elif self.max_age > 0 and time.time() - self._index.built_at > self.max_age and self._replay is None:
+            threading.Thread(target=self._rebuild, name="promo-search-rebuild", daemon=True).start()
+        return self._index
+
+    def search(self, query, **filters):
+        index = self.index()
+        with self._lock:
+            return index.search(query, **filters)
+
+    def update(self, key, df):
+        with self._lock:
+            if self._index is not None:
+                self._index.update(key, df)
+            if self._replay is not None:
+                self._replay.append((key, df))
+
+    def stats(self):
+        index = self._index
+        return {
+            "rows": None if index is None else len(index),
+            "grams": None if index is None else len(index.postings),
+            "delta": None if index is None else index.delta_size,
+            "built_at": None if index is None else index.built_at,
+            "build_ms": self.last_build_ms,
+        }
+
+    def _build(self):
+        with self._lock:
+            self._replay = []
+        try:
+            started = time.perf_counter()
+            index = ReportSearchIndex(self.loader())
+            self.last_build_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                for key, df in self._replay:
+                    index.update(key, df)
+                self._index = index
+        finally:
+            with self._lock:
+                self._replay = None
+
+    def _rebuild(self):
+        if not self._build_lock.acquire(blocking=False):
+            return
+        try:
+            self._build()
+        except Exception:
+            self._index.built_at = time.time()  # 실패하면 기존 색인을 계속 쓰고 다음 주기에 다시 시도
+        finally:
+            self._build_lock.release()
+
+
+_search = None
+_search_lock = threading.Lock()
+
+
+def get_report_search():
+    global _search
+    if _search is None:
+        with _search_lock:
+            if _search is None:
+                _search = ReportSearch()
+    return _search
@@ -0,0 +1,273 @@
+import datetime
+import threading
+import time
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+import local_db
+from filter_index import DONE_STATUS
+from frame_diff import diff_frames
+from settings import ROLLUP_PATH
+
+NO_VALUE = "-"  # 채널/상태/담당자가 비어 있는 행
+GROUP_COLUMNS = ("채널", "상태", "진척율")  # 추가/삭제되면 모든 행의 집계가 바뀌는 컬럼
+
+# ---------------------------------------------------------
+# 주간 집계 (저장할 때마다 변경분만 반영하는 로컬 SQLite 집계표)
+# ---------------------------------------------------------
+def week_of(day=None):
+    """날짜가 속한 주의 월요일 ('2026-10-12')"""
+    day = day or datetime.date.today()
+    return str(day - datetime.timedelta(days=day.weekday()))
+
+
+def _labels(df, col):
+    if col not in df.columns:
+        return pd.Series(NO_VALUE, index=df.index, dtype=object)
+    return df[col].astype(object).where(df[col].notna(), NO_VALUE).astype(str)
+
+
+def _progress(df):
+    if "진척율" not in df.columns:
+        return pd.Series(0.0, index=df.index)
+    return pd.to_numeric(df["진척율"], errors="coerce").fillna(0).astype(float)
+
+
+def promotion_groups(df):
+    """(채널, 상태)별 건수와 진척율 합계"""
+    frame = pd.DataFrame({"channel": _labels(df, "채널"), "status": _labels(df, "상태"), "progress": _progress(df)})
+    return frame.groupby(["channel", "status"]).agg(n=("progress", "size"), progress_sum=("progress", "sum"))
+
+
+def _weeks(week_from, week_to):
+    return [str(d.date()) for d in pd.date_range(pd.Timestamp(str(week_from)), pd.Timestamp(str(week_to)), freq="7D")]
+
+
+class RollupStore:
+    """대시보드 지표/추이용 집계표
+
+    - report_counts: 주 × 담당자 × Status 행 수 (보고서 저장 시 그 (주, 담당자)만 다시 셈)
+    - promotion_counts: 주 × 채널 × 상태 건수/진척율 합계, 그 주 마지막 저장 시점의 스냅샷
+      (저장 시 바뀐 행의 이전/새 값 차이만 더하고, 새 주의 첫 저장이면 지난 스냅샷을 이어받음)
+    - promotion_progress: 주 × 프로모션 진척율/상태 (그 주에 바뀐 프로모션만)
+    - 조회는 주 수 × 그룹 수에 비례 (원본 행 수와 무관), 빈 주는 직전 스냅샷으로 채움
+    """
+
+    def __init__(self, path=ROLLUP_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        local_db.ensure_dir(path)
+        self._init_schema()
+
+    def _connect(self):
+        return local_db.connect(self.path)
+
+    def _init_schema(self):
+        with closing(self._connect()) as con, con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS report_counts (week TEXT NOT NULL, assignee TEXT NOT NULL, "
+                "status TEXT NOT NULL, n INTEGER NOT NULL, PRIMARY KEY (week, assignee, status))"
+            )
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS promotion_counts (week TEXT NOT NULL, channel TEXT NOT NULL, "
+                "status TEXT NOT NULL, n INTEGER NOT NULL, progress_sum REAL NOT NULL, PRIMARY KEY (week, channel, status))"
+            )
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS promotion_progress (week TEXT NOT NULL, name TEXT NOT NULL, "
+                "progress REAL, status TEXT, PRIMARY KEY (week, name))"
+            )
+            con.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    # 주간 보고
+    def apply_report(self, key, df):
+        """(Week_Start, Assignee) 보고서 저장 반영 (그 key의 집계만 교체)"""
+        week, assignee = str(key[0]), str(key[1])
+        counts = _labels(df, "Status").value_counts()
+        with self._lock, closing(self._connect()) as con, con:
+            con.execute("DELETE FROM report_counts WHERE week = ? AND assignee = ?", (week, assignee))
+            con.executemany("INSERT INTO report_counts VALUES (?, ?, ?, ?)",
+                            [(week, assignee, status, int(n)) for status, n in counts.items()])
+
+    def rebuild_reports(self, df):
+        """전체 주간 보고로 report_counts를 새로 만듦"""
+        frame = pd.DataFrame({"week": _labels(df, "Week_Start"), "assignee": _labels(df, "Assignee"),
+                              "status": _labels(df, "Status")})
+        counts = frame.value_counts().reset_index(name="n")
+        with self._lock, closing(self._connect()) as con, con:
+            con.execute("DELETE FROM report_counts")
+            con.executemany("INSERT INTO report_counts VALUES (?, ?, ?, ?)",
+                            [(w, a, s, int(n)) for w, a, s, n in counts.itertuples(index=False)])
+            con.execute("INSERT OR REPLACE INTO meta VALUES ('reports_built_at', ?)", (str(time.time()),))
+
+    def reports_built(self):
+        with closing(self._connect()) as con:
+            return con.execute("SELECT 1 FROM meta WHERE key = 'reports_built_at'").fetchone() is not None
+
+    # 프로모션
+    def apply_promotions(self, base, frame, diff=None, today=None):
+        """프로모션 저장 반영 (base 스냅샷 대비 바뀐 행의 이전 값은 빼고 새 값은 더함)"""
+        diff = diff if diff is not None else diff_frames(base, frame)
+        if diff.empty:
+            return
+        if diff.rewrite or base.empty or set(GROUP_COLUMNS) & set(diff.added_cols + diff.dropped_cols):
+            self.snapshot_promotions(frame, today)
+            return
+        changed = [label for label in diff.updated if label in frame.index]
+        old = base.loc[list(diff.updated) + list(diff.deleted)]
+        new = pd.concat([frame.loc[changed], diff.inserted.reindex(columns=frame.columns)])
+        delta = promotion_groups(new).sub(promotion_groups(old), fill_value=0)
+        delta = delta[(delta["n"] != 0) | (delta["progress_sum"] != 0)]
+
+        week = week_of(today)
+        with self._lock, closing(self._connect()) as con, con:
+            con.execute("BEGIN IMMEDIATE")
+            self._carry_forward(con, week)
+            con.executemany(
+                "INSERT INTO promotion_counts VALUES (?, ?, ?, ?, ?) ON CONFLICT (week, channel, status) "
+                "DO UPDATE SET n = n + excluded.n, progress_sum = progress_sum + excluded.progress_sum",
+                [(week, channel, status, int(n), float(p)) for (channel, status), n, p
+                 in zip(delta.index, delta["n"], delta["progress_sum"])],
+            )
+            con.execute("DELETE FROM promotion_counts WHERE week = ? AND n <= 0", (week,))
+            self._record_progress(con, week, new)
+
+    def snapshot_promotions(self, df, today=None):
+        """현재 프로모션 전체로 이번 주 스냅샷을 새로 만듦 (처음 집계하거나 원본이 직접 수정된 경우)"""
+        week = week_of(today)
+        groups = promotion_groups(df)
+        with self._lock, closing(self._connect()) as con, con:
+            con.execute("DELETE FROM promotion_counts WHERE week = ?", (week,))
+            con.executemany("INSERT INTO promotion_counts VALUES (?, ?, ?, ?, ?)",
+                            [(week, channel, status, int(n), float(p)) for (channel, status), n, p
+                             in zip(groups.index, groups["n"], groups["progress_sum"])])
+            self._record_progress(con, week, df)
+
+    def reconcile(self, df, index, today=None):
+        """이번 스냅샷의 지표가 FilterIndex(원본 기준)와 다르면 다시 만듦, 다시 만들었으면 True"""
+        metrics = self.metrics(today)
+        # FilterIndex는 빈 값을 str(NaN)으로 셈
+        expected = {(NO_VALUE if k == "nan" else k): v for k, v in index.status_counts.items() if v}
+        if (metrics is not None and metrics["total"] == index.n and metrics["status_counts"] == expected
+                and abs(metrics["active_progress_mean"] - index.active_progress_mean) < 1e-6):
+            return False
+        self.snapshot_promotions(df, today)
+        return True
+
+    def _carry_forward(self, con, week):
+        """이번 주 스냅샷이 없으면 직전 주 스냅샷을 복사"""
+        if con.execute("SELECT 1 FROM promotion_counts WHERE week = ? LIMIT 1", (week,)).fetchone():
+            return
+        con.execute(
+            "INSERT INTO promotion_counts SELECT ?, channel, status, n, progress_sum FROM promotion_counts "
+            "WHERE week = (SELECT MAX(week) FROM promotion_counts WHERE week < ?)", (week, week)
+        )
+
+    def _record_progress(self, con, week, df):
+        if "프로모션명" not in df.columns or df.empty:
+            return
+        rows = zip(_labels(df, "프로모션명"), _progress(df), _labels(df, "상태"))
+        con.executemany("INSERT OR REPLACE INTO promotion_progress VALUES (?, ?, ?, ?)",
+                        [(week, name, float(p), status) for name, p, status in rows if name != NO_VALUE])
+
+    # 조회
+    def metrics(self, today=None):
+        """가장 최근 스냅샷의 전체/상태별 건수와 완료 제외 평균 진척율 (스냅샷이 없으면 None)"""
+        with closing(self._connect()) as con:
+            rows = con.execute(
+                "SELECT status, SUM(n), SUM(progress_sum) FROM promotion_counts "
+                "WHERE week = (SELECT MAX(week) FROM promotion_counts WHERE week <= ?) GROUP BY status",
+                (week_of(today),),
+            ).fetchall()
+        if not rows:
+            return None
+        active = [(n, p) for status, n, p in rows if status != DONE_STATUS]
+        active_n = sum(n for n, _ in active)
+        return {
+            "total": sum(n for _, n, _ in rows),
+            "status_counts": {status: n for status, n, _ in rows if n},
+            "active_progress_mean": sum(p for _, p in active) / active_n if active_n else 0.0,
+        }
+
+    def promotion_trend(self, week_from, week_to, by="status"):
+        """주별 건수 (by: "status" 또는 "channel" 별 컬럼), 저장이 없던 주는 직전 스냅샷"""
+        snapshots = self._snapshots(week_from, week_to)
+        if snapshots.empty:
+            return pd.DataFrame(index=pd.Index(_weeks(week_from, week_to), name="주"))
+        return snapshots.pivot_table(index="week", columns=by, values="n", aggfunc="sum", fill_value=0) \
+            .pipe(self._fill_weeks, week_from, week_to)
+
+    def progress_trend(self, week_from, week_to):
+        """주별 평균 진척율 (완료 제외)"""
+        snapshots = self._snapshots(week_from, week_to)
+        if snapshots.empty:
+            return pd.Series(index=pd.Index(_weeks(week_from, week_to), name="주"), dtype=float, name="평균 진척율")
+        active = snapshots[snapshots["status"] != DONE_STATUS].groupby("week")[["n", "progress_sum"]].sum()
+        mean = (active["progress_sum"] / active["n"].replace(0, np.nan)).rename("평균 진척율")
+        return self._fill_weeks(mean.to_frame(), week_from, week_to)["평균 진척율"]
+
+    def progress_history(self, name, week_from, week_to):
+        """프로모션 하나의 주별 진척율 (바뀐 주에만 기록되므로 사이 주는 직전 값)"""
+        with closing(self._connect()) as con:
+            rows = con.execute(
+                "SELECT week, progress FROM promotion_progress WHERE name = ? AND week <= ? AND week >= "
+                "COALESCE((SELECT MAX(week) FROM promotion_progress WHERE name = ? AND week <= ?), '') ORDER BY week",
+                (str(name), str(week_to), str(name), str(week_from)),
+            ).fetchall()
+        frame = pd.DataFrame(rows, columns=["week", "진척율"]).set_index("week")
+        return self._fill_weeks(frame, week_from, week_to)["진척율"]
+
+    def report_counts(self, week_from, week_to, statuses=None, by="assignee"):
+        """주별 보고서 행 수 (by: "assignee" 또는 "status" 별 컬럼, statuses로 Status 제한)"""
+        sql = "SELECT week, assignee, status, n FROM report_counts WHERE week BETWEEN ? AND ?"
+        params = [str(week_from), str(week_to)]
+        if statuses:
+            sql += f" AND status IN ({', '.join('?' * len(statuses))})"
+            params += [str(s) for s in statuses]
+        with closing(self._connect()) as con:
+            rows = con.execute(sql, params).fetchall()
+        frame = pd.DataFrame(rows, columns=["week", "assignee", "status", "n"])
+        table = frame.pivot_table(index="week", columns=by, values="n", aggfunc="sum", fill_value=0)
+        weeks = pd.Index(_weeks(week_from, week_to), name="주")
+        return table.reindex(weeks, fill_value=0).rename_axis(columns=None)
+
+    def _snapshots(self, week_from, week_to):
+        """기간 안의 스냅샷 + 기간 시작 직전 스냅샷 (첫 주를 채우는 용도)"""
+        with closing(self._connect()) as con:
+            rows = con.execute(
+                "SELECT week, channel, status, n, progress_sum FROM promotion_counts WHERE week <= ? AND week >= "
+                "COALESCE((SELECT MAX(week) FROM promotion_counts WHERE week <= ?), '')",
+                (str(week_to), str(week_from)),
+            ).fetchall()
+        return pd.DataFrame(rows, columns=["week", "channel", "status", "n", "progress_sum"])
+
+    @staticmethod
+    def _fill_weeks(frame, week_from, week_to):
+        weeks = _weeks(week_from, week_to)
+        grid = frame.reindex(sorted(set(frame.index) | set(weeks))).ffill()
+        return grid.reindex(weeks).rename_axis(index="주", columns=None)
+
+    # 관리
+    def clear(self):
+        with self._lock, closing(self._connect()) as con, con:
+            for table in ("report_counts", "promotion_counts", "promotion_progress", "meta"):
+                con.execute(f"DELETE FROM {table}")
+
+    def stats(self):
+        with closing(self._connect()) as con:
+            return {table: con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    for table in ("report_counts", "promotion_counts", "promotion_progress")}
+
+
+_rollups = None
+_rollups_lock = threading.Lock()
+
+
+def get_rollups():
+    global _rollups
+    if _rollups is None:
+        with _rollups_lock:
+            if _rollups is None:
+                _rollups = RollupStore()
+    return _rollups
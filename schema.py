@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+# pandas 3부터는 항상 Copy-on-Write. 이전 버전에서도 켜서
+# 얕은 복사본(draft 등)이 수정 전까지 공유 base의 메모리를 그대로 쓰도록 함
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+try:
+    import pyarrow  # noqa: F401
+    TEXT_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    TEXT_DTYPE = pd.StringDtype()
+
+# ---------------------------------------------------------
+# 컬럼 스키마 (열거형은 categorical, 날짜는 datetime64, 진척율은 int8)
+# ---------------------------------------------------------
+PROMOTION_STATUSES = ["기획단계", "대기", "진행중", "완료", "보류"]
+PROMOTION_CHANNELS = ["On Trade", "Off Trade", "기타"]
+REPORT_TYPES = ["금주 실적", "차주 계획", "이슈사항"]
+REPORT_STATUSES = ["정상", "지연", "중단"]
+
+PROMOTION_CATEGORIES = {"상태": PROMOTION_STATUSES, "채널": PROMOTION_CHANNELS, "담당자": []}
+PROMOTION_DATES = ("시작일", "종료일")
+PROMOTION_TEXT = ("프로모션명",)
+
+# Week_Start는 행 key이자 시트 값이므로 날짜 대신 문자열 범주로 유지
+REPORT_CATEGORIES = {"Week_Start": [], "Assignee": [], "Project": [], "Type": REPORT_TYPES, "Status": REPORT_STATUSES}
+REPORT_TEXT = ("Content",)
+
+
+def _categorical(series, known):
+    """알려진 값 순서를 앞에 두고, 그 외 실제 값은 뒤에 정렬해서 붙인 범주형"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    observed = series.dropna().astype(str)
+    series = series.where(series.isna(), observed)
+    extra = sorted(set(observed.unique()) - set(known))
+    return series.astype(pd.CategoricalDtype(list(known) + extra))
+
+
+def _text(series):
+    return series.astype(object).where(series.notna(), None).astype(TEXT_DTYPE)
+
+
+def conform_promotions(df):
+    """프로모션 DataFrame을 스키마 dtype으로 변환"""
+    for col, known in PROMOTION_CATEGORIES.items():
+        if col in df.columns:
+            df[col] = _categorical(df[col], known)
+    for col in PROMOTION_DATES:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce').astype("datetime64[ns]")
+    if '진척율' in df.columns:
+        df['진척율'] = pd.to_numeric(df['진척율'], errors='coerce').fillna(0).clip(0, 100).astype("int8")
+    for col in PROMOTION_TEXT:
+        if col in df.columns:
+            df[col] = _text(df[col])
+    return df
+
+
+ISSUE_COLUMNS = ["행", "컬럼", "값", "사유"]
+
+
+def _issues(lines, col, values, mask, reason):
+    mask = mask.to_numpy(dtype=bool)
+    return pd.DataFrame({"행": lines[mask], "컬럼": col, "값": values.to_numpy(dtype=object)[mask], "사유": reason})
+
+
+def _parse_dates(raw):
+    """대부분 같은 형식이라 한 번에 변환하고, 실패한 값만 형식 추정으로 다시 시도"""
+    parsed = pd.to_datetime(raw, errors='coerce')
+    retry = parsed.isna() & raw.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(raw[retry], errors='coerce', format='mixed')
+    return parsed
+
+
+def validate_promotions(df, first_line=2):
+    """원본(문자열) 프로모션 데이터를 벡터 연산으로 검사하고 스키마 dtype으로 변환
+
+    first_line: df 첫 행의 원본 행 번호 (헤더가 1행)
+    반환: (변환된 df, 문제 목록 DataFrame[행, 컬럼, 값, 사유])
+    """
+    lines = np.arange(first_line, first_line + len(df))
+    found = []
+    if '프로모션명' in df.columns:
+        name = df['프로모션명']
+        found.append(_issues(lines, '프로모션명', name, name.isna() | (name.astype(str).str.strip() == ""), "프로모션명 없음"))
+    if '진척율' in df.columns:
+        raw = df['진척율']
+        text = raw.astype(object).where(raw.isna(), raw.astype(str).str.replace('%', '').str.strip())
+        number = pd.to_numeric(text, errors='coerce')
+        found.append(_issues(lines, '진척율', raw, number.isna() & text.notna() & (text != ""), "숫자가 아님 (0으로 처리)"))
+        found.append(_issues(lines, '진척율', raw, (number < 0) | (number > 100), "0~100 범위 밖 (잘라냄)"))
+        df['진척율'] = number
+    raw_end = df.get('종료일')
+    for col in PROMOTION_DATES:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            raw = df[col]
+            filled = raw.notna() & (raw.astype(str).str.strip() != "")
+            parsed = _parse_dates(raw.where(filled))
+            found.append(_issues(lines, col, raw, parsed.isna() & filled, "날짜 형식 오류"))
+            df[col] = parsed
+    if '상태' in df.columns:
+        status = df['상태']
+        found.append(_issues(lines, '상태', status, status.notna() & ~status.isin(PROMOTION_STATUSES), "알 수 없는 상태"))
+    if all(c in df.columns for c in PROMOTION_DATES):
+        start, end = (pd.to_datetime(df[c], errors='coerce') for c in PROMOTION_DATES)
+        found.append(_issues(lines, '종료일', raw_end, end < start, "종료일이 시작일보다 빠름"))
+
+    issues = pd.concat(found, ignore_index=True) if found else pd.DataFrame(columns=ISSUE_COLUMNS)
+    return conform_promotions(df), issues.sort_values("행", kind="stable", ignore_index=True)
+
+
+def conform_reports(df):
+    """주간 보고 DataFrame을 스키마 dtype으로 변환"""
+    for col, known in REPORT_CATEGORIES.items():
+        if col in df.columns:
+            df[col] = _categorical(df[col], known)
+    for col in REPORT_TEXT:
+        if col in df.columns:
+            df[col] = _text(df[col])
+    return df
+
+
+def to_plain(df):
+    """편집기 입력용: 범주형을 일반 문자열 컬럼으로 (새 값을 자유롭게 넣을 수 있도록)"""
+    cats = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not cats:
+        return df
+    return df.astype({c: object for c in cats})
@@ -0,0 +1,66 @@
+import os
+
+# ---------------------------------------------------------
+# 앱 설정 (환경 변수로 덮어쓰기 가능)
+# ---------------------------------------------------------
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+# 워크시트 읽기 캐시
+CACHE_MAX_ENTRIES = _env_int("PROMO_CACHE_MAX_ENTRIES", 8)
+CACHE_MAX_BYTES = _env_int("PROMO_CACHE_MAX_MB", 256) * 1024 * 1024
+CACHE_TTL_SECONDS = _env_int("PROMO_CACHE_TTL", 60)  # 시트를 직접 수정한 경우를 위한 최대 보관 시간
+
+# 저장소 ("gsheets" 또는 "sqlite")
+STORAGE_BACKEND = os.environ.get("PROMO_STORAGE", "gsheets").lower()
+DATA_DIR = os.environ.get("PROMO_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+SQLITE_PATH = os.environ.get("PROMO_SQLITE_PATH", os.path.join(DATA_DIR, "promo.sqlite3"))
+SQLITE_SYNC_GSHEETS = os.environ.get("PROMO_SYNC_GSHEETS", "0") == "1"  # 로컬 저장 후 구글 시트에도 반영
+
+# 주간 업무 카드 뷰
+CARD_PAGE_SIZE = _env_int("PROMO_CARD_PAGE_SIZE", 20)  # 한 페이지에 그리는 담당자 카드 수
+CARD_RENDER_BUDGET_MS = _env_int("PROMO_CARD_BUDGET_MS", 300)  # 이보다 오래 걸리면 화면에 표시
+
+# CSV 가져오기
+IMPORT_CHUNK_ROWS = _env_int("PROMO_IMPORT_CHUNK_ROWS", 20000)  # 한 번에 읽어서 검사하는 행 수
+
+# 내보내기 (데이터 해시별로 파일을 만들어 두고 재사용)
+EXPORT_DIR = os.environ.get("PROMO_EXPORT_DIR", os.path.join(DATA_DIR, "exports"))
+EXPORT_MAX_FILES = _env_int("PROMO_EXPORT_MAX_FILES", 20)
+EXPORT_CHUNK_ROWS = _env_int("PROMO_EXPORT_CHUNK_ROWS", 20000)  # 한 번에 변환해서 쓰는 행 수
+
+# 백그라운드 갱신 (모든 세션이 공유하는 데이터를 주기적으로 새로 읽음)
+REFRESH_SECONDS = _env_int("PROMO_REFRESH_SECONDS", 30)  # CACHE_TTL_SECONDS보다 짧게
+REFRESH_MAX_BACKOFF_SECONDS = _env_int("PROMO_REFRESH_MAX_BACKOFF", 600)  # 실패가 이어질 때 최대 간격
+
+# 성능 측정 (관리자 페이지의 숨김 패널: ?perf=1)
+PERF_ENABLED = os.environ.get("PROMO_PERF", "1") != "0"
+PERF_DUMP_DIR = os.environ.get("PROMO_PERF_DUMP_DIR", os.path.join(DATA_DIR, "perf"))
+
+# 관리자 데이터 편집기
+EDITOR_PAGE_SIZE = _env_int("PROMO_EDITOR_PAGE_SIZE", 100)  # 한 번에 편집기로 보내는 행 수
+
+# 주간 보고 분기 파티션 (오래된 분기는 압축해서 시트/DB 안에 보관)
+REPORT_KEEP_QUARTERS = _env_int("PROMO_REPORT_KEEP_QUARTERS", 4)  # 이번 분기를 포함해 시트/DB에 남겨 두는 분기 수
+
+# 저장 대기열 (로컬 저널에 먼저 기록하고 백그라운드에서 저장소에 반영)
+WRITE_BEHIND = os.environ.get("PROMO_WRITE_BEHIND", "1") != "0"
+WRITE_QUEUE_PATH = os.environ.get("PROMO_WRITE_QUEUE_PATH", os.path.join(DATA_DIR, "write_queue.sqlite3"))
+FLUSH_SECONDS = _env_int("PROMO_FLUSH_SECONDS", 2)  # 이 시간 동안 들어온 저장을 모아서 반영
+FLUSH_MAX_BACKOFF_SECONDS = _env_int("PROMO_FLUSH_MAX_BACKOFF", 300)  # 실패가 이어질 때 최대 재시도 간격
+WRITE_QUEUE_KEEP_SECONDS = _env_int("PROMO_WRITE_QUEUE_KEEP", 7 * 24 * 3600)  # 반영 완료 기록 보관 기간
+
+# 주간 보고 검색 색인
+SEARCH_REBUILD_SECONDS = _env_int("PROMO_SEARCH_REBUILD", 3600)  # 이보다 오래된 색인은 백그라운드에서 새로 만듦 (시트 직접 수정 반영)
+SEARCH_MAX_RESULTS = _env_int("PROMO_SEARCH_MAX_RESULTS", 200)
+SEARCH_COMPACT_POSTINGS = _env_int("PROMO_SEARCH_COMPACT", 50000)  # 저장으로 쌓인 추가 색인이 이보다 많으면 합침
+
+# 프로모션 타임라인
+TIMELINE_MAX_BARS = _env_int("PROMO_TIMELINE_MAX_BARS", 300)  # 간트 차트에 그리는 최대 프로모션 수 (시작일 순)
+
+# 주간 집계 (대시보드 지표/추이, 저장할 때마다 변경분만 반영)
+ROLLUP_PATH = os.environ.get("PROMO_ROLLUP_PATH", os.path.join(DATA_DIR, "rollups.sqlite3"))
+TREND_WEEKS = _env_int("PROMO_TREND_WEEKS", 26)  # 대시보드 추이 기본 기간 (주)
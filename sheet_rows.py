@@ -0,0 +1,212 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+# 시트 1행은 헤더, 데이터 위치 i(0부터)는 시트의 i+2번째 행
+FIRST_DATA_ROW = 2
+
+
+class ConcurrentModificationError(Exception):
+    """읽어 둔 스냅샷 이후 원격 시트가 바뀐 경우"""
+
+
+# ---------------------------------------------------------
+# key → 행 범위 인덱스
+# ---------------------------------------------------------
+class RowIndex:
+    """(Week_Start, Assignee) 같은 key 별 데이터 행 위치 목록
+
+    캐시된 DataFrame과 함께 모든 세션이 공유하므로 변경 시 새 객체를 만든다.
+    """
+
+    def __init__(self, key_cols, positions, n_rows):
+        self.key_cols = tuple(key_cols)
+        self.positions = positions
+        self.n_rows = n_rows
+
+    @classmethod
+    def build(cls, df, key_cols):
+        key_cols = list(key_cols)
+        if df.empty or any(c not in df.columns for c in key_cols):
+            return cls(key_cols, {}, len(df))
+        groups = df.groupby(key_cols, sort=False, observed=True).indices
+        return cls(key_cols, {k: np.asarray(v) for k, v in groups.items()}, len(df))
+
+    def rows(self, key):
+        return self.positions.get(tuple(key), np.empty(0, dtype=np.int64))
+
+    def select(self, values):
+        """key 컬럼별 값(None은 전체)에 맞는 행 위치를 시트 순서대로 반환"""
+        hits = [
+            pos for k, pos in self.positions.items()
+            if all(v is None or k[i] == v for i, v in enumerate(values))
+        ]
+        return np.sort(np.concatenate(hits)) if hits else np.empty(0, dtype=np.int64)
+
+    def replaced(self, key, kept, n_appended, dropped):
+        """한 key의 행을 덮어쓰고(kept) 끝에 추가하고(n_appended) 삭제(dropped)한 뒤의 인덱스"""
+        key = tuple(key)
+        appended = np.arange(self.n_rows, self.n_rows + n_appended)
+        positions = dict(self.positions)
+        positions[key] = np.concatenate([np.asarray(kept, dtype=np.int64), appended])
+        if len(dropped):
+            dropped = np.sort(np.asarray(dropped))
+            for k, pos in positions.items():
+                positions[k] = pos - np.searchsorted(dropped, pos)
+        if not len(positions[key]):
+            del positions[key]
+        return RowIndex(self.key_cols, positions, self.n_rows + n_appended - len(dropped))
+
+
+# ---------------------------------------------------------
+# 행 단위 upsert
+# ---------------------------------------------------------
+def upsert_rows(ws, df, index, key, new_rows):
+    """key에 해당하는 행만 원격 시트에 반영하고 (새 DataFrame, 새 인덱스) 반환
+
+    - 기존 행 수만큼은 제자리 덮어쓰기, 남는 행은 끝에 추가, 줄어든 행은 삭제
+    - 쓰기 전에 대상 행/헤더/마지막 행을 한 번에 읽어 동시 수정 여부 확인
+    """
+    cols = list(df.columns) if len(df.columns) else list(new_rows.columns)
+    new_rows = new_rows.reindex(columns=cols)
+    positions = index.rows(key)
+
+    header_present = verify_snapshot(ws, df, positions, index.key_cols, cols)
+    values = to_sheet_values(new_rows)
+
+    if not header_present:
+        ws.update(range_name="A1", values=[cols] + values, value_input_option="USER_ENTERED")
+        new_df = new_rows.reset_index(drop=True)
+        return new_df, RowIndex.build(new_df, index.key_cols)
+
+    n_keep = min(len(positions), len(new_rows))
+    kept, dropped = positions[:n_keep], positions[len(new_rows):]
+
+    # 1) 기존 행 덮어쓰기
+    updates, offset = [], 0
+    for start, end in runs_of(kept):
+        count = end - start + 1
+        updates.append({"range": row_range(start, end, len(cols)), "values": values[offset:offset + count]})
+        offset += count
+    if updates:
+        ws.batch_update(updates, value_input_option="USER_ENTERED")
+
+    # 2) 남는 행은 표 끝에 추가
+    extra = values[n_keep:]
+    if extra:
+        ws.append_rows(extra, value_input_option="USER_ENTERED", insert_data_option="INSERT_ROWS", table_range="A1")
+
+    # 3) 줄어든 행은 아래쪽부터 삭제 (위쪽 행 번호가 밀리지 않도록)
+    for start, end in reversed(runs_of(dropped)):
+        ws.delete_rows(start + FIRST_DATA_ROW, end + FIRST_DATA_ROW)
+
+    # 원격과 같은 순서로 로컬 스냅샷 갱신
+    new_df = df.copy()
+    for j, col in enumerate(cols):
+        if n_keep:
+            replacement = new_rows[col].iloc[:n_keep].to_numpy()
+            try:
+                new_df.iloc[kept, j] = replacement
+            except (TypeError, ValueError):
+                new_df[col] = new_df[col].astype(object)
+                new_df.iloc[kept, j] = replacement
+    if extra:
+        new_df = pd.concat([new_df, new_rows.iloc[n_keep:]], ignore_index=True)
+    if len(dropped):
+        new_df = new_df.drop(new_df.index[dropped]).reset_index(drop=True)
+    return new_df, index.replaced(key, kept, len(extra), dropped)
+
+
+def verify_snapshot(ws, df, positions, key_cols, cols=None):
+    """스냅샷(df)과 원격 시트의 헤더, 대상 행의 key, 마지막 행과 그 다음 빈 행을 비교
+
+    다르면 ConcurrentModificationError, 같으면 헤더 존재 여부 반환
+    """
+    cols = list(df.columns) if cols is None else cols
+    n = len(df)
+    runs = runs_of(positions)
+    ranges = [row_range(-1, -1, len(cols))]
+    ranges += [row_range(start, end, len(cols)) for start, end in runs]
+    ranges.append(row_range(n - 1, n, len(cols)))
+    got = ws.batch_get(ranges)
+
+    header = [_cell(v) for v in (got[0][0] if got[0] else [])]
+    if not header:
+        if n or (len(got[-1]) and any(_cell(v) for row in got[-1] for v in row)):
+            raise ConcurrentModificationError("시트 헤더가 비어 있습니다.")
+        return False
+    if header[:len(cols)] != [str(c) for c in cols]:
+        raise ConcurrentModificationError("시트 컬럼 구성이 변경되었습니다.")
+
+    key_idx = [cols.index(c) for c in key_cols]
+    for (start, end), remote in zip(runs, got[1:-1]):
+        expected = df.iloc[start:end + 1, key_idx].to_numpy().tolist()
+        if _keys_of(remote, key_idx, end - start + 1) != [[_cell(v) for v in row] for row in expected]:
+            raise ConcurrentModificationError("저장 대상 행이 다른 사용자에 의해 변경되었습니다.")
+
+    tail = got[-1]
+    expected_tail = [[_cell(v) for v in df.iloc[n - 1, key_idx].tolist()]] if n else []
+    if n == 0:
+        tail = tail[1:] if tail else []  # n == 0이면 첫 범위는 헤더 행
+    if _keys_of(tail, key_idx, len(tail)) != expected_tail:
+        raise ConcurrentModificationError("시트 행 수가 변경되었습니다.")
+    return True
+
+
+def _keys_of(rows, key_idx, count):
+    rows = list(rows) + [[]] * (count - len(rows))
+    return [[_cell(row[i]) if i < len(row) else "" for i in key_idx] for row in rows]
+
+
+def _cell(v):
+    if v is None or (isinstance(v, float) and np.isnan(v)):
+        return ""
+    s = str(v).strip()
+    return "" if s in ("nan", "NaT", "None", "<NA>") else s
+
+
+def sheet_value(v):
+    """셀에 쓸 값으로 변환 (결측은 빈 칸, 자정 시각은 날짜만)"""
+    if v is None or (not isinstance(v, (str, list)) and pd.isna(v)):
+        return ""
+    if isinstance(v, (datetime.datetime, pd.Timestamp)):
+        return v.date().isoformat() if v.time() == datetime.time() else v.isoformat(sep=" ")
+    if isinstance(v, datetime.date):
+        return v.isoformat()
+    if isinstance(v, np.generic):
+        v = v.item()
+    return v if isinstance(v, (int, float, str)) else str(v)
+
+
+def to_sheet_values(df):
+    return [[sheet_value(v) for v in row] for row in df.astype(object).to_numpy().tolist()]
+
+
+def rowcol_to_a1(row, col):
+    """(1부터) 행/열 → A1 주소 (gspread.utils와 같은 결과, gspread를 읽지 않으려고 직접 계산)"""
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return f"{letters}{row}"
+
+
+def cell_a1(position, col_idx):
+    """데이터 위치/컬럼 위치(0부터) → A1 셀 주소"""
+    return rowcol_to_a1(position + FIRST_DATA_ROW, col_idx + 1)
+
+
+def runs_of(positions):
+    """정렬된 위치 목록을 연속 구간 [(start, end), ...]으로 묶음"""
+    runs = []
+    for p in sorted(int(p) for p in positions):
+        if runs and p == runs[-1][1] + 1:
+            runs[-1][1] = p
+        else:
+            runs.append([p, p])
+    return [tuple(r) for r in runs]
+
+
+def row_range(start, end, n_cols):
+    return f"{rowcol_to_a1(start + FIRST_DATA_ROW, 1)}:{rowcol_to_a1(end + FIRST_DATA_ROW, max(n_cols, 1))}"
@@ -0,0 +1,714 @@
+import datetime
+import sqlite3
+import threading
+from contextlib import closing
+
+import pandas as pd
+import streamlit as st
+
+import local_db
+import settings
+from data_cache import sheet_cache
+from partitions import (
+    PARTITION_COLUMNS, PARTITION_INDEX_NAME, ArchivedPartitionError, MissingArchiveError, PartitionIndex, archive_data,
+    archive_frame, archive_worksheet, compress_reports, decompress_reports, partition_of, partition_worksheet, split_by_partition,
+)
+from perf import frame_bytes, perf, values_bytes
+from schema import conform_reports, validate_promotions
+from sheet_rows import (
+    RowIndex, ConcurrentModificationError, upsert_rows, verify_snapshot,
+    to_sheet_values, sheet_value, cell_a1, runs_of, FIRST_DATA_ROW,
+)
+
+REPORT_COLUMNS = ["Week_Start", "Assignee", "Type", "Project", "Content", "Status"]
+REPORT_KEY_COLS = ("Week_Start", "Assignee")
+PROMOTION_KEY_COLS = ("프로모션명",)
+
+# ---------------------------------------------------------
+# 공통 전처리
+# ---------------------------------------------------------
+def prepare_promotions(df):
+    """진척율 문자열('50%')/날짜 정리 후 스키마 dtype으로 변환 (CSV 가져오기와 같은 검사 사용)"""
+    return validate_promotions(df)[0]
+
+def prepare_reports(df):
+    if 'Week_Start' in df.columns:
+        df['Week_Start'] = df['Week_Start'].astype(str)
+    return conform_reports(df)
+
+def to_storage_frame(df):
+    """시트 전체 쓰기용: 날짜는 'YYYY-MM-DD', 결측은 빈 칸"""
+    return pd.DataFrame(to_sheet_values(df), columns=df.columns)
+
+def _weeks_between(df, week_from, week_to):
+    """Week_Start가 week_from~week_to(포함)인 행 (ISO 날짜 문자열이라 문자열 비교로 충분)"""
+    if df.empty:
+        return df
+    weeks = df['Week_Start'].astype(str)
+    return df[((weeks >= str(week_from)) & (weeks <= str(week_to))).to_numpy()]
+
+def _concat_reports(frames):
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return prepare_reports(pd.DataFrame(columns=REPORT_COLUMNS))
+    if len(frames) == 1:
+        return frames[0]
+    return conform_reports(pd.concat([f.astype(object) for f in frames], ignore_index=True))
+
+
+# ---------------------------------------------------------
+# 저장소 인터페이스
+# ---------------------------------------------------------
+class StorageBackend:
+    """load/save 함수가 사용하는 저장소 공통 인터페이스
+
+    - read_promotions(): 프로모션 전체 (대시보드 필터는 선택지/탭 건수에 전체가 필요해 공유 스냅샷에서 계산)
+    - read_reports(week_start, assignee): 조건(None은 전체)에 맞는 주간 보고
+    - upsert_reports(key, df): (Week_Start, Assignee) 단위 교체 저장
+    - apply_promotions_diff(base, diff, draft): base 스냅샷 이후 변경분만 반영
+    - partition_index()/archive_reports(keep): 주간 보고 분기 파티션 목록과 오래된 분기 보관
+      (보관한 분기를 읽을 수 없으면 빈 결과 대신 MissingArchiveError, 보관한 분기에 저장하면 ArchivedPartitionError)
+    """
+
+    name = "base"
+
+    def read_promotions(self):
+        raise NotImplementedError
+
+    def write_promotions(self, df):
+        raise NotImplementedError
+
+    def apply_promotions_diff(self, base, diff, draft):
+        self.write_promotions(draft)
+
+    def read_reports(self, week_start=None, assignee=None):
+        raise NotImplementedError
+
+    def read_reports_range(self, week_from, week_to):
+        """Week_Start가 week_from~week_to(포함)인 보고서"""
+        return _weeks_between(self.read_reports(), week_from, week_to)
+
+    def upsert_reports(self, key, df):
+        raise NotImplementedError
+
+    def partition_index(self):
+        """주간 보고 분기 파티션 인덱스 (파티션을 쓰지 않으면 None)"""
+        return None
+
+    def partition_reports(self):
+        """단일 주간 보고 저장소를 분기 파티션으로 나누고 만든 파티션 목록 반환"""
+        raise NotImplementedError
+
+    def archive_reports(self, keep_quarters):
+        """최근 keep_quarters개 분기보다 오래된 파티션을 압축해 저장소 안에 옮기고 옮긴 파티션 목록 반환"""
+        raise NotImplementedError
+
+    def refresh(self):
+        """백그라운드 갱신용: 캐시해 둔 데이터를 저장소에서 다시 읽어 교체"""
+
+
+# ---------------------------------------------------------
+# 구글 시트 저장소
+# ---------------------------------------------------------
+class _TimedWorksheet:
+    """gspread 워크시트 호출마다 sheets.<메서드> 구간과 주고받은 값의 양을 기록"""
+
+    def __init__(self, ws):
+        self._ws = ws
+
+    def __getattr__(self, name):
+        attr = getattr(self._ws, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with perf.span(f"sheets.{name}") as span:
+                result = attr(*args, **kwargs)
+                span.bytes = _payload_bytes(name, args, kwargs, result)
+            return result
+        return call
+
+
+def _payload_bytes(method, args, kwargs, result):
+    if method == "batch_get":
+        return sum(values_bytes(block) for block in result or [])
+    if method == "batch_update":
+        data = args[0] if args else kwargs.get("data", [])
+        return sum(values_bytes(d.get("values", [])) for d in data)
+    if method in ("append_rows", "update"):
+        values = kwargs.get("values", args[0] if method == "append_rows" and args else None)
+        return values_bytes(values or [])
+    return 0
+
+
+def _worksheet_not_found():
+    """gspread의 WorksheetNotFound (gspread 전체 import가 0.2초 가까이 걸려 시트 예외를 처리할 때만 로드)"""
+    from gspread.exceptions import WorksheetNotFound
+    return WorksheetNotFound
+
+
+class GSheetsBackend(StorageBackend):
+    """구글 시트 워크시트 전체를 공유 캐시에 두고 조회, 저장은 행 단위 upsert
+
+    주간 보고는 인덱스 워크시트(weekly_reports_index)가 있으면 분기별 워크시트
+    (weekly_reports_2026Q4 ...)로 나눠 저장하고, 한 주를 보거나 저장할 때 그 분기만 읽음.
+    보관한 분기는 압축 워크시트(weekly_reports_archive_2025Q1 ...) 하나로 남김.
+    인덱스가 없으면 예전처럼 단일 weekly_reports 시트 사용 (partition_reports()로 전환).
+    """
+
+    name = "gsheets"
+
+    def __init__(self, conn=None, cache=sheet_cache):
+        self._conn = conn
+        self.cache = cache
+        self._report_lock = threading.Lock()  # 같은 프로세스 안의 동시 저장 직렬화
+
+    @property
+    def conn(self):
+        if self._conn is not None:
+            return self._conn
+        from streamlit_gsheets import GSheetsConnection
+        # 백그라운드 갱신 스레드에서도 쓸 수 있도록 처음 만든 연결을 보관
+        self._conn = st.connection("gsheets", type=GSheetsConnection)
+        return self._conn
+
+    def _worksheet(self, name):
+        """행 단위 쓰기용 gspread 워크시트 (서비스 계정 연결에서만 지원)"""
+        return _TimedWorksheet(self.conn.client._select_worksheet(worksheet=name))
+
+    def _read(self, worksheet):
+        with perf.span("sheets.read") as span:
+            df = self.conn.read(worksheet=worksheet, ttl=0)
+            span.bytes = frame_bytes(df)
+        if df.empty:
+            return df
+        with perf.span(f"preprocess.{worksheet}"):
+            return prepare_promotions(df) if worksheet == "promotions" else prepare_reports(df)
+
+    def _report_index(self, df):
+        return self.cache.derive(df, "row_index", lambda d: RowIndex.build(d, REPORT_KEY_COLS))
+
+    def read_promotions(self):
+        return self.cache.get("promotions", lambda: self._read("promotions"))
+
+    def refresh(self):
+        self.cache.refresh("promotions", lambda: self._read("promotions"))
+        self.cache.refresh(PARTITION_INDEX_NAME, self._read_partition_index)
+        index = self.partition_index()
+        if index is None:
+            self.cache.refresh("weekly_reports", lambda: self._read("weekly_reports"))
+            return
+        # 파티션은 이번 주가 속한 분기만 (지난 분기는 조회될 때 TTL에 따라 다시 읽음)
+        today = datetime.date.today()
+        current = partition_of(today - datetime.timedelta(days=today.weekday()))
+        if current in index.partitions(archived=False):
+            worksheet = partition_worksheet(current)
+            self.cache.refresh(worksheet, lambda: self._read(worksheet))
+
+    def _put_worksheet(self, worksheet, data):
+        try:
+            self.conn.update(worksheet=worksheet, data=data)
+        except _worksheet_not_found():
+            self.conn.create(worksheet=worksheet, data=data)
+
+    def write_promotions(self, df):
+        data = to_storage_frame(df)
+        with perf.span("sheets.update", frame_bytes(data)):
+            self.conn.update(worksheet="promotions", data=data)
+        self.cache.put("promotions", prepare_promotions(df.reset_index(drop=True)))
+
+    def apply_promotions_diff(self, base, diff, draft):
+        """바뀐 칸/행/컬럼만 일괄 범위 업데이트로 반영 (스냅샷 이후 원격이 바뀌었으면 즉시 실패)"""
+        if diff.empty:
+            return
+        if diff.rewrite or base.empty:
+            return self.write_promotions(draft)
+
+        ws = self._worksheet("promotions")
+        base_cols = list(base.columns)
+        pos_of = dict(zip(base.index, range(len(base))))
+        touched = sorted(pos_of[label] for label in list(diff.updated) + list(diff.deleted))
+        try:
+            verify_snapshot(ws, base, touched, [c for c in PROMOTION_KEY_COLS if c in base_cols])
+        except ConcurrentModificationError:
+            self.cache.invalidate("promotions")
+            raise
+
+        # 1) 바뀐 칸 (기존 컬럼 위치 기준)
+        updates = [
+            {"range": cell_a1(pos_of[label], base_cols.index(col)), "values": [[sheet_value(value)]]}
+            for label, cells in diff.updated.items() for col, value in cells.items()
+        ]
+        # 2) 추가된 컬럼: 헤더 + 기존 행 값을 컬럼 단위 범위로
+        if diff.added_cols:
+            needed = len(base_cols) + len(diff.added_cols)
+            if ws.col_count < needed:
+                ws.add_cols(needed - ws.col_count)
+            values = draft.reindex(base.index)[diff.added_cols]
+            for i, col in enumerate(diff.added_cols):
+                col_idx = len(base_cols) + i
+                column = [[col]] + [[sheet_value(v)] for v in values[col].tolist()]
+                updates.append({"range": f"{cell_a1(-1, col_idx)}:{cell_a1(len(base) - 1, col_idx)}", "values": column})
+        if updates:
+            ws.batch_update(updates, value_input_option="USER_ENTERED")
+
+        # 3) 삭제된 컬럼 (오른쪽부터)
+        for col in sorted(diff.dropped_cols, key=base_cols.index, reverse=True):
+            ws.delete_columns(base_cols.index(col) + 1)
+
+        # 4) 새 행은 끝에 추가, 5) 삭제 행은 아래쪽부터
+        if len(diff.inserted):
+            ws.append_rows(to_sheet_values(diff.inserted.reindex(columns=diff.columns)),
+                           value_input_option="USER_ENTERED", insert_data_option="INSERT_ROWS", table_range="A1")
+        for start, end in reversed(runs_of(pos_of[label] for label in diff.deleted)):
+            ws.delete_rows(start + FIRST_DATA_ROW, end + FIRST_DATA_ROW)
+
+        # 원격과 같은 행 순서(기존 행 → 새 행)로 캐시 갱신
+        kept = draft.loc[draft.index.isin(base.index)]
+        final = pd.concat([kept, diff.inserted]).reindex(columns=diff.columns)
+        self.cache.put("promotions", prepare_promotions(final.reset_index(drop=True)))
+
+    # 주간 보고
+    def read_reports(self, week_start=None, assignee=None):
+        index = self.partition_index()
+        if index is None:
+            df = self._read_report_sheet("weekly_reports")
+        elif week_start is not None:
+            df = self._read_report_partition(partition_of(week_start), index)
+        else:
+            df = _concat_reports([self._read_report_partition(p, index) for p in index.partitions()])
+        if (week_start is None and assignee is None) or df.empty:
+            return df
+        return df.iloc[self._report_index(df).select((week_start, assignee))]
+
+    def read_reports_range(self, week_from, week_to):
+        index = self.partition_index()
+        if index is None:
+            return super().read_reports_range(week_from, week_to)
+        frames = [self._read_report_partition(p, index) for p in index.covering(week_from, week_to)]
+        return _weeks_between(_concat_reports(frames), week_from, week_to)
+
+    def _read_report_sheet(self, worksheet):
+        return self.cache.get(worksheet, lambda: self._read(worksheet))
+
+    def _read_report_partition(self, partition, index):
+        """파티션 하나 (인덱스에 없으면 읽지 않고 빈 표, 보관된 분기는 압축 워크시트)"""
+        if partition not in index.entries:
+            return _concat_reports([])
+        if index.is_archived(partition):
+            return self.cache.get(f"archive:{partition}", lambda: self._read_archive(partition))
+        return self._read_report_sheet(partition_worksheet(partition))
+
+    def _read_archive(self, partition):
+        worksheet = archive_worksheet(partition)
+        try:
+            with perf.span("sheets.read") as span:
+                frame = self.conn.read(worksheet=worksheet, ttl=0)
+                span.bytes = frame_bytes(frame)
+            df = decompress_reports(archive_data(frame))
+        except _worksheet_not_found():
+            raise MissingArchiveError(f"{partition} 분기 보관 워크시트({worksheet})를 찾을 수 없습니다.") from None
+        return prepare_reports(df)
+
+    def upsert_reports(self, key, df):
+        index = self.partition_index()
+        if index is None:
+            self._upsert_sheet("weekly_reports", key, df)
+            return
+        partition = partition_of(key[0])
+        if index.is_archived(partition):
+            raise ArchivedPartitionError(f"{partition} 분기 보고서는 보관되어 수정할 수 없습니다.")
+        worksheet = partition_worksheet(partition)
+        try:
+            new_df = self._upsert_sheet(worksheet, key, df)
+        except _worksheet_not_found():
+            # 새 분기의 첫 보고서로 워크시트 생성
+            new_df = df.reindex(columns=REPORT_COLUMNS).reset_index(drop=True)
+            self.conn.create(worksheet=worksheet, data=to_storage_frame(new_df))
+            new_df = prepare_reports(new_df)
+            self.cache.put(worksheet, new_df)
+        if index.with_partition(partition, new_df).entries != index.entries:
+            self._update_partition_index(partition, new_df)
+
+    def _upsert_sheet(self, worksheet, key, df):
+        """한 워크시트에서 key 행만 교체하고 새 스냅샷 반환"""
+        ws = self._worksheet(worksheet)
+        with self._report_lock:
+            # 동시 수정이 감지되면 최신 데이터로 한 번 더 시도
+            for attempt in range(2):
+                existing_df = self._read_report_sheet(worksheet)
+                if existing_df.empty and not len(existing_df.columns):
+                    existing_df = pd.DataFrame(columns=REPORT_COLUMNS)
+                try:
+                    new_df, new_index = upsert_rows(ws, existing_df, self._report_index(existing_df), key, df)
+                except ConcurrentModificationError:
+                    self.cache.invalidate(worksheet)
+                    if attempt:
+                        raise
+                    continue
+                except Exception:
+                    self.cache.invalidate(worksheet)
+                    raise
+                new_df = conform_reports(new_df)
+                self.cache.put(worksheet, new_df, derived={"row_index": new_index})
+                return new_df
+
+    # 분기 파티션
+    def _read_partition_index(self):
+        try:
+            with perf.span("sheets.read") as span:
+                df = self.conn.read(worksheet=PARTITION_INDEX_NAME, ttl=0)
+                span.bytes = frame_bytes(df)
+        except _worksheet_not_found():
+            return pd.DataFrame()
+        return df if len(df.columns) else pd.DataFrame(columns=PARTITION_COLUMNS)
+
+    def partition_index(self):
+        df = self.cache.get(PARTITION_INDEX_NAME, self._read_partition_index)
+        if df.empty and not len(df.columns):
+            return None
+        return self.cache.derive(df, "partitions", PartitionIndex.from_frame)
+
+    def _update_partition_index(self, partition, df=None):
+        """인덱스의 한 항목만 바꿔 씀 (다른 프로세스가 추가한 분기를 잃지 않도록 최신 인덱스를 읽어서 반영)"""
+        index = PartitionIndex.from_frame(self._read_partition_index())
+        index = index.with_archived(partition) if df is None else index.with_partition(partition, df)
+        frame = index.to_frame()
+        self.conn.update(worksheet=PARTITION_INDEX_NAME, data=frame)
+        self.cache.put(PARTITION_INDEX_NAME, frame, derived={"partitions": index})
+
+    def partition_reports(self):
+        """단일 weekly_reports 시트를 분기별 워크시트로 복사하고 인덱스 생성
+
+        인덱스를 마지막에 쓰므로 중간에 실패하면 단일 시트 모드 그대로이고, 원본 시트는 지우지 않음.
+        옮기는 동안 저장된 보고서가 빠지지 않도록 사용자가 없을 때 실행.
+        """
+        if self.partition_index() is not None:
+            return []
+        try:
+            df = self._read("weekly_reports")
+        except _worksheet_not_found():
+            df = pd.DataFrame(columns=REPORT_COLUMNS)
+        parts = split_by_partition(df)
+        index = PartitionIndex()
+        for partition, part in parts.items():
+            self._put_worksheet(partition_worksheet(partition), to_storage_frame(part))
+            index = index.with_partition(partition, part)
+        frame = index.to_frame()
+        self._put_worksheet(PARTITION_INDEX_NAME, frame)
+        self.cache.put(PARTITION_INDEX_NAME, frame, derived={"partitions": index})
+        self.cache.invalidate("weekly_reports")
+        return list(parts)
+
+    def archive_reports(self, keep_quarters):
+        """오래된 분기 워크시트를 압축 워크시트로 옮김 (압축본 쓰기 → 다시 읽어 확인 → 인덱스 표시 → 원본 삭제 순)"""
+        index = self.partition_index()
+        if index is None:
+            raise ValueError("주간 보고를 먼저 분기별로 나눠야 보관할 수 있습니다.")
+        archived = []
+        for partition in index.archivable(keep_quarters):
+            worksheet = partition_worksheet(partition)
+            df = self._read(worksheet)
+            self._put_worksheet(archive_worksheet(partition), archive_frame(compress_reports(to_storage_frame(df))))
+            if len(self._read_archive(partition)) != len(df):
+                raise IOError(f"{partition} 보관 워크시트 확인 실패")
+            self._update_partition_index(partition)
+            raw = self.conn.client._select_worksheet(worksheet=worksheet)
+            raw.spreadsheet.del_worksheet(raw)
+            self.cache.invalidate(worksheet)
+            archived.append(partition)
+        return archived
+
+
+# ---------------------------------------------------------
+# 로컬 SQLite 저장소
+# ---------------------------------------------------------
+def _q(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _sql_value(v):
+    v = sheet_value(v)
+    return None if v == "" else v
+
+def _sql_rows(df):
+    return [tuple(_sql_value(v) for v in row) for row in df.astype(object).to_numpy().tolist()]
+
+
+class SQLiteBackend(StorageBackend):
+    """로컬 SQLite 파일 저장소
+
+    - weekly_reports(Week_Start, Assignee) 인덱스로 주차/작성자 조건 조회
+    - 주간 보고는 Week_Start 인덱스가 분기 파티션 역할을 하고, 보관한 분기는 report_partitions에 기록하고
+      압축본을 report_archives에 둠
+    - sync가 주어지면 로컬 저장 후 해당 저장소(구글 시트)에도 반영
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path, sync=None, cache=sheet_cache):
+        self.path = path
+        self.sync = sync
+        self.cache = cache
+        self.last_sync_error = None
+        self._bootstrapped = sync is None
+        local_db.ensure_dir(path)
+        self._init_schema()
+
+    def _connect(self):
+        return local_db.connect(self.path)
+
+    def _init_schema(self):
+        with closing(self._connect()) as con, con:
+            cols = ", ".join(f"{_q(c)} TEXT" for c in REPORT_COLUMNS)
+            con.execute(f"CREATE TABLE IF NOT EXISTS weekly_reports ({cols})")
+            con.execute("CREATE INDEX IF NOT EXISTS ix_reports_week_assignee ON weekly_reports (Week_Start, Assignee)")
+            con.execute("CREATE INDEX IF NOT EXISTS ix_reports_assignee ON weekly_reports (Assignee)")
+            con.execute("CREATE TABLE IF NOT EXISTS report_partitions "
+                        "(Partition TEXT PRIMARY KEY, First_Week TEXT, Last_Week TEXT, Rows INTEGER, Archived INTEGER)")
+            con.execute("CREATE TABLE IF NOT EXISTS report_archives (Partition TEXT PRIMARY KEY, Data BLOB NOT NULL)")
+
+    def _has_promotions(self, con):
+        return con.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='promotions'").fetchone() is not None
+
+    def _bootstrap(self):
+        """로컬 DB가 비어 있으면 동기화 대상(구글 시트)에서 한 번 가져옴"""
+        if self._bootstrapped:
+            return
+        self._bootstrapped = True
+        with closing(self._connect()) as con:
+            empty = not self._has_promotions(con) and not con.execute("SELECT 1 FROM weekly_reports LIMIT 1").fetchone()
+        if not empty:
+            return
+        promotions = self.sync.read_promotions()
+        if not promotions.empty:
+            self._write_promotions(promotions)
+        reports = self.sync.read_reports()
+        if not reports.empty:
+            with closing(self._connect()) as con, con:
+                self._insert_reports(con, reports)
+
+    def read_promotions(self):
+        self._bootstrap()
+        return self.cache.get("sqlite:promotions", self._query_promotions)
+
+    def refresh(self):
+        # 다른 프로세스가 같은 파일에 쓴 경우 반영 (주간 보고는 캐시 없이 조회)
+        self._bootstrap()
+        self.cache.refresh("sqlite:promotions", self._query_promotions)
+
+    def _query_promotions(self):
+        with closing(self._connect()) as con:
+            if not self._has_promotions(con):
+                return pd.DataFrame()
+            with perf.span("sqlite.read") as span:
+                df = pd.read_sql_query("SELECT * FROM promotions ORDER BY rowid", con)
+                span.bytes = frame_bytes(df)
+        with perf.span("preprocess.promotions"):
+            return prepare_promotions(df)
+
+    def write_promotions(self, df):
+        self._write_promotions(df)
+        self._sync(lambda target: target.write_promotions(df))
+
+    def _write_promotions(self, df):
+        cols = list(df.columns)
+        with closing(self._connect()) as con, con:
+            con.execute("DROP TABLE IF EXISTS promotions")
+            defs = ", ".join(f"{_q(c)} {'INTEGER' if c == '진척율' else 'TEXT'}" for c in cols)
+            con.execute(f"CREATE TABLE promotions ({defs})")
+            con.executemany(
+                f"INSERT INTO promotions ({', '.join(map(_q, cols))}) VALUES ({', '.join('?' * len(cols))})",
+                _sql_rows(df),
+            )
+        self.cache.invalidate("sqlite:promotions")
+
+    def apply_promotions_diff(self, base, diff, draft):
+        """rowid 단위 UPDATE/INSERT/DELETE와 ALTER TABLE로 변경분만 반영"""
+        if diff.empty:
+            return
+        if diff.rewrite or base.empty or (diff.dropped_cols and sqlite3.sqlite_version_info < (3, 35)):
+            return self.write_promotions(draft)
+
+        base_cols = list(base.columns)
+        key_cols = [c for c in PROMOTION_KEY_COLS if c in base_cols]
+        with closing(self._connect()) as con, con:
+            con.execute("BEGIN IMMEDIATE")
+            rows = con.execute(f"SELECT rowid, {', '.join(map(_q, key_cols)) or 'NULL'} FROM promotions ORDER BY rowid").fetchall()
+            expected = [tuple(sheet_value(v) for v in row) for row in base[key_cols].astype(object).to_numpy().tolist()]
+            if [tuple(sheet_value(v) for v in r[1:len(key_cols) + 1]) for r in rows] != expected:
+                raise ConcurrentModificationError("스냅샷 이후 프로모션 데이터가 변경되었습니다.")
+            rowid_of = dict(zip(base.index, (r[0] for r in rows)))
+
+            for col in diff.dropped_cols:
+                con.execute(f"ALTER TABLE promotions DROP COLUMN {_q(col)}")
+            for col in diff.added_cols:
+                con.execute(f"ALTER TABLE promotions ADD COLUMN {_q(col)} TEXT")
+                values = draft.reindex(base.index)[col]
+                con.executemany(f"UPDATE promotions SET {_q(col)} = ? WHERE rowid = ?",
+                                [(_sql_value(v), rowid_of[label]) for label, v in values.items()])
+            for label, cells in diff.updated.items():
+                assignments = ", ".join(f"{_q(c)} = ?" for c in cells)
+                con.execute(f"UPDATE promotions SET {assignments} WHERE rowid = ?",
+                            [_sql_value(v) for v in cells.values()] + [rowid_of[label]])
+            if len(diff.inserted):
+                cols = diff.columns
+                con.executemany(
+                    f"INSERT INTO promotions ({', '.join(map(_q, cols))}) VALUES ({', '.join('?' * len(cols))})",
+                    _sql_rows(diff.inserted.reindex(columns=cols)),
+                )
+            if len(diff.deleted):
+                con.executemany("DELETE FROM promotions WHERE rowid = ?", [(rowid_of[label],) for label in diff.deleted])
+        self.cache.invalidate("sqlite:promotions")
+        self._sync(lambda target: self._sync_promotions_diff(target, base, diff, draft))
+
+    def _sync_promotions_diff(self, target, base, diff, draft):
+        try:
+            target.apply_promotions_diff(base, diff, draft)
+        except ConcurrentModificationError:
+            # 동기화 대상이 로컬과 어긋나 있으면 로컬 전체로 맞춤
+            target.write_promotions(self._query_promotions())
+
+    def read_reports(self, week_start=None, assignee=None):
+        self._bootstrap()
+        archived = self._archived_partitions()
+        if week_start is not None and partition_of(week_start) in archived:
+            return self._read_archives([partition_of(week_start)], week_start=week_start, assignee=assignee)
+        clauses, params = [], []
+        if week_start is not None:
+            clauses.append("Week_Start = ?")
+            params.append(str(week_start))
+        if assignee is not None:
+            clauses.append("Assignee = ?")
+            params.append(str(assignee))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with closing(self._connect()) as con:
+            with perf.span("sqlite.read") as span:
+                df = pd.read_sql_query(f"SELECT * FROM weekly_reports{where} ORDER BY rowid", con, params=params)
+                span.bytes = frame_bytes(df)
+        df = prepare_reports(df)
+        if week_start is None and archived:
+            df = _concat_reports([self._read_archives(sorted(archived), assignee=assignee), df])
+        return df
+
+    def read_reports_range(self, week_from, week_to):
+        self._bootstrap()
+        with closing(self._connect()) as con:
+            df = pd.read_sql_query(
+                "SELECT * FROM weekly_reports WHERE Week_Start BETWEEN ? AND ? ORDER BY Week_Start, rowid",
+                con, params=[str(week_from), str(week_to)],
+            )
+        first, last = partition_of(week_from), partition_of(week_to)
+        archived = [p for p in sorted(self._archived_partitions()) if first <= p <= last]
+        if archived:
+            df = pd.concat([_weeks_between(self._read_archives(archived), week_from, week_to).astype(object), df],
+                           ignore_index=True)
+        return prepare_reports(df)
+
+    def _archived_partitions(self):
+        with closing(self._connect()) as con:
+            return {r[0] for r in con.execute("SELECT Partition FROM report_partitions WHERE Archived = 1")}
+
+    def _read_archives(self, partitions, week_start=None, assignee=None):
+        df = _concat_reports([self._read_archive(p) for p in partitions])
+        if df.empty or (week_start is None and assignee is None):
+            return df
+        return df.iloc[RowIndex.build(df, REPORT_KEY_COLS).select((week_start, assignee))]
+
+    def _read_archive(self, partition):
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT Data FROM report_archives WHERE Partition = ?", (partition,)).fetchone()
+        if row is None:
+            raise MissingArchiveError(f"{partition} 분기 보관 데이터를 찾을 수 없습니다.")
+        return prepare_reports(decompress_reports(row[0]))
+
+    def partition_index(self):
+        """남아 있는 분기는 Week_Start 인덱스로 집계, 보관한 분기는 report_partitions에서"""
+        with closing(self._connect()) as con:
+            weeks = con.execute("SELECT Week_Start, COUNT(*) FROM weekly_reports GROUP BY Week_Start").fetchall()
+            archived = con.execute(
+                "SELECT Partition, First_Week, Last_Week, Rows FROM report_partitions WHERE Archived = 1").fetchall()
+        entries = {}
+        for week, n in weeks:
+            week = str(week)
+            partition = partition_of(week)
+            first, last, rows, _ = entries.get(partition, (week, week, 0, False))
+            entries[partition] = (min(first, week), max(last, week), rows + n, False)
+        for partition, first, last, rows in archived:
+            entries[partition] = (first, last, rows, True)
+        return PartitionIndex(entries)
+
+    def partition_reports(self):
+        return []  # Week_Start 인덱스가 이미 분기 단위 조회를 담당
+
+    def archive_reports(self, keep_quarters):
+        """오래된 분기 행을 압축해 report_archives로 옮김 (압축본 확인 후 같은 트랜잭션에서 삭제/기록)"""
+        self._bootstrap()
+        index = self.partition_index()
+        archived = []
+        for partition in index.archivable(keep_quarters):
+            first, last, _, _ = index.entries[partition]
+            with closing(self._connect()) as con, con:
+                con.execute("BEGIN IMMEDIATE")
+                df = pd.read_sql_query("SELECT * FROM weekly_reports WHERE Week_Start BETWEEN ? AND ? ORDER BY rowid",
+                                       con, params=[first, last])
+                con.execute("INSERT OR REPLACE INTO report_archives VALUES (?, ?)", (partition, compress_reports(df)))
+                con.execute("DELETE FROM weekly_reports WHERE Week_Start BETWEEN ? AND ?", (first, last))
+                con.execute("INSERT OR REPLACE INTO report_partitions VALUES (?, ?, ?, ?, 1)", (partition, first, last, len(df)))
+            archived.append(partition)
+        if archived:
+            with closing(self._connect()) as con:
+                con.execute("VACUUM")
+        return archived
+
+    def upsert_reports(self, key, df):
+        self._bootstrap()
+        if partition_of(key[0]) in self._archived_partitions():
+            raise ArchivedPartitionError(f"{partition_of(key[0])} 분기 보고서는 보관되어 수정할 수 없습니다.")
+        with closing(self._connect()) as con, con:
+            con.execute("BEGIN IMMEDIATE")
+            con.execute("DELETE FROM weekly_reports WHERE Week_Start = ? AND Assignee = ?", (str(key[0]), str(key[1])))
+            self._insert_reports(con, df)
+        self._sync(lambda target: target.upsert_reports(key, df))
+
+    def _insert_reports(self, con, df):
+        df = df.reindex(columns=REPORT_COLUMNS)
+        con.executemany(
+            f"INSERT INTO weekly_reports ({', '.join(REPORT_COLUMNS)}) VALUES ({', '.join('?' * len(REPORT_COLUMNS))})",
+            _sql_rows(df),
+        )
+
+    def _sync(self, op):
+        """동기화 실패는 로컬 저장을 되돌리지 않고 last_sync_error로만 남김"""
+        if self.sync is None:
+            return
+        try:
+            op(self.sync)
+            self.last_sync_error = None
+        except Exception as e:
+            self.last_sync_error = e
+
+
+# ---------------------------------------------------------
+# 저장소 선택 (프로세스 전체에서 하나)
+# ---------------------------------------------------------
+_storage = None
+_storage_lock = threading.Lock()
+
+def get_storage():
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            _storage = _create_storage()
+        return _storage
+
+def set_storage(backend):
+    """저장소 교체 (오프라인 테스트/벤치마크용)"""
+    global _storage
+    with _storage_lock:
+        _storage = backend
+
+def _create_storage():
+    if settings.STORAGE_BACKEND == "sqlite":
+        sync = GSheetsBackend() if settings.SQLITE_SYNC_GSHEETS else None
+        return SQLiteBackend(settings.SQLITE_PATH, sync=sync)
+    return GSheetsBackend()
@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# settings는 import할 때 경로를 읽으므로 로컬 저장소(대기열/집계/내보내기)를 먼저 임시 폴더로 돌림
+os.environ["PROMO_DATA_DIR"] = tempfile.mkdtemp(prefix="promo-tests-")
+for name in ("PROMO_SQLITE_PATH", "PROMO_WRITE_QUEUE_PATH", "PROMO_ROLLUP_PATH", "PROMO_EXPORT_DIR"):
+    os.environ.pop(name, None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_cache import SheetCache  # noqa: E402
+
+
+# ---------------------------------------------------------
+# 오프라인 저장소 (benchmarks의 시트 대역, 로컬 SQLite)
+# ---------------------------------------------------------
+@pytest.fixture
+def cache():
+    return SheetCache()
+
+
+@pytest.fixture
+def sheets_conn():
+    from benchmarks.mock_gsheets import MockGSheetsConnection
+    return MockGSheetsConnection()
+
+
+@pytest.fixture
+def sheets(sheets_conn, cache):
+    from storage import GSheetsBackend
+    return GSheetsBackend(conn=sheets_conn, cache=cache)
+
+
+@pytest.fixture
+def sqlite(tmp_path, cache):
+    from storage import SQLiteBackend
+    return SQLiteBackend(str(tmp_path / "promo.sqlite3"), cache=cache)
@@ -0,0 +1,25 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_benchmark_harness_runs_and_compares(tmp_path):
+    """작은 데이터로 벤치마크를 두 번 실행해 결과 JSON과 비교 출력까지 확인 (페이지 실행은 생략)"""
+    env = {**os.environ, "PROMO_WRITE_QUEUE_PATH": str(tmp_path / "queue.sqlite3"),
+           "PROMO_ROLLUP_PATH": str(tmp_path / "rollups.sqlite3"), "PROMO_EXPORT_DIR": str(tmp_path / "exports")}
+    args = [sys.executable, "-m", "benchmarks.run", "--promotions", "300", "--people", "5", "--weeks", "8",
+            "--repeat", "1", "--skip-pages"]
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    subprocess.run(args + ["--out", str(first)], cwd=ROOT, env=env, check=True, capture_output=True, timeout=300)
+    done = subprocess.run(args + ["--out", str(second), "--compare", str(first)], cwd=ROOT, env=env, check=True,
+                          capture_output=True, text=True, timeout=300)
+
+    results = json.loads(second.read_text(encoding="utf-8"))
+    assert results["meta"]["rows"]["promotions"] == 300
+    for name in ("load_promotions.cold", "save_promotions.diff_10_cells", "dashboard.filter_loop"):
+        assert results["results"][name]["median_ms"] >= 0
+    assert results["results"]["load_promotions.warm"]["api"]["calls"] == {}  # 캐시에서 읽으면 API 호출 없음
+    assert "비교 기준" in done.stdout and "dashboard.filter_loop" in done.stdout.split("비교 기준")[-1]
@@ -0,0 +1,60 @@
+import pandas as pd
+
+from data_cache import SheetCache
+
+
+def counting_builder(calls):
+    def build(df):
+        calls.append(df)
+        return len(df)
+    return build
+
+
+def test_derive_once_per_cached_version(cache):
+    df = cache.get("promotions", lambda: pd.DataFrame({"a": [1, 2]}))
+    calls = []
+    assert cache.derive(df, "n", counting_builder(calls)) == 2
+    assert cache.derive(cache.get("promotions", None), "n", counting_builder(calls)) == 2
+    assert len(calls) == 1
+
+    cache.invalidate("promotions")
+    df = cache.get("promotions", lambda: pd.DataFrame({"a": [1, 2, 3]}))
+    assert cache.derive(df, "n", counting_builder(calls)) == 3 and len(calls) == 2
+
+
+def test_uncached_frame_is_rebuilt_every_time(cache):
+    df, calls = pd.DataFrame({"a": [1]}), []
+    cache.derive(df, "n", counting_builder(calls))
+    cache.derive(df, "n", counting_builder(calls))
+    assert len(calls) == 2
+
+
+def test_adopted_frame_is_derived_once(cache):
+    overlay, calls = pd.DataFrame({"a": [1, 2]}), []
+    assert cache.adopt(overlay) is overlay
+    cache.adopt(overlay)
+    cache.derive(overlay, "n", counting_builder(calls))
+    cache.derive(overlay, "n", counting_builder(calls))
+    assert len(calls) == 1 and cache.stats()["adopted"] == 1
+
+
+def test_adopt_keeps_only_recent_frames():
+    cache = SheetCache(max_adopted=2)
+    frames = [pd.DataFrame({"a": [i]}) for i in range(3)]
+    for df in frames:
+        cache.adopt(df)
+    cache.derive(frames[1], "n", len)  # 최근에 쓴 항목으로 갱신
+    cache.adopt(pd.DataFrame({"a": [9]}))
+    calls = []
+    cache.derive(frames[0], "n", counting_builder(calls))
+    cache.derive(frames[2], "n", counting_builder(calls))
+    assert calls == [frames[0], frames[2]]
+    assert cache.derive(frames[1], "n", counting_builder(calls)) == 1 and len(calls) == 2
+
+
+def test_adopting_a_cached_frame_keeps_its_entry(cache):
+    df, calls = cache.get("promotions", lambda: pd.DataFrame({"a": [1]})), []
+    cache.derive(df, "n", counting_builder(calls))
+    cache.adopt(df)
+    cache.derive(df, "n", counting_builder(calls))
+    assert len(calls) == 1 and cache.stats()["adopted"] == 0
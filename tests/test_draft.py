@@ -0,0 +1,141 @@
+import pandas as pd
+import pytest
+
+from draft import PromotionDraft
+from frame_diff import canon, diff_frames
+from schema import conform_promotions
+
+
+@pytest.fixture
+def base():
+    return conform_promotions(pd.DataFrame({
+        "프로모션명": [f"P{i}" for i in range(10)],
+        "상태": ["대기", "진행중"] * 5,
+        "진척율": list(range(0, 100, 10)),
+        "비고": "-",
+    }))
+
+
+def summary(diff):
+    """비교용: 값은 canon 문자열로"""
+    updated = {label: {c: canon(pd.Series([v])).iat[0] for c, v in cells.items()} for label, cells in diff.updated.items()}
+    inserted = diff.inserted.reindex(columns=diff.columns).astype(object).map(lambda v: canon(pd.Series([v])).iat[0])
+    return (list(diff.columns), updated, inserted.index.tolist(), inserted.to_numpy().tolist(),
+            sorted(diff.deleted), diff.added_cols, diff.dropped_cols)
+
+
+def edited(base):
+    draft = PromotionDraft(base)
+    draft.set_cell(1, "진척율", 55)
+    draft.set_cell(2, "상태", "완료")
+    draft.set_cell(2, "비고", "곧 삭제되는 컬럼")
+    draft.delete_row(4)
+    draft.append_row({"프로모션명": "NEW", "상태": "대기", "진척율": 5})
+    draft.add_column("예산", "0")
+    draft.set_cell(6, "예산", "300")
+    draft.drop_column("비고")
+    return draft
+
+
+# ---------------------------------------------------------
+# 변경분 (diff)
+# ---------------------------------------------------------
+def test_diff_matches_full_comparison(base):
+    draft = edited(base)
+    diff = draft.diff(size_check=False)
+    assert summary(diff) == summary(diff_frames(base, draft.frame(), size_check=False))
+    assert diff.updated == {1: {"진척율": 55}, 2: {"상태": "완료"}}
+    assert diff.added_cols == ["예산"] and diff.dropped_cols == ["비고"]
+    assert list(diff.deleted) == [4] and diff.inserted.index.tolist() == [10]
+
+
+def test_diff_after_replace_compares_with_base(base):
+    draft = PromotionDraft(base)
+    replaced = base.iloc[::-1].copy()
+    draft.replace(replaced)
+    assert summary(draft.diff(size_check=False)) == summary(diff_frames(base, draft.frame(), size_check=False))
+
+
+def test_resetting_a_cell_clears_the_edit(base):
+    draft = PromotionDraft(base)
+    draft.set_cell(3, "진척율", 99)
+    draft.set_cell(3, "진척율", 30)
+    assert not draft.dirty and draft.diff().empty
+
+
+def test_size_check_marks_large_changes_as_rewrite(base):
+    draft = PromotionDraft(base)
+    for label in range(8):
+        draft.set_cell(label, "진척율", 1)
+        draft.set_cell(label, "비고", "x")
+        draft.set_cell(label, "상태", "완료")
+    assert draft.diff().rewrite and not draft.diff(size_check=False).rewrite
+
+
+# ---------------------------------------------------------
+# 되돌리기 / frame 캐시
+# ---------------------------------------------------------
+def test_undo_restores_each_step(base):
+    draft = edited(base)
+    steps = len(draft.history)
+    while draft.history:
+        draft.undo()
+    assert steps == 8
+    assert not draft.dirty
+    assert draft.frame().equals(base)
+    assert draft.undo() is None
+
+
+def test_transaction_is_one_undo_step(base):
+    draft = PromotionDraft(base)
+    with draft.transaction("일괄"):
+        draft.set_cell(0, "진척율", 1)
+        draft.delete_row(1)
+    assert [label for label, _ in draft.history] == ["일괄"]
+    assert draft.undo() == "일괄" and not draft.dirty
+
+
+def test_frame_is_built_once_per_revision(base):
+    draft = PromotionDraft(base)
+    first = draft.frame()
+    assert draft.frame() is first
+    draft.set_cell(0, "진척율", 1)
+    assert draft.frame() is not first and draft.frame().loc[0, "진척율"] == 1
+
+
+# ---------------------------------------------------------
+# 반영하지 못한 저장 되살리기 (reapply)
+# ---------------------------------------------------------
+def test_reapply_onto_newer_snapshot(base):
+    lost = PromotionDraft(base)
+    lost.set_cell(1, "진척율", 55)
+    lost.set_cell(3, "비고", "메모")
+    lost.delete_row(5)
+    lost.append_row({"프로모션명": "NEW", "상태": "대기", "진척율": 5, "비고": "-"})
+
+    # 그 사이 다른 곳에서 행 순서가 바뀌고, P3는 이름이 바뀌고, P7의 다른 칸이 수정됨
+    newer = base.iloc[::-1].reset_index(drop=True).copy()
+    newer.loc[newer["프로모션명"] == "P3", "프로모션명"] = "P3-renamed"
+    newer.loc[newer["프로모션명"] == "P7", "비고"] = "다른 사람"
+
+    restored = PromotionDraft(newer)
+    assert restored.reapply(lost) == 1  # P3는 찾지 못함
+    frame = restored.frame().set_index("프로모션명")
+    assert frame.loc["P1", "진척율"] == 55
+    assert "P5" not in frame.index and "NEW" in frame.index
+    assert frame.loc["P7", "비고"] == "다른 사람"
+    assert frame.loc["P3-renamed", "비고"] == "-"
+    assert restored.undo() == "저장하지 못한 변경 되살리기" and not restored.dirty
+
+
+def test_reapply_added_column_values(base):
+    lost = PromotionDraft(base)
+    lost.add_column("예산", "0")
+    lost.set_cell(2, "예산", "500")
+    newer = base.copy()
+    newer.loc[0, "진척율"] = 1
+    restored = PromotionDraft(newer)
+    restored.reapply(lost)
+    frame = restored.frame()
+    assert frame["예산"].tolist() == ["0", "0", "500"] + ["0"] * 7
+    assert frame.loc[0, "진척율"] == 1
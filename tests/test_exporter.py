@@ -0,0 +1,19 @@
+import pandas as pd
+
+import exporter
+from exporter import ExportCache, deferred_export
+
+
+def test_deferred_export_loads_data_only_when_opened(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "export_cache", ExportCache(str(tmp_path)))
+    calls = []
+
+    def load():
+        calls.append(1)
+        return pd.DataFrame({"Content": ["a", "b"]})
+
+    data = deferred_export(load, "CSV", "weekly_reports")
+    assert calls == []
+    with data() as f:
+        assert f.read().decode("utf-8-sig").splitlines() == ["Content", "a", "b"]
+    assert calls == [1]
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from filter_index import FilterIndex
+
+
+@pytest.fixture(scope="module")
+def promotions():
+    rng = np.random.default_rng(3)
+    n = 203  # 8의 배수가 아니어도 마지막 바이트의 남는 비트가 결과에 섞이지 않아야 함
+    return pd.DataFrame({
+        "프로모션명": [f"P{i}" for i in range(n)],
+        "채널": pd.Categorical(rng.choice(["On Trade", "Off Trade", "기타"], n)),
+        "담당자": rng.choice(["kim", "lee", "park", None], n),
+        "상태": rng.choice(["대기", "진행중", "완료"], n),
+        "진척율": rng.integers(0, 101, n).astype("int8"),
+    })
+
+
+def test_match_and_combinations(promotions):
+    index = FilterIndex(promotions)
+    on = index.match("채널", ["On Trade"])
+    kim_lee = index.match("담당자", ["kim", "lee"])
+    expected = (promotions["채널"] == "On Trade") & promotions["담당자"].isin(["kim", "lee"])
+    bits = on & kim_lee
+    assert index.count(bits) == expected.sum()
+    assert index.take(bits)["프로모션명"].tolist() == promotions.loc[expected, "프로모션명"].tolist()
+
+    done = index.match("상태", ["완료"])
+    rest = index.exclude(index.all_rows(), done)
+    assert index.count(rest) == (promotions["상태"] != "완료").sum()
+    assert index.count(index.all_rows()) == len(promotions)
+
+
+def test_unknown_value_and_missing(promotions):
+    index = FilterIndex(promotions)
+    assert index.count(index.match("상태", ["없는 상태"])) == 0
+    # 빈 칸도 선택지 하나로 나와서 선택지별 건수를 더하면 전체 행 수
+    options = index.options("담당자", index.all_rows())
+    assert len(options) == 4
+    assert sum(index.count(index.match("담당자", [v])) for v in options) == len(promotions)
+
+
+def test_options_follow_previous_filters(promotions):
+    index = FilterIndex(promotions)
+    assert "진척율" not in index.columns
+    assert index.options("상태", index.all_rows()) == ["대기", "완료", "진행중"]
+    bits = index.match("담당자", ["kim"]) & index.match("상태", ["완료"])
+    subset = promotions[(promotions["담당자"] == "kim") & (promotions["상태"] == "완료")]
+    assert index.options("채널", bits) == sorted(subset["채널"].astype(str).unique())
+    assert index.options("없는 컬럼", bits) == []
+
+
+def test_take_all_returns_frame_itself(promotions):
+    index = FilterIndex(promotions)
+    assert index.take(index.all_rows()) is promotions
+
+
+def test_precomputed_metrics(promotions):
+    index = FilterIndex(promotions)
+    assert index.status_counts == promotions["상태"].value_counts().to_dict()
+    active = promotions.loc[promotions["상태"] != "완료", "진척율"]
+    assert index.active_progress_mean == pytest.approx(active.mean())
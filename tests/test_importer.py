@@ -0,0 +1,67 @@
+import io
+
+import pandas as pd
+import pytest
+
+import importer
+from importer import merge_on_key, read_promotions_csv
+from schema import conform_promotions
+
+CSV_HEADER = "프로모션명,상태,진척율,시작일,종료일\n"
+
+
+@pytest.fixture(params=["arrow", "pandas"])
+def reader(request, monkeypatch):
+    """pyarrow 스트리밍 리더와 pandas 리더 양쪽으로 같은 검사"""
+    if request.param == "pandas":
+        monkeypatch.setattr(importer, "pa", None)
+    elif importer.pa is None:
+        pytest.skip("pyarrow 없음")
+    return lambda text, **kw: read_promotions_csv(io.BytesIO(text.encode("utf-8")), **kw)
+
+
+@pytest.fixture
+def current():
+    return conform_promotions(pd.DataFrame({
+        "프로모션명": ["A", "B"], "상태": ["진행중", "대기"], "진척율": [70, 10],
+        "시작일": ["2026-01-01", "2026-02-01"], "종료일": ["2026-03-01", "2026-04-01"],
+    }))
+
+
+def test_merge_keeps_existing_value_for_blank_cells(reader, current):
+    result = reader(CSV_HEADER + "A,,,,\nB,완료,,,2026-05-01\n", merge_key="프로모션명")
+    merged = merge_on_key(current, result.df, blank=result.blank)
+
+    assert merged["진척율"].tolist() == [70, 10]  # 빈 진척율이 0으로 덮이지 않음
+    assert merged["상태"].astype(str).tolist() == ["진행중", "완료"]
+    assert merged["종료일"].dt.strftime("%Y-%m-%d").tolist() == ["2026-03-01", "2026-05-01"]
+
+
+def test_merge_overwrites_explicit_zero(reader, current):
+    result = reader(CSV_HEADER + "A,,0,,\n", merge_key="프로모션명")
+    merged = merge_on_key(current, result.df, blank=result.blank)
+    assert merged["진척율"].tolist() == [0, 10]
+
+
+def test_merge_reports_rows_without_key(reader, current):
+    result = reader(CSV_HEADER + "A,완료,,,\n,대기,30,,\n  ,대기,40,,\n", merge_key="프로모션명")
+
+    assert len(result.df) == 1 and result.skipped == 2
+    missing = result.issues[result.issues["컬럼"] == "프로모션명"]
+    assert missing["행"].tolist() == [3, 4]
+    assert missing["사유"].str.contains("병합에서 제외").all()
+
+
+def test_replace_keeps_rows_without_key(reader):
+    result = reader(CSV_HEADER + "A,완료,,,\n,대기,30,,\n")
+    assert len(result.df) == 2 and result.skipped == 0
+    assert result.issues["사유"].tolist() == ["프로모션명 없음"]
+
+
+def test_blank_mask_spans_chunks(reader, current):
+    rows = "".join(f"N{i},대기,{i},,\n" for i in range(5)) + "A,,,,\n"
+    result = reader(CSV_HEADER + rows, chunk_rows=2, merge_key="프로모션명")
+    assert result.blank.shape == result.df.shape
+    merged = merge_on_key(current, result.df, blank=result.blank)
+    assert merged.loc[merged["프로모션명"] == "A", "진척율"].tolist() == [70]
+    assert len(merged) == 7
@@ -0,0 +1,62 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from interval_index import PromotionIntervals
+
+
+@pytest.fixture(scope="module")
+def promotions():
+    rng = np.random.default_rng(7)
+    n = 500  # 잎 크기(32)보다 훨씬 커서 중심점 노드까지 탐색
+    start = pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 365, n), unit="D")
+    end = start + pd.to_timedelta(rng.integers(-5, 60, n), unit="D")  # 일부는 시작일보다 빠름
+    df = pd.DataFrame({"프로모션명": [f"P{i}" for i in range(n)], "시작일": start, "종료일": end})
+    df.loc[rng.choice(n, 20, replace=False), "시작일"] = pd.NaT
+    df.loc[rng.choice(n, 20, replace=False), "종료일"] = pd.NaT
+    return df
+
+
+def brute_force(df, a, b):
+    """시작일이 없으면 제외, 종료일이 없거나 시작일보다 빠르면 시작일 하루짜리"""
+    start, end = df["시작일"], df["종료일"]
+    end = end.where(end.notna() & (end >= start), start)
+    return np.flatnonzero((start.notna() & (start <= b) & (end >= a)).to_numpy())
+
+
+def test_overlapping_matches_brute_force(promotions):
+    intervals = PromotionIntervals(promotions)
+    assert len(intervals) + intervals.undated == len(promotions)
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        a = pd.Timestamp("2025-12-01") + pd.Timedelta(days=int(rng.integers(0, 480)))
+        b = a + pd.Timedelta(days=int(rng.integers(0, 40)))
+        expected = brute_force(promotions, a, b)
+        assert intervals.overlapping(a, b).tolist() == expected.tolist()
+        assert intervals.count(a, b) == len(expected)
+
+
+def test_single_day_and_active(promotions):
+    intervals = PromotionIntervals(promotions)
+    day = pd.Timestamp("2026-06-15")
+    expected = brute_force(promotions, day, day)
+    assert intervals.overlapping(day).tolist() == expected.tolist()
+    assert intervals.active(datetime.date(2026, 6, 15)).index.tolist() == promotions.index[expected].tolist()
+
+
+def test_weekly_counts_match_brute_force(promotions):
+    intervals = PromotionIntervals(promotions)
+    counts = intervals.weekly_counts("2026-03-02", "2026-05-25")
+    assert len(counts) == 13
+    for week, count in counts.items():
+        a = pd.Timestamp(week)
+        assert count == len(brute_force(promotions, a, a + pd.Timedelta(days=6)))
+
+
+def test_without_date_columns():
+    intervals = PromotionIntervals(pd.DataFrame({"프로모션명": ["A", "B"]}))
+    assert len(intervals) == 0 and intervals.undated == 2
+    assert intervals.overlapping("2026-01-01", "2026-12-31").tolist() == []
+    assert intervals.count("2026-01-01") == 0
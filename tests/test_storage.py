@@ -0,0 +1,117 @@
+import pytest
+
+from benchmarks.synthetic import make_promotions
+from frame_diff import diff_frames
+from sheet_rows import ConcurrentModificationError
+
+
+@pytest.fixture(params=["sheets", "sqlite"])
+def backend(request):
+    backend = request.getfixturevalue(request.param)
+    backend.write_promotions(make_promotions(rows=30, people=5, extra_cols=1))
+    return backend
+
+
+def edit(base):
+    """칸 수정, 행 삭제/추가, 컬럼 추가를 섞은 draft"""
+    draft = base.copy()
+    draft.loc[3, "진척율"] = 77
+    draft.loc[10, "비고1"] = "수정"
+    draft = draft.drop(index=[5, 20])
+    draft.loc[len(base)] = draft.loc[4]
+    draft.loc[len(base), "프로모션명"] = "NEW"
+    draft["예산"] = "-"
+    draft.loc[7, "예산"] = "100"
+    return draft
+
+
+def same_rows(left, right):
+    return diff_frames(left.reset_index(drop=True), right.reset_index(drop=True), size_check=False).empty
+
+
+# ---------------------------------------------------------
+# 변경분 반영
+# ---------------------------------------------------------
+def test_diff_round_trip(backend):
+    base = backend.read_promotions()
+    draft = edit(base)
+    diff = diff_frames(base, draft)
+    assert not diff.rewrite
+    backend.apply_promotions_diff(base, diff, draft)
+    assert same_rows(backend.read_promotions(), draft)
+
+
+def test_sheets_writes_only_changed_cells(sheets, sheets_conn):
+    sheets.write_promotions(make_promotions(rows=200, people=5, extra_cols=1))
+    base = sheets.read_promotions()
+    draft = base.copy()
+    draft.loc[3, "진척율"] = 77
+    sheets_conn.stats.reset()
+    sheets.apply_promotions_diff(base, diff_frames(base, draft), draft)
+    assert sheets_conn.stats.cells_written == 1
+
+
+# ---------------------------------------------------------
+# 스냅샷 충돌 감지 (verify_snapshot)
+# ---------------------------------------------------------
+def remote(sheets_conn):
+    return sheets_conn.worksheets["promotions"].grid
+
+
+def test_conflict_when_touched_row_key_changed(backend, sheets_conn):
+    base = backend.read_promotions()
+    if backend.name == "gsheets":
+        remote(sheets_conn)[1 + 3][0] = "다른 사람이 바꾼 이름"
+    else:
+        other = base.copy()
+        other.loc[3, "프로모션명"] = "다른 사람이 바꾼 이름"
+        backend.apply_promotions_diff(base, diff_frames(base, other), other)
+    draft = base.copy()
+    draft.loc[3, "진척율"] = 77
+    with pytest.raises(ConcurrentModificationError):
+        backend.apply_promotions_diff(base, diff_frames(base, draft), draft)
+
+
+def test_sheets_conflict_when_rows_appended(sheets, sheets_conn):
+    sheets.write_promotions(make_promotions(rows=30, people=5, extra_cols=1))
+    base = sheets.read_promotions()
+    remote(sheets_conn).append(list(remote(sheets_conn)[1]))
+    draft = base.copy()
+    draft.loc[3, "진척율"] = 77
+    with pytest.raises(ConcurrentModificationError, match="행 수"):
+        sheets.apply_promotions_diff(base, diff_frames(base, draft), draft)
+
+
+def test_sheets_conflict_when_header_changed(sheets, sheets_conn):
+    sheets.write_promotions(make_promotions(rows=30, people=5, extra_cols=1))
+    base = sheets.read_promotions()
+    remote(sheets_conn)[0][1] = "판매 채널"
+    draft = base.copy()
+    draft.loc[3, "진척율"] = 77
+    before = [list(r) for r in remote(sheets_conn)]
+    with pytest.raises(ConcurrentModificationError, match="컬럼"):
+        sheets.apply_promotions_diff(base, diff_frames(base, draft), draft)
+    assert remote(sheets_conn) == before
+
+
+def test_sheets_keeps_other_rows_changed_remotely(sheets, sheets_conn):
+    sheets.write_promotions(make_promotions(rows=30, people=5, extra_cols=1))
+    base = sheets.read_promotions()
+    remote(sheets_conn)[1 + 8][4] = "12%"  # 건드리지 않는 행의 값만 바뀐 경우는 통과
+    draft = base.copy()
+    draft.loc[3, "진척율"] = 77
+    sheets.apply_promotions_diff(base, diff_frames(base, draft), draft)
+    sheets.cache.clear()
+    progress = sheets.read_promotions()["진척율"]
+    assert (progress[3], progress[8]) == (77, 12)
+
+
+def test_sheets_conflict_invalidates_cached_snapshot(sheets, sheets_conn):
+    sheets.write_promotions(make_promotions(rows=30, people=5, extra_cols=1))
+    base = sheets.read_promotions()
+    remote(sheets_conn)[1 + 3][0] = "RENAMED"
+    draft = base.copy()
+    draft.loc[3, "진척율"] = 77
+    with pytest.raises(ConcurrentModificationError):
+        sheets.apply_promotions_diff(base, diff_frames(base, draft), draft)
+    assert sheets.read_promotions().loc[3, "프로모션명"] == "RENAMED"
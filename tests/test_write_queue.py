@@ -0,0 +1,284 @@
+import pandas as pd
+import pytest
+
+from frame_diff import diff_frames
+from sheet_rows import ConcurrentModificationError
+from storage import prepare_reports
+import report_search
+import write_queue
+from write_queue import FAILED, FLUSHED, PENDING, WriteQueue, resync_derived
+
+
+def report(week, assignee, *contents):
+    return prepare_reports(pd.DataFrame({
+        "Week_Start": week, "Assignee": assignee, "Type": "금주 실적", "Project": "P",
+        "Content": list(contents), "Status": "정상",
+    }))
+
+
+def promotions(*progress):
+    return pd.DataFrame({"프로모션명": ["A", "B"][:len(progress)], "상태": "대기", "진척율": list(progress)})
+
+
+@pytest.fixture
+def queue(tmp_path, sqlite):
+    # interval > 0이어야 항목별 재시도 간격이 생김 (작업 스레드는 띄우지 않고 flush()를 직접 호출)
+    q = WriteQueue(path=str(tmp_path / "queue.sqlite3"), storage=lambda: sqlite, interval=10, max_backoff=60)
+    q.start = lambda: None
+    return q
+
+
+def fail_for(backend, monkeypatch, week, error, calls=None):
+    """week의 보고서 저장만 error로 실패시킴 (calls에 저장 시도한 key를 기록)"""
+    upsert = backend.upsert_reports
+
+    def flaky(key, df):
+        if calls is not None:
+            calls.append(key)
+        if key[0] == week:
+            raise error
+        return upsert(key, df)
+    monkeypatch.setattr(backend, "upsert_reports", flaky)
+
+
+# ---------------------------------------------------------
+# 같은 대상의 저장 합치기
+# ---------------------------------------------------------
+def test_report_saves_coalesce(queue, sqlite, monkeypatch):
+    first = queue.enqueue_report(("2026-10-12", "kim"), report("2026-10-12", "kim", "초안"))
+    second = queue.enqueue_report(("2026-10-12", "kim"), report("2026-10-12", "kim", "최종", "추가"))
+    assert first == second and queue.pending_count() == 1
+    overlay = queue.overlay_reports(sqlite.read_reports(), lambda key: True)
+    assert overlay["Content"].tolist() == ["최종", "추가"]
+
+    calls = []
+    upsert = sqlite.upsert_reports
+    monkeypatch.setattr(sqlite, "upsert_reports", lambda key, df: (calls.append(key), upsert(key, df))[1])
+    assert queue.flush() == 1 and len(calls) == 1
+    assert sqlite.read_reports(week_start="2026-10-12")["Content"].tolist() == ["최종", "추가"]
+
+
+def test_promotions_saves_coalesce_with_relabel(queue, sqlite):
+    sqlite.write_promotions(promotions(0, 0))
+    base = sqlite.read_promotions()
+    first = base.drop(index=[0])
+    first.loc[2] = {"프로모션명": "C", "상태": "대기", "진척율": 0}
+    queue.enqueue_promotions(base, first)
+
+    # 두 번째 저장은 덧씌운 view(위치 라벨: 0=B, 1=C) 기준
+    view = queue.overlay_promotions(base)
+    assert view["프로모션명"].tolist() == ["B", "C"] and view.index.tolist() == [0, 1]
+    second = view.copy()
+    second.loc[1, "진척율"] = 30   # 첫 저장에서 추가한 행
+    second.loc[2] = {"프로모션명": "D", "상태": "대기", "진척율": 40}
+    queue.enqueue_promotions(view, second)
+    assert queue.pending_count() == 1
+
+    assert queue.flush() == 1
+    stored = sqlite.read_promotions()
+    assert stored["프로모션명"].tolist() == ["B", "C", "D"]
+    assert stored["진척율"].tolist() == [0, 30, 40]
+
+
+def test_stale_base_is_rejected_while_pending(queue, sqlite):
+    sqlite.write_promotions(promotions(0, 0))
+    base = sqlite.read_promotions()
+    edited = base.copy()
+    edited.loc[0, "진척율"] = 10
+    queue.enqueue_promotions(base, edited)
+    with pytest.raises(ConcurrentModificationError):
+        queue.enqueue_promotions(base, base.copy())  # 대기 중인 저장을 모르고 편집한 경우
+    assert queue.overlay_promotions(base)["진척율"].tolist() == [10, 0]
+
+
+def test_resaved_during_flush_stays_pending(queue, sqlite, monkeypatch):
+    sqlite.write_promotions(promotions(0, 0))
+    base = sqlite.read_promotions()
+    first = base.copy()
+    first.loc[0, "진척율"] = 10
+    queue.enqueue_promotions(base, first)
+
+    apply = sqlite.apply_promotions_diff
+
+    def save_again(*args):
+        apply(*args)
+        view = queue.overlay_promotions(base)
+        again = view.copy()
+        again.loc[1, "진척율"] = 20
+        queue.enqueue_promotions(view, again)
+    monkeypatch.setattr(sqlite, "apply_promotions_diff", save_again)
+    queue.flush()
+    assert queue.pending_count() == 1
+
+    monkeypatch.setattr(sqlite, "apply_promotions_diff", apply)
+    assert queue.flush() == 1
+    assert sqlite.read_promotions()["진척율"].tolist() == [10, 20]
+
+
+def test_pending_entries_survive_restart(queue, sqlite, tmp_path):
+    queue.enqueue_report(("2026-10-12", "kim"), report("2026-10-12", "kim", "재시작 전"))
+    restarted = WriteQueue(path=str(tmp_path / "queue.sqlite3"), storage=lambda: sqlite, interval=10)
+    restarted.start = lambda: None
+    assert restarted.pending_count() == 1
+    assert restarted.flush() == 1
+    assert sqlite.read_reports(week_start="2026-10-12")["Content"].tolist() == ["재시작 전"]
+
+
+# ---------------------------------------------------------
+# 일시적 실패: 한 항목이 뒤 항목을 막지 않음
+# ---------------------------------------------------------
+def test_failing_entry_does_not_block_later_entries(queue, sqlite, monkeypatch):
+    fail_for(sqlite, monkeypatch, "2026-10-05", RuntimeError("APIError 400"))
+    queue.enqueue_report(("2026-10-05", "kim"), report("2026-10-05", "kim", "막힘"))
+    queue.enqueue_report(("2026-10-12", "lee"), report("2026-10-12", "lee", "다음"))
+
+    assert queue.flush() == 1
+    assert queue.status("report", ("2026-10-05", "kim"))["status"] == PENDING
+    assert queue.status("report", ("2026-10-12", "lee"))["status"] == FLUSHED
+    assert sqlite.read_reports(week_start="2026-10-12")["Content"].tolist() == ["다음"]
+
+
+def test_failing_entry_waits_for_its_own_backoff(queue, sqlite, monkeypatch):
+    calls = []
+    fail_for(sqlite, monkeypatch, "2026-10-05", RuntimeError("429"), calls)
+    queue.enqueue_report(("2026-10-05", "kim"), report("2026-10-05", "kim", "막힘"))
+    with pytest.raises(RuntimeError):
+        queue.flush()  # 시도한 항목이 모두 실패하면 작업 스레드도 간격을 늘리도록 예외
+    queue.enqueue_report(("2026-10-12", "lee"), report("2026-10-12", "lee", "다음"))
+
+    assert queue.flush() == 1
+    assert [k[0] for k in calls] == ["2026-10-05", "2026-10-12"]  # 두 번째 반영에서는 막힌 항목을 건너뜀
+    assert queue.stats()["retrying"] == 1
+
+
+def test_resave_retries_immediately(queue, sqlite, monkeypatch):
+    fail_for(sqlite, monkeypatch, "2026-10-05", RuntimeError("schema"))
+    queue.enqueue_report(("2026-10-05", "kim"), report("2026-10-05", "kim", "1"))
+    with pytest.raises(RuntimeError):
+        queue.flush()
+    monkeypatch.undo()
+    queue.enqueue_report(("2026-10-05", "kim"), report("2026-10-05", "kim", "2"))
+    assert queue.flush() == 1
+    assert sqlite.read_reports(week_start="2026-10-05")["Content"].tolist() == ["2"]
+
+
+# ---------------------------------------------------------
+# 실패 분류
+# ---------------------------------------------------------
+def test_value_error_is_retried_not_dropped(queue, sqlite, monkeypatch):
+    fail_for(sqlite, monkeypatch, "2026-10-05", ValueError("bug"))
+    queue.enqueue_report(("2026-10-05", "kim"), report("2026-10-05", "kim", "남아야 함"))
+    with pytest.raises(ValueError):
+        queue.flush()
+    assert queue.status("report", ("2026-10-05", "kim"))["status"] == PENDING
+    assert queue.pending_count() == 1
+
+
+def test_archived_quarter_fails_permanently(queue, sqlite):
+    sqlite.upsert_reports(("2020-01-06", "kim"), report("2020-01-06", "kim", "옛 보고"))
+    assert sqlite.archive_reports(1) == ["2020Q1"]
+    failed = []
+    queue.on_failed = lambda storage, entry: failed.append(entry.key)
+
+    queue.enqueue_report(("2020-01-06", "kim"), report("2020-01-06", "kim", "수정"))
+    assert queue.flush() == 0
+    status = queue.status("report", ("2020-01-06", "kim"))
+    assert status["status"] == FAILED and "보관" in status["last_error"]
+    assert len(failed) == 1 and queue.pending_count() == 0
+
+
+def test_promotions_conflict_fails_permanently(queue, sqlite):
+    sqlite.write_promotions(promotions(0, 0))
+    base = sqlite.read_promotions()
+    edited = base.copy()
+    edited.loc[0, "진척율"] = 50
+    queue.enqueue_promotions(base, edited)
+    sqlite.write_promotions(pd.DataFrame({"프로모션명": ["B", "A"], "상태": ["대기", "대기"], "진척율": [0, 0]}))
+
+    assert queue.flush() == 0
+    assert queue.status("promotions", "promotions")["status"] == FAILED
+    with pytest.raises(ConcurrentModificationError):
+        sqlite.apply_promotions_diff(base, diff_frames(base, edited), edited)
+
+
+# ---------------------------------------------------------
+# 프로모션 저장 요청의 스냅샷 확인
+# ---------------------------------------------------------
+def test_snapshot_is_read_outside_the_lock(queue, sqlite, monkeypatch):
+    sqlite.write_promotions(promotions(0, 0))
+    base = sqlite.read_promotions()
+    read = sqlite.read_promotions
+    held = []
+    monkeypatch.setattr(sqlite, "read_promotions", lambda: (held.append(queue._lock.locked()), read())[1])
+
+    edited = base.copy()
+    edited.loc[0, "진척율"] = 10
+    queue.enqueue_promotions(base, edited)
+    assert held == [False]
+
+
+def test_snapshot_is_checked_again_when_pending_save_lands_first(queue, sqlite, monkeypatch):
+    sqlite.write_promotions(promotions(0, 0))
+    base = sqlite.read_promotions()
+    first = base.copy()
+    first.loc[0, "진척율"] = 10
+    queue.enqueue_promotions(base, first)
+
+    # 대기 항목이 있어 확인을 건너뛴 직후, 잠금을 잡기 전에 그 항목이 반영됨
+    try_enqueue = queue._try_enqueue
+
+    def flush_first(*args):
+        if queue.pending_count():
+            queue.flush()
+        return try_enqueue(*args)
+    monkeypatch.setattr(queue, "_try_enqueue", flush_first)
+
+    second = base.copy()
+    second.loc[1, "진척율"] = 20
+    with pytest.raises(ConcurrentModificationError):
+        queue.enqueue_promotions(base, second)
+    assert sqlite.read_promotions()["진척율"].tolist() == [10, 0]
+    assert queue.pending_count() == 0
+
+
+# ---------------------------------------------------------
+# 실패한 저장이 미리 반영한 집계/검색 되돌림
+# ---------------------------------------------------------
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def update(self, key, df):
+        self.calls.append((key, df["Content"].tolist()))
+
+    def apply_report(self, key, df):
+        self.calls.append((key, df["Content"].tolist()))
+
+
+def test_failed_report_resyncs_search_and_rollups(queue, sqlite, monkeypatch):
+    sqlite.upsert_reports(("2020-01-06", "kim"), report("2020-01-06", "kim", "원래 보고"))
+    sqlite.archive_reports(1)
+    search, rollups = Recorder(), Recorder()
+    monkeypatch.setattr(report_search, "get_report_search", lambda: search)
+    monkeypatch.setattr(write_queue, "get_rollups", lambda: rollups)
+    queue.on_failed = resync_derived
+
+    queue.enqueue_report(("2020-01-06", "kim"), report("2020-01-06", "kim", "저장 못 한 보고"))
+    queue.flush()
+    assert search.calls == rollups.calls == [(("2020-01-06", "kim"), ["원래 보고"])]
+
+
+def test_pending_promotions_overlay_is_the_same_object_per_revision(queue, sqlite):
+    sqlite.write_promotions(promotions(0, 0))
+    base = sqlite.read_promotions()
+    edited = base.copy()
+    edited.loc[0, "진척율"] = 10
+    queue.enqueue_promotions(base, edited)
+    view = queue.overlay_promotions(base)
+    assert queue.overlay_promotions(base) is view  # 캐시에 등록한 파생 객체를 재실행마다 다시 씀
+    assert view["진척율"].tolist() == [10, 0]
+
+    again = view.copy()
+    again.loc[1, "진척율"] = 20
+    queue.enqueue_promotions(view, again)
+    assert queue.overlay_promotions(base) is not view
@@ -0,0 +1,263 @@
+import datetime
+
+import streamlit as st
+
+from data import archive_weekly_reports, load_report_partitions, partition_weekly_reports, rebuild_rollups, save_promotions, write_status
+from editor_view import EditorView, search_labels
+from exporter import EXPORT_FORMATS, available_formats, deferred_export, export_file_name
+from importer import read_promotions_csv
+from page_utils import apply_editor_changes, keep_until_flushed, reset_draft, restore_failed_save, safe_rerun, show_write_status
+from perf import perf
+from perf_panel import render_perf_panel
+from report_cards import page_of
+from settings import EDITOR_PAGE_SIZE, REPORT_KEEP_QUARTERS
+
+# ---------------------------------------------------------
+# 관리자 페이지
+# ---------------------------------------------------------
+# 3.1 관리자 인증
+if not st.session_state.get('is_admin_unlocked', False):
+    st.title("⚙️ 관리자 인증")
+    with st.form("admin_login"):
+        pw = st.text_input("관리자 암호", type="password")
+        if st.form_submit_button("로그인"):
+            if pw == "diageorcg":
+                st.session_state.is_admin_unlocked = True
+                reset_draft()
+                safe_rerun()
+            else:
+                st.error("암호 오류")
+else:
+    # 3.2 관리자 메인 화면
+    c1, c2 = st.columns([2, 1])
+    with c1:
+        st.title("⚙️ 데이터 관리")
+    with c2:
+        st.markdown("######") # 간격
+        if st.button("💾 저장", type="primary", use_container_width=True):
+            draft = st.session_state.draft
+            with st.spinner("구글 시트에 저장 중..."):
+                if save_promotions(draft.frame(), base=draft.base, diff=draft.diff()):
+                    keep_until_flushed(draft)  # 반영에 실패하면 되살릴 수 있도록 반영될 때까지 보관
+                    reset_draft()
+                    st.toast("✅ 저장 완료! 대시보드에 적용되었습니다.", icon="🎉")
+        if st.button("🔄 최신 데이터 불러오기", use_container_width=True, help="저장하지 않은 수정 내용은 사라집니다."):
+            reset_draft()
+            safe_rerun()
+
+    st.info("💡 아래에서 데이터를 수정(Draft)한 후, 우측 상단의 **'저장'** 버튼을 눌러야 구글 시트에 반영됩니다.")
+    restore_failed_save()
+    show_write_status(write_status())
+
+    draft = st.session_state.draft
+    draft_df = draft.frame()
+
+    # -----------------------------------------------------
+    # 기능 1: 컬럼(열) 관리
+    # -----------------------------------------------------
+    with st.expander("🛠️ 컬럼(열) 추가 및 삭제", expanded=False):
+        col_add, col_del = st.columns(2)
+        with col_add:
+            new_col_name = st.text_input("추가할 컬럼명")
+            if st.button("컬럼 추가", use_container_width=True):
+                if new_col_name and new_col_name not in draft_df.columns:
+                    draft.add_column(new_col_name, "-")
+                    st.success(f"'{new_col_name}' 추가됨 (임시)")
+                    safe_rerun()
+                elif new_col_name in draft_df.columns:
+                    st.error("이미 존재하는 컬럼입니다.")
+
+        with col_del:
+            protected_cols = ['프로모션명', '상태', '진척율']
+            deletable = [c for c in draft_df.columns if c not in protected_cols]
+            del_col = st.selectbox("삭제할 컬럼 선택", deletable)
+            if st.button("컬럼 삭제", type="primary", use_container_width=True):
+                if del_col:
+                    draft.drop_column(del_col)
+                    st.success(f"'{del_col}' 삭제됨 (임시)")
+                    safe_rerun()
+
+    # -----------------------------------------------------
+    # 기능 2: 행(Row) 추가
+    # -----------------------------------------------------
+    with st.expander("➕ 새 데이터(행) 추가", expanded=False):
+        with st.form("add_row_form"):
+            st.markdown("**기본 정보**")
+            c1, c2 = st.columns(2)
+            in_name = c1.text_input("프로모션명")
+            in_status = c2.selectbox("상태", ["기획단계", "대기", "진행중", "완료", "보류"])
+            in_progress = st.slider("진척율 (%)", 0, 100, 0)
+
+            c3, c4 = st.columns(2)
+            in_start = c3.date_input("시작일", datetime.date.today())
+            in_end = c4.date_input("종료일", datetime.date.today() + datetime.timedelta(days=7))
+
+            # 동적 컬럼 입력
+            dynamic_data = {}
+            reserved = ['프로모션명', '상태', '진척율', '시작일', '종료일']
+            others = [c for c in draft_df.columns if c not in reserved]
+
+            if others:
+                st.markdown("**추가 정보**")
+                dc_cols = st.columns(3)
+                for idx, col in enumerate(others):
+                    if col == '채널':
+                        dynamic_data[col] = dc_cols[idx % 3].selectbox(col, ["On Trade", "Off Trade", "기타"])
+                    else:
+                        dynamic_data[col] = dc_cols[idx % 3].text_input(col)
+
+            if st.form_submit_button("추가하기"):
+                if in_name:
+                    new_row = {
+                        "프로모션명": in_name,
+                        "상태": in_status,
+                        "진척율": in_progress,
+                        "시작일": in_start,
+                        "종료일": in_end
+                    }
+                    new_row.update(dynamic_data)
+
+                    draft.append_row(new_row)
+                    st.success("데이터 추가됨 (임시)")
+                    safe_rerun()
+                else:
+                    st.error("프로모션명은 필수입니다.")
+
+    # -----------------------------------------------------
+    # 기능 3: CSV 업로드 (덮어쓰기)
+    # -----------------------------------------------------
+    with st.expander("📂 CSV 파일로 덮어쓰기", expanded="import_report" in st.session_state):
+        if "import_report" in st.session_state:
+            summary, issues, issue_count = st.session_state.pop("import_report")
+            st.success(f"CSV 데이터 로드됨 (임시): {summary}. 상단 저장 버튼을 눌러 확정하세요.")
+            if issue_count:
+                st.warning(f"확인이 필요한 값 {issue_count}건 (행 번호는 CSV 기준, 최대 {len(issues)}건 표시)")
+                st.dataframe(issues, hide_index=True, use_container_width=True)
+
+        uploaded_file = st.file_uploader("CSV 파일 업로드", type=["csv"], label_visibility="collapsed")
+        import_mode = st.radio("가져오기 방식", ["전체 교체", "프로모션명 기준 병합 (갱신/추가)"], horizontal=True)
+        if uploaded_file:
+            if st.button("🔄 이 파일로 데이터 교체 (임시)", use_container_width=True):
+                bar = st.progress(0.0, text="CSV 읽는 중...")
+                try:
+                    replace = import_mode == "전체 교체"
+                    result = read_promotions_csv(
+                        uploaded_file,
+                        progress=lambda ratio, rows: bar.progress(ratio, text=f"CSV 읽는 중... {rows:,}행"),
+                        merge_key=None if replace else '프로모션명',
+                    )
+                    if replace:
+                        draft.replace(result.df)
+                    elif '프로모션명' not in result.df.columns:
+                        raise ValueError("병합하려면 '프로모션명' 컬럼이 필요합니다.")
+                    else:
+                        draft.merge(result.df, blank=result.blank)
+                    st.session_state.import_report = (result.summary(), result.issues, result.issue_count)
+                    safe_rerun()
+                except Exception as e:
+                    bar.empty()
+                    st.error(f"오류: {e}")
+
+    st.divider()
+
+    # -----------------------------------------------------
+    # 기능 4: 데이터 에디터 (수정) & 다운로드
+    # -----------------------------------------------------
+    st.subheader("✏️ 데이터 편집 (Draft)")
+
+    column_configuration = {
+        "진척율": st.column_config.NumberColumn("진척율", min_value=0, max_value=100, format="%d%%"),
+        "상태": st.column_config.SelectboxColumn("상태", options=["기획단계", "대기", "진행중", "완료", "보류"], required=True),
+        "시작일": st.column_config.DateColumn("시작일", format="YYYY-MM-DD"),
+        "종료일": st.column_config.DateColumn("종료일", format="YYYY-MM-DD"),
+    }
+    if "채널" in draft_df.columns:
+        column_configuration["채널"] = st.column_config.SelectboxColumn("채널", options=["On Trade", "Off Trade", "기타"])
+
+    # 검색/페이지: 편집기에는 한 페이지만 보내고, 변경은 on_change에서 변경분만 draft에 반영
+    c_col, c_text, c_page = st.columns([1, 2, 1])
+    search_col = c_col.selectbox("검색 컬럼", list(draft_df.columns), key="editor_search_col")
+    search_text = c_text.text_input("검색어", key="editor_search_text", placeholder="포함된 값으로 찾기")
+    labels = search_labels(draft_df, search_col, search_text)
+    page_labels, pages = page_of(labels, st.session_state.get("editor_page", 1), EDITOR_PAGE_SIZE)
+    if st.session_state.get("editor_page", 1) > pages:
+        st.session_state.editor_page = pages
+    editor_page = c_page.number_input(f"페이지 (총 {pages}쪽)", min_value=1, max_value=pages, step=1, key="editor_page")
+
+    params = (search_col, search_text, editor_page, EDITOR_PAGE_SIZE)
+    view = st.session_state.get("editor_view")
+    if view is None or not view.is_current(draft, params):
+        view = st.session_state.editor_view = EditorView(draft, params, page_labels)
+
+    st.caption(f"전체 {len(draft_df):,}행 중 {len(labels):,}행 일치, {len(view.labels)}행 표시")
+    with perf.span("admin.data_editor"):
+        st.data_editor(
+            view.df,
+            column_config=column_configuration,
+            hide_index=True,
+            use_container_width=True,
+            num_rows="dynamic",
+            key=view.key,
+            on_change=apply_editor_changes,
+        )
+
+    c_undo, c_log = st.columns([1, 3])
+    if c_undo.button("↩️ 되돌리기", disabled=not draft.history, use_container_width=True):
+        st.toast(f"되돌림: {draft.undo()}")
+        safe_rerun()
+    if draft.history:
+        c_log.caption("최근 변경: " + " · ".join(label for label, _ in reversed(draft.history[-5:])))
+
+    st.divider()
+
+    # 파일은 다운로드를 누를 때만 만들고, 같은 데이터면 만들어 둔 파일을 재사용
+    c_fmt, c_down, _ = st.columns([1, 1, 2])
+    export_fmt = c_fmt.selectbox("형식", available_formats(), key="export_fmt", label_visibility="collapsed")
+    c_down.download_button(
+        f"📥 현재 데이터 {export_fmt.split()[0]} 다운로드",
+        deferred_export(draft_df, export_fmt, "promotion_data"),
+        export_file_name("promotion_data", export_fmt),
+        EXPORT_FORMATS[export_fmt][1],
+    )
+
+    # -----------------------------------------------------
+    # 기능 5: 주간 보고 분기 보관
+    # -----------------------------------------------------
+    with st.expander("🗄️ 주간 보고 분기 보관", expanded=False):
+        # 분기 목록은 보고서 전체를 집계하므로 누를 때만 읽고 세션에 보관 (나누기/보관 후에는 다시 읽음)
+        if st.button("🔄 분기 목록 불러오기"):
+            st.session_state.report_partitions = load_report_partitions()
+        loaded = st.session_state.get("report_partitions")
+        if loaded is None:
+            st.caption("분기 목록을 불러오면 분기별 시트 나누기와 오래된 분기 보관을 할 수 있습니다.")
+        elif not loaded[0]:
+            st.info("주간 보고가 하나의 시트에 모두 들어 있습니다. 분기별 시트로 나누면 한 주를 볼 때 그 분기만 읽습니다.")
+            if st.button("🗂️ 분기별 시트로 나누기", help="기존 weekly_reports 시트는 그대로 남습니다. 다른 사용자가 저장하지 않을 때 실행하세요."):
+                created = partition_weekly_reports()
+                if created is not None:
+                    st.session_state.report_partitions = load_report_partitions()
+                    st.toast(f"{len(created)}개 분기로 나눴습니다.", icon="✅")
+                    safe_rerun()
+        else:
+            st.dataframe(loaded[1], hide_index=True, use_container_width=True)
+            if st.button(f"📦 최근 {REPORT_KEEP_QUARTERS}개 분기 이전 보관", help="오래된 분기를 압축해 보관 워크시트(로컬 DB는 보관 테이블) 하나로 옮기고 원래 행은 지웁니다. 보관된 분기는 조회만 가능합니다."):
+                archived = archive_weekly_reports()
+                if archived is not None:
+                    st.session_state.report_partitions = load_report_partitions()
+                    st.toast(f"보관한 분기: {', '.join(archived) or '없음'}", icon="📦")
+                    safe_rerun()
+
+    # -----------------------------------------------------
+    # 기능 6: 대시보드 집계 다시 만들기
+    # -----------------------------------------------------
+    with st.expander("📈 대시보드 집계", expanded=False):
+        st.info("대시보드 지표/추이는 저장할 때마다 변경분만 반영한 집계표를 사용합니다. 시트를 직접 수정했다면 다시 만들어 주세요. (지난 주의 프로모션 추이는 그대로 유지)")
+        if st.button("🔁 집계 다시 만들기"):
+            with st.spinner("전체 데이터를 읽어 집계하는 중..."):
+                if rebuild_rollups():
+                    st.toast("집계를 다시 만들었습니다.", icon="✅")
+
+    # 숨김 패널: 주소 끝에 ?perf=1 을 붙이면 표시
+    if st.query_params.get("perf") == "1":
+        st.divider()
+        render_perf_panel()
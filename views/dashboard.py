@@ -0,0 +1,100 @@
+import datetime
+
+import streamlit as st
+
+from data import load_progress_history, load_promotion_metrics, load_trends
+from filter_index import get_filter_index
+from page_utils import get_week_range
+from perf import perf
+from settings import TREND_WEEKS
+
+# ---------------------------------------------------------
+# 대시보드
+# ---------------------------------------------------------
+st.title("📊 프로모션 현황 대시보드")
+df = st.session_state.promotions
+with perf.span("dashboard.filter_index"):
+    index = get_filter_index(df)  # 데이터 버전당 한 번 생성, 세션 간 공유
+
+# 핵심 지표 (저장할 때마다 갱신되는 집계표에서 읽음, 집계표를 쓸 수 없으면 인덱스 값)
+with perf.span("dashboard.metrics"):
+    metrics = load_promotion_metrics(df, index) or {
+        "total": index.n, "status_counts": index.status_counts, "active_progress_mean": index.active_progress_mean,
+    }
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("전체 프로모션", f"{metrics['total']}건")
+c2.metric("진행중", f"{metrics['status_counts'].get('진행중', 0)}건")
+c3.metric("완료", f"{metrics['status_counts'].get('완료', 0)}건")
+
+# [수정] 평균 진척율 계산 시 완료 상태 제외
+c4.metric("평균 달성률(완료제외)", f"{metrics['active_progress_mean']:.1f}%")
+perf.first_paint()  # 핵심 지표까지가 첫 화면
+
+# 추이 (켰을 때만 집계표 조회, 주 수에 비례)
+if st.toggle("📈 추이 보기", key="show_trends"):
+    c_weeks, _ = st.columns([1, 3])
+    weeks = c_weeks.number_input("기간 (주)", min_value=4, max_value=156, value=TREND_WEEKS, step=4, key="trend_weeks")
+    week_to, _ = get_week_range(datetime.date.today())
+    week_from = week_to - datetime.timedelta(weeks=int(weeks) - 1)
+    with st.spinner("집계 불러오는 중..."), perf.span("dashboard.trends"):
+        trends = load_trends(str(week_from), str(week_to))
+
+    if trends is not None:  # 실패하면 load_trends가 오류를 표시
+        t_progress, t_status, t_channel, t_issues = st.tabs(["진척율", "상태별 건수", "채널별 건수", "담당자별 지연/중단"])
+        with t_progress:
+            st.line_chart(trends["progress"], y_label="평균 진척율(완료제외, %)")
+            names = sorted(df['프로모션명'].dropna().astype(str).unique()) if '프로모션명' in df.columns else []
+            name = st.selectbox("프로모션별 진척율", names, index=None, placeholder="프로모션 선택", key="trend_promotion")
+            history = load_progress_history(name, str(week_from), str(week_to)) if name else None
+            if history is not None:
+                st.line_chart(history, y_label="진척율(%)")
+        with t_status:
+            st.area_chart(trends["status"], y_label="건수")
+        with t_channel:
+            st.line_chart(trends["channel"], y_label="건수")
+        with t_issues:
+            issues = trends["issues"]
+            if issues.empty or not issues.to_numpy().any():
+                st.info("기간 내 지연/중단 보고가 없습니다.")
+            else:
+                st.bar_chart(issues.loc[:, issues.sum() > 0], y_label="지연/중단 보고 수")
+        st.caption("집계는 저장할 때마다 반영되며, 저장이 없던 주는 직전 주 값으로 표시합니다.")
+
+st.divider()
+
+# 필터 및 리스트 (비트맵 AND로 계산, 선택지는 앞선 필터 결과 기준)
+with st.expander("🔍 상세 필터", expanded=False):
+    f_cols = st.columns(3)
+    with perf.span("dashboard.filter_loop"):
+        mask = index.all_rows()
+        for i, col in enumerate(index.columns):
+            with f_cols[i%3]:
+                sel = st.multiselect(col, index.options(col, mask), key=f"d_{col}")
+                if sel: mask = mask & index.match(col, sel)
+
+st.subheader("📋 프로모션 리스트")
+
+# [추가] 탭으로 구분하여 보기 (진행중 / 완료 / 전체)
+done = index.match('상태', ['완료'])
+active_mask, completed_mask = index.exclude(mask, done), mask & done
+
+tab1, tab2, tab3 = st.tabs([
+    f"🔥 진행 중 ({index.count(active_mask)})", 
+    f"✅ 완료됨 ({index.count(completed_mask)})", 
+    f"📑 전체 목록 ({index.count(mask)})"
+])
+
+cfg = {
+    "진척율": st.column_config.ProgressColumn(format="%d%%", min_value=0, max_value=100),
+    "시작일": st.column_config.DateColumn(format="YYYY-MM-DD"),
+    "종료일": st.column_config.DateColumn(format="YYYY-MM-DD"),
+}
+
+with tab1:
+    st.dataframe(index.take(active_mask), column_config=cfg, use_container_width=True, hide_index=True)
+
+with tab2:
+    st.dataframe(index.take(completed_mask), column_config=cfg, use_container_width=True, hide_index=True)
+
+with tab3:
+    st.dataframe(index.take(mask), column_config=cfg, use_container_width=True, hide_index=True)
@@ -0,0 +1,60 @@
+import datetime
+
+import pandas as pd
+import plotly.express as px  # 이 페이지를 열 때만 로드
+import streamlit as st
+
+from interval_index import get_promotion_intervals
+from page_utils import get_week_range
+from perf import perf
+from settings import TIMELINE_MAX_BARS
+
+# ---------------------------------------------------------
+# 타임라인
+# ---------------------------------------------------------
+st.title("🗓️ 프로모션 타임라인")
+intervals = get_promotion_intervals(st.session_state.promotions)  # 데이터 버전당 한 번 생성, 세션 간 공유
+today = datetime.date.today()
+
+c_from, c_to = st.columns(2)
+tl_from, _ = get_week_range(c_from.date_input("시작 주", today - datetime.timedelta(weeks=12), key="timeline_from"))
+_, tl_to = get_week_range(c_to.date_input("끝 주", today + datetime.timedelta(weeks=12), key="timeline_to"))
+
+if tl_to < tl_from:
+    st.warning("끝 주가 시작 주보다 빠릅니다.")
+else:
+    with perf.span("timeline.query"):
+        active = intervals.active(tl_from, tl_to)
+        weekly = intervals.weekly_counts(tl_from, tl_to)
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("이번 주 진행 중", f"{intervals.count(*get_week_range(today))}건")
+    c2.metric("기간 내 프로모션", f"{len(active)}건")
+    c3.metric("주 평균 진행 중", f"{weekly.mean():.1f}건")
+    if intervals.undated:
+        st.caption(f"시작일이 없는 {intervals.undated}건은 타임라인에서 제외됩니다.")
+
+    st.subheader("📈 주별 진행 중 프로모션 수")
+    st.bar_chart(weekly)
+
+    st.subheader("📊 간트 차트")
+    if active.empty:
+        st.info("기간 내 프로모션이 없습니다.")
+    else:
+        color_options = [c for c in ["상태", "채널", "담당자"] if c in active.columns]
+        color = st.radio("색 구분", color_options, horizontal=True, key="timeline_color") if color_options else None
+        bars = active.sort_values("시작일", kind="stable").head(TIMELINE_MAX_BARS)
+        if len(active) > len(bars):
+            st.caption(f"시작일 순으로 {len(bars)}건만 표시합니다 (전체 {len(active)}건).")
+        # 종료일 당일까지 막대가 이어지도록 하루를 더함 (종료일이 없거나 시작일보다 빠르면 하루짜리)
+        end = bars["종료일"].where(bars["종료일"] >= bars["시작일"], bars["시작일"]) if "종료일" in bars.columns else bars["시작일"]
+        chart = bars.assign(_끝=end + pd.Timedelta(days=1))
+        with perf.span("timeline.gantt"):
+            fig = px.timeline(
+                chart, x_start="시작일", x_end="_끝", y="프로모션명", color=color,
+                hover_data={c: True for c in ["담당자", "진척율", "종료일"] if c in chart.columns} | {"_끝": False},
+            )
+            fig.update_yaxes(autorange="reversed", title=None)
+            fig.update_layout(height=max(320, 26 * len(bars) + 120), xaxis_range=[tl_from, tl_to + datetime.timedelta(days=1)])
+            fig.add_vline(x=str(today), line_dash="dot", line_color="red")
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,184 @@
+import datetime
+import time
+
+import pandas as pd
+import streamlit as st
+
+from data import load_weekly_reports, load_weekly_reports_range, save_weekly_report_entry, search_weekly_reports, write_status
+from exporter import EXPORT_FORMATS, available_formats, deferred_export, export_file_name
+from interval_index import get_promotion_intervals
+from page_utils import get_week_range, safe_rerun, show_write_status
+from perf import perf
+from report_cards import build_cards, page_of
+from schema import REPORT_STATUSES, REPORT_TYPES, to_plain
+from settings import CARD_PAGE_SIZE, CARD_RENDER_BUDGET_MS
+
+# ---------------------------------------------------------
+# 주간 업무
+# ---------------------------------------------------------
+st.title("📅 Weekly Business Review")
+
+col_date, col_view_opt = st.columns([1, 2])
+with col_date:
+    pick_date = st.date_input("기준 날짜", datetime.date.today())
+
+start_week, end_week = get_week_range(pick_date)
+week_str = str(start_week)
+
+with col_view_opt:
+    st.info(f"📆 **{start_week} ~ {end_week}** 주간 업무 보고")
+
+st.divider()
+
+tab_view, tab_write, tab_search = st.tabs(["📋 전체 팀원 보고서 조회 (Dashboard)", "✍️ 내 보고서 작성/수정", "🔎 보고서 검색"])
+
+# --- TAB 1: 조회 ---
+with tab_view:
+    with st.expander("📥 기간별 보고서 내보내기", expanded=False):
+        c_from, c_to, c_fmt = st.columns(3)
+        week_from, _ = get_week_range(c_from.date_input("시작 주", start_week - datetime.timedelta(weeks=4), key="export_from"))
+        week_to, _ = get_week_range(c_to.date_input("끝 주", start_week, key="export_to"))
+        report_fmt = c_fmt.selectbox("형식", available_formats(), key="report_export_fmt")
+        # 기간 보고서는 다운로드를 누를 때만 읽음
+        st.caption(f"{week_from} ~ {week_to + datetime.timedelta(days=6)}")
+        st.download_button(
+            "📥 다운로드",
+            deferred_export(lambda: load_weekly_reports_range(str(week_from), str(week_to)), report_fmt, "weekly_reports"),
+            export_file_name(f"weekly_reports_{week_from}_{week_to}", report_fmt),
+            EXPORT_FORMATS[report_fmt][1],
+        )
+
+    with st.spinner("데이터를 불러오는 중..."):
+        current_reports = load_weekly_reports(week_start=week_str)
+
+    if current_reports.empty:
+        st.warning("해당 주차에 제출된 보고서가 없습니다.")
+    else:
+        view_mode = st.radio("보기 방식", ["카드 뷰 (Card View)", "요약 테이블 (Summary)"], horizontal=True, label_visibility="collapsed")
+
+        if view_mode == "요약 테이블 (Summary)":
+            st.dataframe(
+                current_reports,
+                column_config={
+                    "Assignee": st.column_config.TextColumn("담당자", width="small"),
+                    "Content": st.column_config.TextColumn("업무 내용", width="large"),
+                    "Week_Start": None
+                },
+                use_container_width=True, hide_index=True
+            )
+        else:
+            started = time.perf_counter()
+            cards = build_cards(current_reports)
+            people, pages = page_of(list(cards), st.session_state.get("card_page", 1), CARD_PAGE_SIZE)
+            if st.session_state.get("card_page", 1) > pages:
+                st.session_state.card_page = pages  # 주차가 바뀌어 페이지 수가 줄어든 경우
+            if pages > 1:
+                st.number_input(f"페이지 (총 {pages}쪽, {len(cards)}명)", min_value=1, max_value=pages, step=1, key="card_page")
+
+            cols = st.columns(2)
+            for idx, person in enumerate(people):
+                with cols[idx % 2]:
+                    with st.container(border=True):
+                        st.markdown(cards[person])
+
+            # 카드 생성 + 렌더링 시간 (예산을 넘으면 표시)
+            st.session_state.card_render_ms = (time.perf_counter() - started) * 1000
+            perf.record("weekly.cards", st.session_state.card_render_ms)
+            if st.session_state.card_render_ms > CARD_RENDER_BUDGET_MS:
+                st.caption(f"⏱️ 카드 렌더링 {st.session_state.card_render_ms:.0f}ms (목표 {CARD_RENDER_BUDGET_MS}ms)")
+
+# --- TAB 2: 작성 ---
+with tab_write:
+    st.markdown("##### 📝 보고서 작성")
+    managers = list(st.session_state.promotions['담당자'].unique()) if '담당자' in st.session_state.promotions.columns else []
+    if "기타" not in managers: managers.append("기타")
+
+    c_sel, _ = st.columns([1, 2])
+    me = c_sel.selectbox("작성자(본인) 선택", managers, key="writer_select")
+    if me == "기타": me = c_sel.text_input("이름 직접 입력")
+
+    if me:
+        my_data = load_weekly_reports(week_start=week_str, assignee=me)
+        show_write_status(write_status("report", (week_str, me)))
+
+        if not my_data.empty:
+            input_df = to_plain(my_data.reset_index(drop=True))
+        else:
+            # 템플릿 생성 (한글로 변경)
+            tmpl = [
+                {"Week_Start": week_str, "Assignee": me, "Type": "금주 실적", "Project": "-", "Content": "", "Status": "정상"},
+                {"Week_Start": week_str, "Assignee": me, "Type": "금주 실적", "Project": "-", "Content": "", "Status": "정상"},
+                {"Week_Start": week_str, "Assignee": me, "Type": "차주 계획", "Project": "-", "Content": "", "Status": "정상"},
+                {"Week_Start": week_str, "Assignee": me, "Type": "차주 계획", "Project": "-", "Content": "", "Status": "정상"},
+            ]
+            input_df = pd.DataFrame(tmpl)
+
+        # 이번 주에 진행 중인 프로모션만 (이미 적어 둔 프로젝트는 기간이 지났어도 유지)
+        active_projects = get_promotion_intervals(st.session_state.promotions).active(start_week, end_week)
+        proj_list = list(dict.fromkeys(["-"] + active_projects.get('프로모션명', pd.Series(dtype=object)).dropna().astype(str).tolist()
+                                       + input_df['Project'].dropna().astype(str).tolist()))
+
+        edited_df = st.data_editor(
+            input_df,
+            column_config={
+                "Week_Start": None, "Assignee": None,
+                "Type": st.column_config.SelectboxColumn("구분", options=["금주 실적", "차주 계획", "이슈사항"], required=True),
+                "Project": st.column_config.SelectboxColumn("프로젝트", options=proj_list),
+                "Content": st.column_config.TextColumn("내용", required=True, width="large"),
+                "Status": st.column_config.SelectboxColumn("상태", options=["정상", "지연", "중단"], required=True)
+            },
+            num_rows="dynamic", use_container_width=True
+        )
+
+        if st.button("💾 저장", type="primary"):
+            to_save = edited_df[edited_df['Content'].str.strip() != ""].copy()
+            if not to_save.empty:
+                to_save['Week_Start'] = week_str
+                to_save['Assignee'] = me
+                if 'Project' in to_save.columns: to_save['Project'] = to_save['Project'].fillna("-")
+                if 'Status' in to_save.columns: to_save['Status'] = to_save['Status'].fillna("정상")
+
+                with st.spinner("저장 중..."):
+                    if save_weekly_report_entry(to_save):
+                        st.toast("저장되었습니다!", icon="✅")
+                        safe_rerun()
+            else:
+                st.warning("내용을 입력해주세요.")
+    else:
+        st.info("작성자를 먼저 선택해주세요.")
+
+# --- TAB 3: 검색 ---
+with tab_search:
+    query = st.text_input("검색어", key="search_query", placeholder="업무 내용/프로젝트명 (여러 단어는 모두 포함하는 보고서만)")
+    people = sorted(st.session_state.promotions['담당자'].astype(str).unique()) if '담당자' in st.session_state.promotions.columns else []
+    c_who, c_from, c_to = st.columns([2, 1, 1])
+    search_people = c_who.multiselect("담당자", people, key="search_assignees")
+    search_from, _ = get_week_range(c_from.date_input("시작 주", start_week - datetime.timedelta(weeks=26), key="search_from"))
+    search_to, _ = get_week_range(c_to.date_input("끝 주", start_week, key="search_to"))
+    c_type, c_status = st.columns(2)
+    search_types = c_type.multiselect("구분", REPORT_TYPES, key="search_types")
+    search_statuses = c_status.multiselect("상태", REPORT_STATUSES, key="search_statuses")
+
+    if query.strip() or search_people or search_types or search_statuses:
+        started = time.perf_counter()
+        with st.spinner("검색 색인 준비 중..."), perf.span("weekly.search"):
+            results = search_weekly_reports(
+                query, assignees=search_people, week_from=str(search_from), week_to=str(search_to),
+                types=search_types, statuses=search_statuses,
+            )
+        total = results.attrs.get("total", len(results))
+        st.caption(f"{total}건 중 {len(results)}건 표시 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        if not results.empty:
+            st.dataframe(
+                results,
+                column_config={
+                    "Week_Start": st.column_config.TextColumn("주차", width="small"),
+                    "Assignee": st.column_config.TextColumn("담당자", width="small"),
+                    "Type": st.column_config.TextColumn("구분", width="small"),
+                    "Content": st.column_config.TextColumn("업무 내용", width="large"),
+                    "Status": st.column_config.TextColumn("상태", width="small"),
+                },
+                use_container_width=True, hide_index=True
+            )
+    else:
+        st.info("검색어를 입력하거나 담당자/구분/상태를 선택해주세요.")
@@ -0,0 +1,420 @@
+import io
+import json
+import threading
+import time
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+import local_db
+from background import BackgroundWorker
+from frame_diff import diff_frames
+from rollups import get_rollups
+from settings import (
+    FLUSH_MAX_BACKOFF_SECONDS, FLUSH_SECONDS, WRITE_QUEUE_KEEP_SECONDS, WRITE_QUEUE_PATH,
+)
+from sheet_rows import ConcurrentModificationError, to_sheet_values
+from storage import ArchivedPartitionError, MissingArchiveError, get_storage, prepare_promotions, prepare_reports
+
+PENDING, FLUSHED, FAILED = "pending", "flushed", "failed"
+STATUS_LABELS = {PENDING: "⏳ 반영 대기", FLUSHED: "✅ 반영 완료", FAILED: "⚠️ 반영 실패"}
+PROMOTIONS_KEY = "promotions"
+
+# ---------------------------------------------------------
+# 저장 대기열 (로컬 SQLite 저널 + 백그라운드 반영)
+# ---------------------------------------------------------
+class WriteQueue(BackgroundWorker):
+    """저장 요청을 로컬 저널(SQLite WAL)에 먼저 기록하고 바로 응답, 저장소 반영은 백그라운드에서
+
+    - 같은 보고서(Week_Start, Assignee)나 프로모션의 대기 중인 저장은 하나로 합침 (revision 증가)
+    - 반영 중에 같은 항목이 다시 저장되면 반영 후에도 대기 상태로 남아 다음 차례에 새 내용을 반영
+    - 실패하면 그 항목만 interval, 2배, 4배... 최대 max_backoff까지 간격을 늘려 재시도 (내용은 저널에 남음)
+      나머지 항목은 계속 반영하고, 시도한 항목이 모두 실패했을 때만 작업 스레드 전체의 간격을 늘림
+    - 프로모션은 응답 전에 base가 지금 데이터와 같은지 확인 (다르면 바로 충돌), 반영 시 원격과 다시 확인
+    - 충돌/보관 분기처럼 재시도해도 안 되는 실패는 failed로 표시 (관리자 화면이 저장한 변경을 되살림)
+      저장 시 미리 반영한 대시보드 집계와 검색 색인은 on_failed로 저장소 기준으로 다시 맞춤
+    - 반영 전까지 조회 결과에 대기 중인 내용을 덧씌워 저장한 사람이 바로 볼 수 있게 함
+    """
+
+    thread_name = "promo-write-flusher"
+
+    def __init__(self, path=WRITE_QUEUE_PATH, storage=get_storage, interval=FLUSH_SECONDS,
+                 max_backoff=FLUSH_MAX_BACKOFF_SECONDS, on_failed=None):
+        super().__init__(interval, max_backoff)
+        self.path = path
+        self._storage = storage
+        self.on_failed = on_failed  # on_failed(storage, entry): failed로 표시된 항목마다
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}  # (kind, key) → 대기 항목 (조회 덧씌우기용)
+        self._latest = {}   # (kind, key) → 마지막 항목의 상태
+        self._retry = {}    # (kind, key) → (연속 실패 수, 다음 시도 시각), 일시적 실패 중인 항목만
+        self._done = {}     # (kind, key) → 대기 항목을 끝낸(반영/실패) 횟수, 잠금 밖에서 확인한 스냅샷이 그대로인지 비교용
+        local_db.ensure_dir(path)
+        self._init_schema()
+        self._recover()
+
+    @property
+    def storage(self):
+        return self._storage()
+
+    def _connect(self):
+        return local_db.connect(self.path, synchronous="FULL")  # 응답한 저장은 전원이 꺼져도 남도록
+
+    def _init_schema(self):
+        with closing(self._connect()) as con, con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS writes (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, "
+                "key TEXT NOT NULL, payload TEXT NOT NULL, revision INTEGER NOT NULL DEFAULT 1, status TEXT NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT, created_at REAL, updated_at REAL, flushed_at REAL)"
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS ix_writes_status ON writes (status, kind, key)")
+
+    def _recover(self):
+        """지난 실행에서 반영하지 못한 항목과 항목별 마지막 상태를 불러옴"""
+        with closing(self._connect()) as con:
+            rows = con.execute(
+                "SELECT id, kind, key, payload, revision, status, attempts, last_error, created_at, updated_at, flushed_at "
+                "FROM writes WHERE id IN (SELECT MAX(id) FROM writes GROUP BY kind, key)"
+            ).fetchall()
+        for row in rows:
+            entry = _Entry(*row[:5])
+            ident = (entry.kind, entry.key)
+            self._latest[ident] = _status(*row)
+            if row[5] == PENDING:
+                self._pending[ident] = entry
+
+    # 저장 요청
+    def enqueue_report(self, key, df):
+        """주간 보고 한 건(Week_Start, Assignee) 저장 요청, 항목 id 반환"""
+        key = json.dumps([str(key[0]), str(key[1])], ensure_ascii=False)
+        payload = {"df": _to_json(df.reset_index(drop=True))}
+        return self._enqueue("report", key, payload, lambda entry: payload)
+
+    def enqueue_promotions(self, base, frame):
+        """프로모션 저장 요청 (base 스냅샷 대비 frame), 항목 id 반환
+
+        base는 지금 데이터(대기 중인 저장이 있으면 그 결과, 없으면 저장소 스냅샷)와 같아야 하고
+        다르면 저널에 남기지 않고 ConcurrentModificationError. 대기 중인 저장이 있으면 두 변경을 합쳐 하나로 반영
+        """
+        def check():
+            if not _same_snapshot(self.storage.read_promotions(), base):
+                raise ConcurrentModificationError("편집을 시작한 뒤 프로모션 데이터가 변경되었습니다.")
+
+        def merge(entry):
+            base1, frame1 = entry.frames()
+            if not _same_snapshot(entry.view(), base):
+                raise ConcurrentModificationError("반영 대기 중인 다른 프로모션 저장과 충돌합니다.")
+            return {"base": _to_json(base1), "frame": _to_json(_relabel(base1, frame1, frame))}
+
+        payload = {"base": _to_json(base), "frame": _to_json(frame)}
+        return self._enqueue("promotions", PROMOTIONS_KEY, payload, merge, check)
+
+    def _enqueue(self, kind, key, payload, merge, check=None):
+        """check: 대기 항목이 없을 때 저장소 스냅샷과 비교 (저장소 조회는 잠금 밖에서)
+
+        확인한 뒤 잠금을 잡기 전에 대기 항목이 반영되어 저장소가 바뀌었으면 다시 확인
+        """
+        ident = (kind, key)
+        while True:
+            done = self._done.get(ident, 0)
+            if check is not None and ident not in self._pending:
+                check()
+            entry_id = self._try_enqueue(ident, payload, merge, None if check is None else done)
+            if entry_id is not None:
+                break
+        self.start()
+        self.wake()
+        return entry_id
+
+    def _try_enqueue(self, ident, payload, merge, checked_at):
+        """저널에 기록하고 항목 id 반환, checked_at(끝낸 횟수) 이후 저장소가 바뀌었으면 None"""
+        kind, key = ident
+        now = time.time()
+        with self._lock, closing(self._connect()) as con, con:
+            entry = self._pending.get(ident)
+            if entry is None and checked_at is not None and self._done.get(ident, 0) != checked_at:
+                return None
+            con.execute("BEGIN IMMEDIATE")
+            if entry is not None:
+                payload = merge(entry)
+                text = json.dumps(payload, ensure_ascii=False)
+                con.execute("UPDATE writes SET payload = ?, revision = revision + 1, updated_at = ? WHERE id = ?",
+                            (text, now, entry.id))
+                entry = _Entry(entry.id, kind, key, text, entry.revision + 1)
+            else:
+                text = json.dumps(payload, ensure_ascii=False)
+                cur = con.execute(
+                    "INSERT INTO writes (kind, key, payload, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (kind, key, text, PENDING, now, now),
+                )
+                entry = _Entry(cur.lastrowid, kind, key, text, 1)
+            self._pending[ident] = entry
+            self._retry.pop(ident, None)  # 새 내용은 바로 시도
+            self._latest[ident] = {"id": entry.id, "status": PENDING, "attempts": 0, "last_error": None,
+                                   "updated_at": now, "flushed_at": None}
+        return entry.id
+
+    # 조회 (대기 중인 내용 덧씌우기)
+    def overlay_reports(self, df, match):
+        """match((week_start, assignee))가 참인 대기 보고서로 해당 key의 행을 교체"""
+        pending = [e for (kind, _), e in list(self._pending.items()) if kind == "report" and match(tuple(json.loads(e.key)))]
+        if not pending:
+            return df
+        keys = {tuple(json.loads(e.key)) for e in pending}
+        frames = [e.frames()[0] for e in pending]
+        if not df.empty:
+            current = zip(df['Week_Start'].astype(str), df['Assignee'].astype(str))
+            frames.insert(0, df[np.array([k not in keys for k in current], dtype=bool)])
+        frames = [f.astype(object) for f in frames if len(f)]
+        if not frames:
+            return prepare_reports(pd.DataFrame(columns=df.columns))
+        return prepare_reports(pd.concat(frames, ignore_index=True))
+
+    def overlay_promotions(self, df):
+        entry = self._pending.get(("promotions", PROMOTIONS_KEY))
+        return df if entry is None else entry.view()
+
+    def status(self, kind, key):
+        """항목의 마지막 상태 (status/attempts/last_error/updated_at/flushed_at), 없으면 None"""
+        if kind == "report":
+            key = json.dumps([str(key[0]), str(key[1])], ensure_ascii=False)
+        return self._latest.get((kind, key))
+
+    def entry_status(self, entry_id):
+        """항목 id의 상태 (그 뒤에 같은 대상의 다른 항목이 생겼어도), 없으면 None"""
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT status, attempts, last_error, updated_at, flushed_at FROM writes WHERE id = ?",
+                              (entry_id,)).fetchone()
+        if row is None:
+            return None
+        return {"id": entry_id, **dict(zip(("status", "attempts", "last_error", "updated_at", "flushed_at"), row))}
+
+    def pending_count(self):
+        return len(self._pending)
+
+    def entries(self, limit=50):
+        """최근 항목 목록 (관리자 화면용)"""
+        with closing(self._connect()) as con:
+            df = pd.read_sql_query(
+                "SELECT id, kind, key, revision, status, attempts, last_error, updated_at, flushed_at "
+                "FROM writes ORDER BY id DESC LIMIT ?", con, params=[limit],
+            )
+        for col in ("updated_at", "flushed_at"):
+            df[col] = df[col].map(lambda t: time.strftime("%m-%d %H:%M:%S", time.localtime(t)) if pd.notna(t) else "")
+        df["status"] = df["status"].map(STATUS_LABELS).fillna(df["status"])
+        return df
+
+    # 반영
+    def flush(self):
+        """다시 시도할 때가 된 대기 항목을 순서대로 저장소에 반영하고 반영한 수 반환
+
+        일시적 실패는 그 항목만 미루고 다음 항목을 계속 반영. 시도한 항목이 모두 일시적으로 실패했으면
+        (요청 한도 초과 등 저장소 쪽 문제일 가능성) 마지막 예외를 다시 던져 작업 스레드의 간격을 늘림
+        """
+        with self._flush_lock:
+            flushed, error = 0, None
+            now = time.time()
+            for entry in sorted(self._pending.values(), key=lambda e: e.id):
+                if self._retry.get((entry.kind, entry.key), (0, 0))[1] > now:
+                    continue
+                try:
+                    result = self._apply(entry)
+                except Exception as e:
+                    if _permanent(entry, e):
+                        if self._finish(entry, FAILED, e):
+                            self._notify_failed(entry)
+                        continue
+                    self._record_failure(entry, e)
+                    error = e
+                    continue
+                self._finish(entry, FLUSHED, rebase=result)
+                flushed += 1
+            self._prune()
+            if error is not None and not flushed:
+                raise error
+            return flushed
+
+    def _apply(self, entry):
+        if entry.kind == "report":
+            df = entry.frames()[0]
+            key = tuple(json.loads(entry.key))
+            self.storage.upsert_reports(key, df)
+            return None
+        base, frame = entry.frames()
+        self.storage.apply_promotions_diff(base, diff_frames(base, frame), frame)
+        return frame
+
+    def _finish(self, entry, status, error=None, rebase=None):
+        """항목의 반영 결과 기록 (반영하는 동안 다시 저장되어 대기 상태로 남았으면 False)"""
+        now = time.time()
+        ident = (entry.kind, entry.key)
+        with self._lock, closing(self._connect()) as con, con:
+            current = self._pending.get(ident)
+            if current is not None and current.revision != entry.revision:
+                # 반영하는 동안 다시 저장됨: 새 내용은 대기 상태로 두고, 프로모션은 방금 반영한 결과를 새 base로
+                if rebase is not None:
+                    payload = json.loads(current.payload)
+                    payload["base"] = _to_json(rebase)
+                    text = json.dumps(payload, ensure_ascii=False)
+                    con.execute("UPDATE writes SET payload = ? WHERE id = ?", (text, entry.id))
+                    self._pending[ident] = _Entry(entry.id, entry.kind, entry.key, text, current.revision)
+                return False
+            con.execute(
+                "UPDATE writes SET status = ?, last_error = ?, attempts = attempts + 1, updated_at = ?, flushed_at = ? WHERE id = ?",
+                (status, None if error is None else str(error), now, now if status == FLUSHED else None, entry.id),
+            )
+            self._pending.pop(ident, None)
+            self._retry.pop(ident, None)
+            self._done[ident] = self._done.get(ident, 0) + 1
+            previous = self._latest.get(ident, {})
+            self._latest[ident] = {"id": entry.id, "status": status, "attempts": previous.get("attempts", 0) + 1,
+                                   "last_error": None if error is None else str(error),
+                                   "updated_at": now, "flushed_at": now if status == FLUSHED else None}
+        return True
+
+    def _notify_failed(self, entry):
+        if self.on_failed is None:
+            return
+        try:
+            self.on_failed(self.storage, entry)
+        except Exception:
+            pass  # 집계는 다음 대시보드 조회나 '집계 다시 만들기'로 맞춤
+
+    def _record_failure(self, entry, error):
+        """일시적 실패 기록, 이 항목의 다음 시도는 연속 실패 수만큼 늘린 간격 뒤로"""
+        now = time.time()
+        ident = (entry.kind, entry.key)
+        with self._lock, closing(self._connect()) as con, con:
+            con.execute("UPDATE writes SET attempts = attempts + 1, last_error = ?, updated_at = ? WHERE id = ?",
+                        (str(error), now, entry.id))
+            current = self._pending.get(ident)
+            if current is not None and current.revision == entry.revision:  # 그 사이 다시 저장됐으면 새 내용은 바로 시도
+                failures = self._retry.get(ident, (0, 0))[0] + 1
+                self._retry[ident] = (failures, now + self.backoff(failures))
+            latest = self._latest.get(ident)
+            if latest is not None and latest["id"] == entry.id:
+                latest.update(attempts=latest["attempts"] + 1, last_error=str(error), updated_at=now)
+
+    def _prune(self):
+        """반영이 끝난 지 오래된 항목 삭제 (항목별 마지막 기록은 남김)"""
+        cutoff = time.time() - WRITE_QUEUE_KEEP_SECONDS
+        with self._lock, closing(self._connect()) as con, con:
+            con.execute(
+                "DELETE FROM writes WHERE status != ? AND updated_at < ? "
+                "AND id NOT IN (SELECT MAX(id) FROM writes GROUP BY kind, key)", (PENDING, cutoff),
+            )
+
+    # 백그라운드 반영
+    def stats(self):
+        return {**super().stats(), "pending": len(self._pending), "retrying": len(self._retry)}
+
+    def _wait(self):
+        while not self._pending:
+            self._wake.wait()  # 새 저장 요청까지 대기
+            self._wake.clear()
+            if self._stop.is_set():
+                return False
+        # interval(실패 중이면 늘어난 간격) 동안 들어온 저장을 모아서 한 번에 반영
+        return not self._stop.wait(self.next_delay())
+
+    def _step(self):
+        self.flush()
+
+
+class _Entry:
+    __slots__ = ("id", "kind", "key", "payload", "revision", "_frames", "_view")
+
+    def __init__(self, id, kind, key, payload, revision):
+        self.id = id
+        self.kind = kind
+        self.key = key
+        self.payload = payload
+        self.revision = revision
+        self._frames = None
+        self._view = None
+
+    def frames(self):
+        """보고서: (df,), 프로모션: (base, frame)"""
+        if self._frames is None:
+            payload = json.loads(self.payload)
+            if self.kind == "report":
+                self._frames = (prepare_reports(_from_json(payload["df"])),)
+            else:
+                self._frames = (prepare_promotions(_from_json(payload["base"])), prepare_promotions(_from_json(payload["frame"])))
+        return self._frames
+
+    def view(self):
+        """조회에 덧씌울 프로모션 (저장 후 다시 읽은 것처럼 위치 라벨, 재실행마다 같은 객체)"""
+        if self._view is None:
+            self._view = self.frames()[1].reset_index(drop=True)
+        return self._view
+
+
+def resync_derived(storage, entry):
+    """반영에 실패한 저장이 미리 반영해 둔 대시보드 집계와 검색 색인을 저장소의 현재 데이터 기준으로 다시 맞춤"""
+    if entry.kind == "report":
+        from report_search import get_report_search  # report_search가 이 모듈을 씀 (순환 import 방지)
+        key = tuple(json.loads(entry.key))
+        rows = storage.read_reports(week_start=key[0], assignee=key[1])
+        get_report_search().update(key, rows)
+        get_rollups().apply_report(key, rows)
+    else:
+        get_rollups().snapshot_promotions(storage.read_promotions())
+
+
+def _permanent(entry, error):
+    """다시 시도해도 같은 결과인 실패 (보관된 분기, 프로모션 스냅샷 충돌), 그 외는 모두 다시 시도"""
+    if isinstance(error, (ArchivedPartitionError, MissingArchiveError)):
+        return True
+    return entry.kind == "promotions" and isinstance(error, ConcurrentModificationError)
+
+
+def _same_snapshot(current, base):
+    """base가 current와 같은 데이터인지 (공유 스냅샷 그대로면 비교 생략, 저장소가 비어 있으면 첫 저장이라 통과)"""
+    return current is base or current.empty or diff_frames(current, base).empty
+
+
+def _status(id, kind, key, payload, revision, status, attempts, last_error, created_at, updated_at, flushed_at):
+    return {"id": id, "status": status, "attempts": attempts, "last_error": last_error,
+            "updated_at": updated_at, "flushed_at": flushed_at}
+
+
+def _to_json(df):
+    """행 라벨을 유지한 채 시트 값(날짜는 'YYYY-MM-DD', 결측은 빈 칸)으로 직렬화"""
+    values = pd.DataFrame(to_sheet_values(df), columns=df.columns, index=df.index)
+    return values.to_json(orient="split", force_ascii=False)
+
+
+def _from_json(text):
+    df = pd.read_json(io.StringIO(text), orient="split", dtype=False, convert_dates=False)
+    return df.mask(df.astype(object) == "")
+
+
+def _relabel(base1, frame1, frame2):
+    """frame2의 라벨(frame1 위치 기준)을 base1 라벨 기준으로 바꿈 (새 행은 기존 라벨 다음 번호)"""
+    n = len(frame1)
+    labels = frame2.index.to_numpy(dtype=np.int64)
+    old = labels < n
+    start = max([int(ix.max()) + 1 for ix in (base1.index, frame1.index) if len(ix)] or [0])
+    mapped = np.empty(len(labels), dtype=np.int64)
+    mapped[old] = frame1.index.to_numpy(dtype=np.int64)[labels[old]]
+    mapped[~old] = np.arange(start, start + int((~old).sum()))
+    return frame2.set_axis(mapped)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """프로세스 전체에서 하나인 저장 대기열 (지난 실행에서 남은 항목이 있으면 바로 반영 시작)"""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = WriteQueue(on_failed=resync_derived)
+                if _queue.pending_count():
+                    _queue.start()
+    return _queue